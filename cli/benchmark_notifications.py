@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+#----------------------------------------------------------------------
+# Notification Center Benchmark
+#
+# Generates synthetic notification logs (with real PNG icons) and measures
+# how the viewer scales: parse throughput, index build, time to first
+# paint, scroll frame times and peak memory. Runs headless on the
+# offscreen Qt platform; every log size is measured in a fresh process so
+# the peak RSS figures do not leak into each other.
+#----------------------------------------------------------------------
+import sys
+import os
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import resource
+import statistics
+import subprocess
+
+# Add the script's directory to the Python path to find submodules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+ICON_COUNT = 24
+ICON_SIZE = 256
+SCROLL_STEPS = 200
+
+APP_NAMES = [
+    "Discord", "Firefox", "kitty", "Steam", "Spotify", "Thunderbird",
+    "Telegram", "notify-send", "NetworkManager", "Blueman", "Hyprland",
+]
+WORDS = (
+    "update download friend online message hello world build finished failed "
+    "battery low connected disconnected track playing new mail from meeting "
+    "starts in minutes screenshot saved copied clipboard volume brightness"
+).split()
+
+
+# -------------------------------------------------------
+# Synthetic Data
+# -------------------------------------------------------
+def generate_icons(icon_dir):
+    """Writes ICON_COUNT full-size PNGs so the icon path decodes and scales for real."""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QImage, QPainter, QColor, QLinearGradient
+
+    os.makedirs(icon_dir, exist_ok=True)
+    paths = []
+    for i in range(ICON_COUNT):
+        path = os.path.join(icon_dir, f"icon-{i}.png")
+        if not os.path.exists(path):
+            image = QImage(ICON_SIZE, ICON_SIZE, QImage.Format.Format_ARGB32)
+            image.fill(Qt.GlobalColor.transparent)
+            gradient = QLinearGradient(0, 0, ICON_SIZE, ICON_SIZE)
+            gradient.setColorAt(0, QColor.fromHsv(i * 360 // ICON_COUNT, 200, 230))
+            gradient.setColorAt(1, QColor.fromHsv((i * 97) % 360, 160, 120))
+            painter = QPainter(image)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setBrush(gradient)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(0, 0, ICON_SIZE, ICON_SIZE, 48, 48)
+            painter.end()
+            image.save(path, "PNG")
+        paths.append(path)
+    # A few records point at icons that no longer exist, as real logs do.
+    paths.append(os.path.join(icon_dir, "missing.png"))
+    return paths
+
+
+def generate_log(log_path, count, icon_paths, seed=0):
+    """Writes count notifications in time order, roughly one a minute up to now."""
+    rng = random.Random(seed)
+    now_ms = int(time.time() * 1000)
+    time_ms = now_ms - count * 60_000
+    with open(log_path, "w", encoding="utf-8") as f:
+        lines = []
+        for _ in range(count):
+            time_ms += rng.randint(1_000, 119_000)
+            notif = {
+                "time": time_ms,
+                "appName": rng.choice(APP_NAMES),
+                "summary": " ".join(rng.choices(WORDS, k=rng.randint(2, 6))).capitalize(),
+                "body": " ".join(rng.choices(WORDS, k=rng.randint(0, 40))),
+                "appIcon": rng.choice(icon_paths) if rng.random() < 0.8 else "",
+            }
+            if rng.random() < 0.05:
+                notif["body"] = f"<b>{notif['body']}</b>"
+            lines.append(json.dumps(notif))
+            if len(lines) >= 10_000:
+                f.write("\n".join(lines) + "\n")
+                lines = []
+        if lines:
+            f.write("\n".join(lines) + "\n")
+
+
+# -------------------------------------------------------
+# Measurements (run in a child process per log size)
+# -------------------------------------------------------
+def peak_rss_mb():
+    # ru_maxrss is reported in KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure_viewer(app, log_path):
+    """Opens a window on log_path and returns first-paint and scroll timings in ms."""
+    from PyQt6.QtCore import QObject, QEvent, QTimer, QEventLoop
+    from notification import NotificationWindow
+
+    win = NotificationWindow()
+    win.resize(520, 720)
+    first_paint = {}
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, obj, event):
+            if (
+                event.type() == QEvent.Type.Paint
+                and "ms" not in first_paint
+                and win.model.rowCount() > 0
+            ):
+                # Fires right after this paint event has been delivered.
+                QTimer.singleShot(0, lambda: first_paint.setdefault("ms", elapsed()))
+            return False
+
+    watcher = PaintWatcher()
+    win.list_view.viewport().installEventFilter(watcher)
+    start = time.perf_counter()
+
+    def elapsed():
+        return (time.perf_counter() - start) * 1000
+
+    win.show()
+    win.load_log_data(log_path)
+    deadline = time.perf_counter() + 60
+    while "ms" not in first_paint and time.perf_counter() < deadline:
+        app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 10)
+
+    # Scroll one row-and-a-half per frame, letting fetched batches arrive in between.
+    scrollbar = win.list_view.verticalScrollBar()
+    step = win.list_view.itemDelegate().row_height * 3 // 2
+    frame_times = []
+    for _ in range(SCROLL_STEPS):
+        frame_start = time.perf_counter()
+        scrollbar.setValue(scrollbar.value() + step)
+        app.processEvents()
+        win.list_view.viewport().repaint()
+        frame_times.append((time.perf_counter() - frame_start) * 1000)
+
+    rows_loaded = win.model.rowCount()
+    win.close()
+    win.deleteLater()
+    app.processEvents()
+    frame_times.sort()
+    return {
+        "first_paint_ms": first_paint.get("ms"),
+        "scroll_median_ms": statistics.median(frame_times),
+        "scroll_p95_ms": frame_times[int(len(frame_times) * 0.95) - 1],
+        "scroll_max_ms": frame_times[-1],
+        "rows_loaded": rows_loaded,
+    }
+
+
+def run_one(log_path, thumbnail_dir):
+    """Measures one log and returns the results as a dict."""
+    from PyQt6.QtWidgets import QApplication
+    from notification_components.icon_cache import IconCache
+    from notification_components.log_index import LogIndex
+    from notification_components.log_reader import parse_log_file
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    IconCache.instance().thumbnail_dir = thumbnail_dir
+    results = {"size_mb": os.path.getsize(log_path) / (1024 * 1024)}
+
+    for suffix in (".idx", ".idx.apps"):
+        if os.path.exists(log_path + suffix):
+            os.remove(log_path + suffix)
+
+    cold = measure_viewer(app, log_path)
+    warm = measure_viewer(app, log_path)
+    results["first_paint_cold_ms"] = cold["first_paint_ms"]
+    results["first_paint_warm_ms"] = warm["first_paint_ms"]
+    for key in ("scroll_median_ms", "scroll_p95_ms", "scroll_max_ms", "rows_loaded"):
+        results[key] = warm[key]
+    results["viewer_peak_rss_mb"] = peak_rss_mb()
+
+    for suffix in (".idx", ".idx.apps"):
+        if os.path.exists(log_path + suffix):
+            os.remove(log_path + suffix)
+    start = time.perf_counter()
+    log_index = LogIndex(log_path)
+    log_index.refresh()
+    results["index_build_ms"] = (time.perf_counter() - start) * 1000
+    log_index.close()
+
+    # Full parse last: it holds the whole history in memory and dominates peak RSS.
+    start = time.perf_counter()
+    notifications = parse_log_file(log_path)
+    seconds = time.perf_counter() - start
+    results["lines"] = len(notifications)
+    results["parse_lines_per_s"] = len(notifications) / seconds
+    results["parse_mb_per_s"] = results["size_mb"] / seconds
+    results["total_peak_rss_mb"] = peak_rss_mb()
+    return results
+
+
+# -------------------------------------------------------
+# Reporting
+# -------------------------------------------------------
+COLUMNS = [
+    ("lines", "Lines", "{:,.0f}"),
+    ("size_mb", "Size MB", "{:.1f}"),
+    ("parse_lines_per_s", "Parse lines/s", "{:,.0f}"),
+    ("parse_mb_per_s", "Parse MB/s", "{:.1f}"),
+    ("index_build_ms", "Index ms", "{:.0f}"),
+    ("first_paint_cold_ms", "Paint cold ms", "{:.0f}"),
+    ("first_paint_warm_ms", "Paint warm ms", "{:.0f}"),
+    ("scroll_median_ms", "Scroll p50 ms", "{:.2f}"),
+    ("scroll_p95_ms", "Scroll p95 ms", "{:.2f}"),
+    ("scroll_max_ms", "Scroll max ms", "{:.2f}"),
+    ("viewer_peak_rss_mb", "Viewer RSS MB", "{:.0f}"),
+    ("total_peak_rss_mb", "Peak RSS MB", "{:.0f}"),
+]
+
+
+def format_value(template, value):
+    return "n/a" if value is None else template.format(value)
+
+
+def print_table(rows):
+    header = [title for _key, title, _template in COLUMNS]
+    cells = [
+        [format_value(template, row.get(key)) for key, _title, template in COLUMNS]
+        for row in rows
+    ]
+    widths = [max(len(c) for c in column) for column in zip(header, *cells)]
+    print("  ".join(h.rjust(w) for h, w in zip(header, widths)))
+    for line in cells:
+        print("  ".join(c.rjust(w) for c, w in zip(line, widths)))
+
+
+def parse_sizes(value):
+    try:
+        return [int(size.replace("_", "")) for size in value.split(",") if size]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size list: '{value}'")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Notification Center.")
+    parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default=DEFAULT_SIZES,
+        help="comma separated log sizes in lines (default: 1000,10000,100000,1000000)",
+    )
+    parser.add_argument(
+        "--work-dir", help="where logs and icons are generated (default: a temporary dir)"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print the results as JSON instead of a table"
+    )
+    parser.add_argument("--run-one", metavar="LOG", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="notification-bench-")
+    thumbnail_dir = os.path.join(work_dir, "thumbnails")
+
+    if args.run_one:
+        json.dump(run_one(args.run_one, thumbnail_dir), sys.stdout)
+        return
+
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv[:1])  # noqa: F841 - needed to paint the icons
+    try:
+        icon_paths = generate_icons(os.path.join(work_dir, "icons"))
+        rows = []
+        for size in args.sizes:
+            log_path = os.path.join(work_dir, f"notifications-{size}.jsonl")
+            if not os.path.exists(log_path):
+                print(f"Generating {size:,} notifications...", file=sys.stderr)
+                generate_log(log_path, size, icon_paths)
+            shutil.rmtree(thumbnail_dir, ignore_errors=True)
+            print(f"Measuring {size:,} notifications...", file=sys.stderr)
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    os.path.abspath(__file__),
+                    "--work-dir", work_dir,
+                    "--run-one", log_path,
+                ],
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            if result.returncode != 0:
+                print(f"Error: Benchmark failed for {size:,} lines.", file=sys.stderr)
+                sys.exit(1)
+            rows.append(json.loads(result.stdout))
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+#----------------------------------------------------------------------
+# Notification Log Compactor
+#
+# Drops corrupt and duplicate lines from the quickshell notification log,
+# enforces retention and optionally rotates old records into gzip archives
+# that the Notification Center still reads.
+#----------------------------------------------------------------------
+import sys
+import os
+import argparse
+
+# Add the script's directory to the Python path to find submodules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from notification_components.log_maintenance import compact_log
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact the notification log.")
+    parser.add_argument("log_path", help="quickshell notification log (JSONL)")
+    parser.add_argument(
+        "--max-age", type=float, metavar="DAYS", help="drop records older than DAYS"
+    )
+    parser.add_argument(
+        "--max-count", type=int, metavar="N", help="keep only the newest N records"
+    )
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="move dropped records into <log>.<timestamp>.gz instead of deleting them",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="report what would change without writing"
+    )
+    args = parser.parse_args()
+
+    if not os.path.exists(args.log_path):
+        print(f"Error: Log file not found at '{args.log_path}'", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        stats = compact_log(
+            args.log_path,
+            max_age_days=args.max_age,
+            max_count=args.max_count,
+            archive=args.archive,
+            dry_run=args.dry_run,
+        )
+    except OSError as e:
+        print(f"Error: Failed to compact '{args.log_path}': {e}", file=sys.stderr)
+        sys.exit(1)
+
+    prefix = "Would drop" if args.dry_run else "Dropped"
+    print(
+        f"{prefix} {stats['corrupt']} corrupt, {stats['duplicates']} duplicate and "
+        f"{stats['expired']} expired records; {stats['kept']} kept."
+    )
+    if stats["archive"]:
+        print(f"Archived expired records to '{stats['archive']}'.")
+
+
+if __name__ == "__main__":
+    main()
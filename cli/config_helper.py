@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+#----------------------------------------------------------------------
+# Config Helper
+#
+# JSON work for load_configs.sh without a jq process per value:
+#   values       prints every top-level key of config.json as shell
+#                assignments into the CONFIG_VALUES associative array
+#   merge-colors deep-merges the repo theme into quickshell's colors.json
+#----------------------------------------------------------------------
+import sys
+import os
+import json
+import shlex
+import argparse
+import tempfile
+
+
+def load_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json_atomic(path, data):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".colors-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def shell_value(value):
+    """A JSON value as `jq -r` would print it."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def deep_merge(base, override):
+    """Recursive object merge, same as jq's `base * override`."""
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def first_object(data):
+    """Colors files are sometimes wrapped in a one-element array."""
+    return data[0] if isinstance(data, list) and data else data
+
+
+# -------------------------------------------------------
+# Commands
+# -------------------------------------------------------
+def print_values(config_path):
+    try:
+        config = load_json(config_path)
+    except (OSError, ValueError) as e:
+        print(f"Error: Could not read '{config_path}': {e}", file=sys.stderr)
+        return 1
+    if not isinstance(config, dict):
+        print(f"Error: '{config_path}' is not a JSON object", file=sys.stderr)
+        return 1
+    for key, value in config.items():
+        if value is None:
+            continue
+        print(f"CONFIG_VALUES[{shlex.quote(key)}]={shlex.quote(shell_value(value))}")
+    return 0
+
+
+def merge_colors(system_path, theme_path):
+    try:
+        theme = first_object(load_json(theme_path))
+    except (OSError, ValueError) as e:
+        print(f"Error: Could not read theme '{theme_path}': {e}", file=sys.stderr)
+        return 1
+
+    if not os.path.exists(system_path):
+        print("[INFO] No existing colors.json found. Copying from repo.", file=sys.stderr)
+        merged = theme
+    else:
+        try:
+            system = load_json(system_path)
+        except (OSError, ValueError) as e:
+            print(f"Error: Could not read '{system_path}': {e}. Skipping merge.", file=sys.stderr)
+            return 1
+        was_array = isinstance(system, list)
+        if was_array:
+            print("[WARN] System colors.json is an array. Fixing by extracting first element.", file=sys.stderr)
+            system = first_object(system)
+        if not (isinstance(system, dict) and isinstance(theme, dict)):
+            print("Error: colors.json and the theme must both be JSON objects. Skipping merge.", file=sys.stderr)
+            return 1
+        merged = deep_merge(system, theme)
+        if merged == system and not was_array:
+            print("[INFO] colors.json already matches the theme.", file=sys.stderr)
+            return 0
+
+    try:
+        write_json_atomic(system_path, merged)
+    except OSError as e:
+        print(f"Error: Could not write '{system_path}': {e}", file=sys.stderr)
+        return 1
+    print("[SUCCESS] Successfully merged colors.json.", file=sys.stderr)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Config and theme helper for load_configs.sh.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    values = commands.add_parser("values", help="print config.json keys as shell assignments")
+    values.add_argument("config_path")
+    merge = commands.add_parser("merge-colors", help="merge a theme into quickshell's colors.json")
+    merge.add_argument("system_path", help="quickshell colors.json to update")
+    merge.add_argument("theme_path", help="theme JSON (an object or a one-element array)")
+    args = parser.parse_args()
+
+    if args.command == "values":
+        sys.exit(print_values(args.config_path))
+    sys.exit(merge_colors(args.system_path, args.theme_path))
+
+
+if __name__ == "__main__":
+    main()
@@ -36,97 +36,32 @@ fi
 source "$CURRENT_SCRIPT_DIR/load_helpers.sh"
 
 #-------------------------------------------------------
-# Load Configurations from a Source Directory
+# Load Configurations from Layered Source Directories
 #-------------------------------------------------------
-load_configs_from_source() {
-    local source_dir=$1
-    local label_suffix=$2 # e.g., " (custom)"
-
-    if [ ! -d "$source_dir" ]; then
-        # Don't log if it's the custom dir and it doesn't exist, as this is an expected scenario.
-        if [[ ! "$label_suffix" == *"custom"* ]]; then
-             _log WARN "Configuration source directory not found at '$source_dir'. Skipping."
+# Takes dots sources in overlay order (later ones win), e.g. base then pc.
+load_configs_from_layers() {
+    local source_dirs=()
+    local source_dir
+    for source_dir in "$@"; do
+        if [ -d "$source_dir" ]; then
+            source_dirs+=("$source_dir")
+        else
+            _log WARN "Configuration source directory not found at '$source_dir'. Skipping."
         fi
+    done
+    if [ ${#source_dirs[@]} -eq 0 ]; then
         return
     fi
 
     echo "============================================================"
-    echo "Loading configurations from: $source_dir"
+    echo "Loading configurations from: ${source_dirs[*]}"
     echo "============================================================"
 
-    # Loop through each top-level directory in 'dots' (e.g., 'home', 'etc')
-    for base_type_dir in "$source_dir"/*; do
-        if [ ! -d "$base_type_dir" ]; then
-            continue
-        fi
-
-        local base_type_name
-        base_type_name=$(basename "$base_type_dir") # e.g., "home" or "etc"
-
-        local system_base_path=""
-        case "$base_type_name" in
-            "home")
-                system_base_path="$HOME"
-                ;;
-            "etc")
-                system_base_path="/etc"
-                ;;
-            *)
-                _log WARN "Unknown base configuration type '$base_type_name'. Skipping."
-                continue
-                ;;
-        esac
-
-        # Now iterate through all items (files and directories) within the base_type_dir
-        # e.g., 'dots/base/home/config', 'dots/base/home/local', 'dots/base/etc/power-options'
-        find "$base_type_dir" -mindepth 1 -print0 | while IFS= read -r -d $'\0' item; do
-            local relative_path="${item#$base_type_dir/}" # Path relative to base_type_dir
-            local system_dest_path=""
-
-            echo $relative_path
-
-            # Special handling for .gemini folder (which is under home/gemini)
-            if [[ "$relative_path" == "gemini"* ]]; then
-                local gemini_repo_path="$source_dir/home/gemini"
-                local gemini_system_dest_path="$system_base_path/.gemini" # This will be $HOME/.gemini
-
-                echo "--- Loading '.gemini'$label_suffix ---"
-                if [ ! -d "$gemini_repo_path" ]; then
-                    _log WARN "Source directory for '.gemini' not found at '$gemini_repo_path'. Skipping."
-                    continue
-                fi
-
-                mkdir -p "$gemini_system_dest_path"
-                rsync -av --exclude="instruction.md" "$gemini_repo_path/" "$gemini_system_dest_path/"
-
-                if [ -f "$gemini_repo_path/instruction.md" ]; then
-                    cp "$gemini_repo_path/instruction.md" "$gemini_system_dest_path/GEMINI.md"
-                    _log SUCCESS "Copied instruction.md${label_suffix} to $gemini_system_dest_path/GEMINI.md"
-                else
-                    _log WARN "instruction.md not found in $gemini_repo_path. Skipping specific copy."
-                fi
-                echo "---------------------------"
-                continue # Skip further processing for gemini as it's handled
-            fi
-
-            # Construct the system destination path
-            if [ "$base_type_name" == "home" ]; then
-                # For home, if relative_path starts with "config/" or "local/", prepend a dot
-                if [[ "$relative_path" == "config/"* ]]; then
-                    system_dest_path="$system_base_path/.$relative_path"
-                elif [[ "$relative_path" == "local/"* ]]; then
-                    system_dest_path="$system_base_path/.$relative_path"
-                else
-                    system_dest_path="$system_base_path/$relative_path"
-                fi
-            elif [ "$base_type_name" == "etc" ]; then
-                system_dest_path="$system_base_path/$relative_path"
-            fi
-
-            # Call sync_files for each item
-            sync_files "$item" "$system_dest_path" "$(basename "$item")$label_suffix" ""
-        done
-    done
+    # Resolves the final source of every destination across all layers, so
+    # each file is written once: home/ -> $HOME (config/, local/ and gemini/
+    # become dot directories) in parallel, etc/ -> /etc in a single sudo
+    # call. Unchanged files are skipped. See sync_dots.py.
+    python3 "$CURRENT_SCRIPT_DIR/sync_dots.py" "${source_dirs[@]}"
 }
 
 #-------------------------------------------------------
@@ -284,28 +219,25 @@ main() {
          _log INFO "Skipping cursor configuration due to --skip-cursor flag."
     fi
 
+    # Read config.json once; the getters below reuse the values
+    load_config_values
+
     # Get user model from config.json
     local USER_MODEL
     USER_MODEL=$(get_user_model)
     _log INFO "User model detected: $USER_MODEL"
 
-    # Load custom configurations first if in post-install mode
+    # Layers in overlay order: post-install (only in post-install mode), then
+    # base, then the model-specific configurations
+    local layers=()
     if [ "$POST_INSTALL_MODE" = true ]; then
-        load_configs_from_source "$REPO_DIR/dots/post-install" " (post-install)"
+        layers+=("$REPO_DIR/dots/post-install")
     fi
-
-    # Load base configurations
-    load_configs_from_source "$REPO_DIR/dots/base" " (base)"
-
-    # Load model-specific configurations
+    layers+=("$REPO_DIR/dots/base")
     if [ -n "$USER_MODEL" ]; then
-        local MODEL_CONFIG_DIR="$REPO_DIR/dots/$USER_MODEL"
-        if [ -d "$MODEL_CONFIG_DIR" ]; then
-            load_configs_from_source "$MODEL_CONFIG_DIR" " ($USER_MODEL)"
-        else
-            _log WARN "Model-specific configuration directory '$MODEL_CONFIG_DIR' not found. Skipping."
-        fi
+        layers+=("$REPO_DIR/dots/$USER_MODEL")
     fi
+    load_configs_from_layers "${layers[@]}"
 
     if [[ "$(get_config_bool 'remove_end4_background' 'true')" == "true" ]]; then
         patch_quickshell_background
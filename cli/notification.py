@@ -1,126 +1,46 @@
 #!/usr/bin/env python3
 import sys
-import json
 import os
-from datetime import datetime, timedelta
+import time
+import argparse
 
 try:
     from PyQt6.QtWidgets import (
         QApplication,
         QMainWindow,
-        QListWidget,
-        QListWidgetItem,
-        QVBoxLayout,
-        QHBoxLayout,
-        QWidget,
-        QLabel,
-        QSizePolicy,
+        QListView,
+        QLineEdit,
+        QComboBox,
     )
-    from PyQt6.QtCore import Qt, QSize, QPropertyAnimation
-    from PyQt6.QtGui import QPixmap, QFont, QAction
+    from PyQt6.QtCore import Qt, QThread, QMetaObject, pyqtSignal
+    from PyQt6.QtGui import QAction, QKeySequence
 except ImportError:
     print("Error: PyQt6 is not installed.", file=sys.stderr)
     sys.exit(1)
 
+# Add the script's directory to the Python path to find submodules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-def parse_log_file(log_path):
-    notifications = []
-    try:
-        with open(log_path, "r") as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        notifications.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-    except FileNotFoundError:
-        print(f"Error: Log file not found at '{log_path}'", file=sys.stderr)
-    return notifications
+from notification_components.log_reader import plain_text
+from notification_components.log_loader import LogLoader
+from notification_components.list_model import NotificationListModel
+from notification_components.delegate import NotificationDelegate
+from notification_components.icon_cache import IconCache
+from notification_components.fade_animator import FadeAnimator
 
-
-class NotificationItemWidget(QWidget):
-    def __init__(self, notif_data):
-        super().__init__()
-
-        # Ensure the widget expands horizontally but keeps a compact height
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-        self.setMinimumHeight(64)
-
-        main_layout = QHBoxLayout(self)
-        # larger contents margins so the "card" has internal padding
-        main_layout.setContentsMargins(12, 12, 12, 12)
-        main_layout.setSpacing(10)
-
-        # Icon area with fixed width (only for the image)
-        icon_label = QLabel()
-        icon_label.setFixedWidth(48)
-        icon_label.setFixedHeight(48)
-        icon_label.setAlignment(Qt.AlignmentFlag.AlignTop)
-
-        icon_path = notif_data.get("appIcon") or notif_data.get("image")
-        pixmap = (
-            QPixmap(icon_path) if icon_path and os.path.exists(icon_path) else QPixmap()
-        )
-        if not pixmap.isNull():
-            pixmap = pixmap.scaled(
-                40,
-                40,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            icon_label.setPixmap(pixmap)
-
-        main_layout.addWidget(icon_label, alignment=Qt.AlignmentFlag.AlignTop)
-
-        # Text area
-        text_layout = QVBoxLayout()
-        text_layout.setSpacing(4)
-        text_layout.setContentsMargins(
-            0, 0, 0, 0
-        )  # text area uses its own spacing only
-
-        summary_label = QLabel(notif_data.get("summary", "No Summary"))
-        summary_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        summary_label.setTextInteractionFlags(
-            Qt.TextInteractionFlag.TextSelectableByMouse
-        )
-        text_layout.addWidget(summary_label)
-
-        body_label = QLabel(notif_data.get("body", ""))
-        body_label.setWordWrap(True)
-        body_label.setFont(QFont("Arial", 10))
-        body_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        text_layout.addWidget(body_label)
-
-        timestamp_ms = notif_data.get("time", 0)
-        try:
-            dt_object = datetime.fromtimestamp(timestamp_ms / 1000)
-            today = datetime.now().date()
-            if dt_object.date() == today:
-                time_str = dt_object.strftime("Today at %H:%M")
-            elif dt_object.date() == today - timedelta(days=1):
-                time_str = dt_object.strftime("Yesterday at %H:%M")
-            else:
-                time_str = dt_object.strftime("%m/%d/%Y %H:%M")
-        except Exception:
-            time_str = "Invalid Time"
-        time_label = QLabel(time_str)
-        time_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-        time_label.setFont(QFont("Arial", 8))
-        time_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        text_layout.addWidget(time_label)
-
-        main_layout.addLayout(text_layout)
-
-        self.setWindowOpacity(0.0)
-        self.anim = QPropertyAnimation(self, b"windowOpacity")
-        self.anim.setDuration(400)  # ความยาวแอนิเมชัน 400 มิลลิวินาที
-        self.anim.setStartValue(0.0)
-        self.anim.setEndValue(1.0)
-        self.anim.start()
+TIME_RANGES = [
+    ("Any time", None),
+    ("Last hour", 60 * 60),
+    ("Last 24 hours", 24 * 60 * 60),
+    ("Last 7 days", 7 * 24 * 60 * 60),
+    ("Last 30 days", 30 * 24 * 60 * 60),
+]
 
 
 class NotificationWindow(QMainWindow):
+    filterChanged = pyqtSignal(str, object, object)  # text, app, since (ms)
+    clearRequested = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Notification Center")
@@ -130,55 +50,194 @@ class NotificationWindow(QMainWindow):
         clear_action.triggered.connect(self.clear_notifications)
         self.toolbar = self.addToolBar("Main Toolbar")
         self.toolbar.addAction(clear_action)
-
-        self.list_widget = QListWidget()
-        # spacing between items (gives visual margin between the item widgets)
-        self.list_widget.setSpacing(8)
+        self._create_filter_widgets()
+
+        copy_action = QAction("Copy", self)
+        copy_action.setShortcut(QKeySequence.StandardKey.Copy)
+        copy_action.triggered.connect(self.copy_selected)
+        self.addAction(copy_action)
+
+        self.model = NotificationListModel(self)
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        # One timer fades in newly logged rows; batch loads appear without animating.
+        self.animator = FadeAnimator(self.list_view, parent=self)
+        self.model.modelReset.connect(self.animator.clear)
+        self.list_view.setItemDelegate(
+            NotificationDelegate(self.list_view, self.animator)
+        )
+        # every row has the same height, so layout cost does not grow with the history
+        self.list_view.setUniformItemSizes(True)
+        # spacing between items (gives visual margin between the cards)
+        self.list_view.setSpacing(8)
         # add an outer padding around the whole list so items don't touch the window edge
-        self.list_widget.setContentsMargins(8, 8, 8, 8)
+        self.list_view.setContentsMargins(8, 8, 8, 8)
         # allow selection like the old code
-        self.list_widget.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
+        self.list_view.setSelectionMode(QListView.SelectionMode.SingleSelection)
         # make scrolling smoother
-        self.list_widget.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
+        self.list_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
 
         # small stylesheet to add padding inside the list (uses theme colors only)
         # we avoid setting background colors so the app follows the system theme
-        self.list_widget.setStyleSheet(
+        self.list_view.setStyleSheet(
             """
-            QListWidget::item:selected {
-                background-color: palette(light);
-                border-radius: 8px;
-            }
-            QListWidget {
+            QListView {
                 padding: 6px;
             }
             """
         )
 
-        self.setCentralWidget(self.list_widget)
-
-    def load_log_data(self, log_path):
-        notifications = parse_log_file(log_path)
-        notifications.sort(key=lambda x: x.get("time", 0), reverse=True)
-        self.list_widget.clear()
-        for notif in notifications:
-            list_item = QListWidgetItem()
-            widget = NotificationItemWidget(notif)
-            # increase the size hint slightly so layout margins are visible
-            size = widget.sizeHint()
-            size.setHeight(size.height() + 12)
-            list_item.setSizeHint(size)
-            self.list_widget.addItem(list_item)
-            self.list_widget.setItemWidget(list_item, widget)
+        self.setCentralWidget(self.list_view)
+
+        # Repaint once an icon finishes decoding in the background.
+        IconCache.instance().iconReady.connect(
+            lambda _path: self.list_view.viewport().update()
+        )
+
+        self.loader = None
+        self.loader_thread = None
+        # Batches from an older query (or from before "Clear All") are dropped.
+        self._generation = None
+
+    def _create_filter_widgets(self):
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search notifications...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self.apply_filter)
+
+        self.app_combo = QComboBox()
+        self.app_combo.addItem("All apps", None)
+        self.app_combo.currentIndexChanged.connect(self.apply_filter)
+
+        self.time_combo = QComboBox()
+        for label, seconds in TIME_RANGES:
+            self.time_combo.addItem(label, seconds)
+        self.time_combo.currentIndexChanged.connect(self.apply_filter)
+
+        self.toolbar.addWidget(self.search_edit)
+        self.toolbar.addWidget(self.app_combo)
+        self.toolbar.addWidget(self.time_combo)
+        self._set_filters_enabled(False)
+
+    def _set_filters_enabled(self, enabled):
+        # Filtering needs the log index; the streaming fallback only supports scrolling.
+        for widget in (self.search_edit, self.app_combo, self.time_combo):
+            widget.setEnabled(enabled)
+
+    def load_log_data(self, log_path, follow=False):
+        """Starts loading the log on a worker thread; rows appear as batches arrive."""
+        self.loader = LogLoader(log_path, follow)
+        self.loader_thread = QThread(self)
+        self.loader.moveToThread(self.loader_thread)
+
+        self.loader.reset.connect(self._on_loader_reset)
+        self.loader.batchReady.connect(self._on_batch_ready)
+        self.loader.appended.connect(self._on_appended)
+        self.loader.appsChanged.connect(self._update_app_combo)
+        self.loader.filtersAvailable.connect(self._set_filters_enabled)
+        self.model.moreRequested.connect(self.loader.request_more)
+        self.filterChanged.connect(self.loader.set_filter)
+        self.clearRequested.connect(self.loader.clear)
+
+        self.loader_thread.started.connect(self.loader.start)
+        self.loader_thread.finished.connect(self.loader.deleteLater)
+        self.loader_thread.start()
+
+    def _on_loader_reset(self, generation):
+        self._generation = generation
+        self.model.reset()
+
+    def _on_batch_ready(self, generation, notifications, exhausted):
+        if generation != self._generation:
+            return
+        self.model.merge_notifications(notifications)
+        self.model.set_more_available(not exhausted)
+
+    def _on_appended(self, notifications):
+        self.animator.fade_in(self.model.merge_notifications(notifications))
+
+    def closeEvent(self, event):
+        if self.loader_thread is not None:
+            # Stop the tailer and timers on the worker thread before its loop exits.
+            QMetaObject.invokeMethod(
+                self.loader, "stop", Qt.ConnectionType.BlockingQueuedConnection
+            )
+            self.loader_thread.quit()
+            self.loader_thread.wait()
+        super().closeEvent(event)
+
+    # -------------------------------------------------------
+    # Search & Filtering
+    # -------------------------------------------------------
+    def _update_app_combo(self, app_names):
+        current = self.app_combo.currentData()
+        self.app_combo.blockSignals(True)
+        self.app_combo.clear()
+        self.app_combo.addItem("All apps", None)
+        for app_name in app_names:
+            self.app_combo.addItem(app_name or "Unknown app", app_name)
+        position = self.app_combo.findData(current)
+        self.app_combo.setCurrentIndex(max(position, 0))
+        self.app_combo.blockSignals(False)
+
+    def apply_filter(self):
+        if self.loader is None:
+            return
+        text = self.search_edit.text().strip()
+        app = self.app_combo.currentData()
+        seconds = self.time_combo.currentData()
+        since_ms = None
+        if seconds is not None:
+            since_ms = int((time.time() - seconds) * 1000)
+        self.filterChanged.emit(text, app, since_ms)
+
+    def copy_selected(self):
+        indexes = self.list_view.selectionModel().selectedIndexes()
+        if not indexes:
+            return
+        notif = indexes[0].data(NotificationListModel.NotificationRole)
+        text = str(notif.get("summary") or "")
+        body = plain_text(str(notif.get("body") or ""))
+        if body:
+            text = f"{text}\n{body}"
+        QApplication.clipboard().setText(text)
 
     def clear_notifications(self):
-        self.list_widget.clear()
+        self._generation = None
+        self.model.clear()
+        # The loader hides the cleared records from later streams and re-queries
+        self.clearRequested.emit()
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Notification Center")
+    parser.add_argument("log_path", nargs="?", help="quickshell notification log (JSONL)")
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="keep watching the log and show new notifications as they arrive",
+    )
+    parser.add_argument(
+        "--reduced-motion",
+        action="store_true",
+        help="show new notifications without fading them in",
+    )
+    parser.add_argument(
+        "--no-thumbnail-cache",
+        action="store_true",
+        help="do not read or write scaled icons under ~/.cache",
+    )
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
     app = QApplication(sys.argv)
+    if args.no_thumbnail_cache:
+        IconCache.instance().set_thumbnail_cache_enabled(False)
     win = NotificationWindow()
-    if len(sys.argv) > 1 and os.path.exists(sys.argv[1]):
-        win.load_log_data(sys.argv[1])
+    win.animator.enabled = not args.reduced_motion
     win.show()
+    if args.log_path and (args.follow or os.path.exists(args.log_path)):
+        win.load_log_data(args.log_path, follow=args.follow)
     sys.exit(app.exec())
@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt6.QtCore import Qt, QSize, QRect
+from PyQt6.QtGui import QFont, QFontMetrics
+
+from notification_components.log_reader import plain_text
+from notification_components.icon_cache import IconCache
+
+ICON_SIZE = 40
+MARGIN = 12
+SPACING = 10
+TEXT_SPACING = 4
+BODY_LINES = 2
+
+
+def format_time(timestamp_ms):
+    """Formats a notification timestamp (ms since epoch) relative to today."""
+    try:
+        dt_object = datetime.fromtimestamp(timestamp_ms / 1000)
+        today = datetime.now().date()
+        if dt_object.date() == today:
+            return dt_object.strftime("Today at %H:%M")
+        if dt_object.date() == today - timedelta(days=1):
+            return dt_object.strftime("Yesterday at %H:%M")
+        return dt_object.strftime("%m/%d/%Y %H:%M")
+    except Exception:
+        return "Invalid Time"
+
+
+class NotificationDelegate(QStyledItemDelegate):
+    """Paints a notification card (icon, summary, body, time) without any child widgets.
+
+    Every row has the same height so the view can use uniform item sizes; long
+    bodies are clipped to BODY_LINES lines and shown in full in the tooltip.
+    An optional FadeAnimator supplies the opacity of rows that are fading in.
+    """
+
+    def __init__(self, parent=None, animator=None):
+        super().__init__(parent)
+        self.animator = animator
+        self.summary_font = QFont("Arial", 11, QFont.Weight.Bold)
+        self.body_font = QFont("Arial", 10)
+        self.time_font = QFont("Arial", 8)
+        self.icon_cache = IconCache.instance()
+
+        summary_height = QFontMetrics(self.summary_font).height()
+        body_height = QFontMetrics(self.body_font).lineSpacing() * BODY_LINES
+        time_height = QFontMetrics(self.time_font).height()
+        text_height = summary_height + body_height + time_height + 2 * TEXT_SPACING
+        self.row_height = 2 * MARGIN + max(ICON_SIZE, text_height)
+
+    def sizeHint(self, option, index):
+        # The width is only a minimum; list mode stretches rows to the viewport.
+        return QSize(ICON_SIZE + 2 * MARGIN, self.row_height)
+
+    def paint(self, painter, option, index):
+        # Fetch the record itself: going through data() converts the dict to a
+        # QVariantMap and back on every paint, and loses its identity.
+        notif = index.model().notification(index.row())
+
+        painter.save()
+        rect = option.rect
+        palette = option.palette
+        if self.animator is not None:
+            serial = index.model().serial(index.row())
+            painter.setOpacity(self.animator.opacity(serial))
+
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.setRenderHint(painter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(palette.light())
+            painter.drawRoundedRect(rect, 8, 8)
+
+        content = rect.adjusted(MARGIN, MARGIN, -MARGIN, -MARGIN)
+
+        icon_path = notif.get("appIcon") or notif.get("image")
+        pixmap = self.icon_cache.pixmap(icon_path, ICON_SIZE) if icon_path else None
+        if pixmap is not None:
+            x = content.left() + (ICON_SIZE - pixmap.width()) // 2
+            painter.drawPixmap(x, content.top(), pixmap)
+
+        text_rect = content.adjusted(ICON_SIZE + SPACING, 0, 0, 0)
+        painter.setPen(palette.text().color())
+
+        painter.setFont(self.summary_font)
+        summary_metrics = QFontMetrics(self.summary_font)
+        summary = summary_metrics.elidedText(
+            str(notif.get("summary") or "No Summary"),
+            Qt.TextElideMode.ElideRight,
+            text_rect.width(),
+        )
+        summary_rect = QRect(
+            text_rect.left(), text_rect.top(), text_rect.width(), summary_metrics.height()
+        )
+        painter.drawText(summary_rect, Qt.AlignmentFlag.AlignLeft, summary)
+
+        time_metrics = QFontMetrics(self.time_font)
+        time_rect = QRect(
+            text_rect.left(),
+            text_rect.bottom() - time_metrics.height() + 1,
+            text_rect.width(),
+            time_metrics.height(),
+        )
+
+        body_rect = QRect(
+            text_rect.left(),
+            summary_rect.bottom() + 1 + TEXT_SPACING,
+            text_rect.width(),
+            time_rect.top() - TEXT_SPACING - summary_rect.bottom() - 1 - TEXT_SPACING,
+        )
+        painter.setFont(self.body_font)
+        painter.setClipRect(body_rect)
+        painter.drawText(
+            body_rect,
+            Qt.AlignmentFlag.AlignLeft | Qt.TextFlag.TextWordWrap,
+            plain_text(str(notif.get("body") or "")),
+        )
+        painter.setClipping(False)
+
+        painter.setFont(self.time_font)
+        painter.drawText(
+            time_rect, Qt.AlignmentFlag.AlignRight, format_time(notif.get("time", 0))
+        )
+        painter.restore()
@@ -0,0 +1,77 @@
+from PyQt6.QtCore import QObject, QTimer, QElapsedTimer, QEasingCurve
+
+FADE_DURATION_MS = 400
+# About one frame at 60 Hz.
+FRAME_INTERVAL_MS = 16
+# Larger inserts count as bulk loads and appear without animating.
+BULK_THRESHOLD = 20
+
+
+class FadeAnimator(QObject):
+    """Drives the fade-in of newly arrived rows from a single frame timer.
+
+    Rows are named by the serial numbers the model gives them. Rows passed to
+    fade_in() start fading the first time the delegate paints them, so rows
+    inserted off-screen never animate; a row not painted within
+    FADE_DURATION_MS just appears opaque later. The timer only runs while at
+    least one fade is in progress and repaints the viewport once per frame.
+    """
+
+    def __init__(self, view, duration=FADE_DURATION_MS, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self.duration = duration
+        self.enabled = True
+        self._easing = QEasingCurve(QEasingCurve.Type.OutCubic)
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        # Row serial -> time it was queued / first painted, in clock ms
+        self._pending = {}
+        self._fading = {}
+        self._timer = QTimer(self)
+        self._timer.setInterval(FRAME_INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+
+    def fade_in(self, serials):
+        if not self.enabled or len(serials) > BULK_THRESHOLD:
+            return
+        now = self._clock.elapsed()
+        # Rows that were never painted would otherwise stay queued until a fade runs
+        self._pending = self._unexpired(self._pending, now)
+        for serial in serials:
+            self._pending[serial] = now
+
+    def clear(self):
+        """Forgets every fade, e.g. when the model drops the rows they refer to."""
+        self._pending.clear()
+        self._fading.clear()
+        self._timer.stop()
+
+    def opacity(self, serial):
+        now = self._clock.elapsed()
+        if serial in self._pending:
+            queued = self._pending.pop(serial)
+            if now - queued >= self.duration:
+                return 1.0
+            self._fading[serial] = now
+            if not self._timer.isActive():
+                self._timer.start()
+        started = self._fading.get(serial)
+        if started is None:
+            return 1.0
+        progress = (now - started) / self.duration
+        if progress >= 1.0:
+            return 1.0
+        return self._easing.valueForProgress(progress)
+
+    def _unexpired(self, times, now):
+        return {key: time for key, time in times.items() if now - time < self.duration}
+
+    def _tick(self):
+        now = self._clock.elapsed()
+        self._fading = self._unexpired(self._fading, now)
+        self._pending = self._unexpired(self._pending, now)
+        # Repaint once more after the last fade ends so rows settle fully opaque.
+        self.view.viewport().update()
+        if not self._fading:
+            self._timer.stop()
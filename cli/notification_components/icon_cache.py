@@ -0,0 +1,149 @@
+import os
+import hashlib
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QSize, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QPixmap, QPainter, QColor
+
+# Number of decoded pixmaps kept in memory, across all sizes.
+DEFAULT_CAPACITY = 512
+
+
+def default_thumbnail_dir():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "az-arch-hyprland", "notification-icons")
+
+
+class _DecodeSignals(QObject):
+    # (path, size, image); a null image means the icon could not be loaded
+    finished = pyqtSignal(str, int, QImage)
+
+
+class _DecodeTask(QRunnable):
+    """Decodes and scales one icon off the GUI thread, going through the thumbnail cache."""
+
+    def __init__(self, path, size, thumbnail_dir, signals):
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.thumbnail_dir = thumbnail_dir
+        self.signals = signals
+
+    def run(self):
+        self.signals.finished.emit(self.path, self.size, self._load())
+
+    def _load(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return QImage()
+
+        thumbnail_path = None
+        if self.thumbnail_dir:
+            key = f"{self.path}\0{stat.st_mtime_ns}\0{stat.st_size}\0{self.size}"
+            name = hashlib.sha1(key.encode("utf-8", "surrogateescape")).hexdigest()
+            thumbnail_path = os.path.join(self.thumbnail_dir, name + ".png")
+            image = QImage(thumbnail_path)
+            if not image.isNull():
+                return image
+
+        reader = QImageReader(self.path)
+        source_size = reader.size()
+        if source_size.isValid():
+            # Let the decoder scale while reading instead of decoding full size first.
+            reader.setScaledSize(
+                source_size.scaled(
+                    QSize(self.size, self.size), Qt.AspectRatioMode.KeepAspectRatio
+                )
+            )
+        image = reader.read()
+        if image.isNull():
+            return image
+        if image.width() > self.size or image.height() > self.size:
+            image = image.scaled(
+                self.size,
+                self.size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+
+        if thumbnail_path:
+            try:
+                os.makedirs(self.thumbnail_dir, exist_ok=True)
+                temp_path = f"{thumbnail_path}.{os.getpid()}.tmp"
+                if image.save(temp_path, "PNG"):
+                    os.replace(temp_path, thumbnail_path)
+            except OSError:
+                pass
+        return image
+
+
+class IconCache(QObject):
+    """Process-wide LRU cache of scaled notification icons, keyed by path and size.
+
+    pixmap() never touches the disk: a miss returns a placeholder and queues the
+    decode on a QThreadPool; iconReady fires once the real pixmap is cached.
+    Scaled icons are also written to a thumbnail directory so later launches
+    skip decoding the originals.
+    """
+
+    iconReady = pyqtSignal(str)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, thumbnail_dir=None, parent=None):
+        super().__init__(parent)
+        self.capacity = capacity
+        self.thumbnail_dir = thumbnail_dir or default_thumbnail_dir()
+        self._pixmaps = OrderedDict()
+        self._pending = set()
+        self._placeholders = {}
+        self._pool = QThreadPool(self)
+        self._signals = _DecodeSignals(self)
+        self._signals.finished.connect(self._on_decoded)
+
+    def set_thumbnail_cache_enabled(self, enabled):
+        self.thumbnail_dir = default_thumbnail_dir() if enabled else None
+
+    def pixmap(self, path, size):
+        """Returns the cached pixmap, a placeholder while decoding, or None if the icon is unusable."""
+        key = (path, size)
+        if key in self._pixmaps:
+            self._pixmaps.move_to_end(key)
+            return self._pixmaps[key]
+        if key not in self._pending:
+            self._pending.add(key)
+            self._pool.start(_DecodeTask(path, size, self.thumbnail_dir, self._signals))
+        return self._placeholder(size)
+
+    def _on_decoded(self, path, size, image):
+        key = (path, size)
+        self._pending.discard(key)
+        # Failed loads are cached as None so missing files are not retried on every paint.
+        self._pixmaps[key] = None if image.isNull() else QPixmap.fromImage(image)
+        while len(self._pixmaps) > self.capacity:
+            self._pixmaps.popitem(last=False)
+        self.iconReady.emit(path)
+
+    def _placeholder(self, size):
+        placeholder = self._placeholders.get(size)
+        if placeholder is None:
+            placeholder = QPixmap(size, size)
+            placeholder.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(placeholder)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(128, 128, 128, 60))
+            painter.drawRoundedRect(0, 0, size, size, 8, 8)
+            painter.end()
+            self._placeholders[size] = placeholder
+        return placeholder
+
+    def wait_for_done(self, msecs=-1):
+        return self._pool.waitForDone(msecs)
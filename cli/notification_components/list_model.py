@@ -0,0 +1,117 @@
+import itertools
+from bisect import bisect_right
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
+
+# Number of notifications requested from the loader each time the view asks for more.
+PAGE_SIZE = 100
+
+
+def _sort_key(notif):
+    # Negated so the ascending keys list keeps rows in newest-first order.
+    time_ms = notif.get("time", 0)
+    return -time_ms if isinstance(time_ms, (int, float)) else 0
+
+
+class NotificationListModel(QAbstractListModel):
+    """List model over parsed notification records, newest first.
+
+    Records arrive asynchronously in batches and are merged into place by time,
+    so rows stay ordered without re-sorting everything loaded so far. fetchMore
+    only asks for more through moreRequested; the rows come later via
+    merge_notifications. Each row also gets a serial number that is never
+    reused, so per-row state (e.g. fades) can be kept outside the records.
+    """
+
+    NotificationRole = Qt.ItemDataRole.UserRole + 1
+
+    moreRequested = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._notifications = []
+        self._keys = []
+        self._serials = []
+        self._next_serial = itertools.count()
+        self._more_available = False
+        self._fetch_pending = False
+
+    def reset(self, more_available=True):
+        """Drops all rows, e.g. before the results of a new query stream in."""
+        self.beginResetModel()
+        self._notifications = []
+        self._keys = []
+        self._serials = []
+        self._more_available = more_available
+        self._fetch_pending = False
+        self.endResetModel()
+
+    def clear(self):
+        self.reset(more_available=False)
+
+    def set_more_available(self, more_available):
+        self._more_available = more_available
+
+    def merge_notifications(self, notifications):
+        """Inserts records at their place in time order, one insert per contiguous run.
+
+        Returns the serial numbers given to the records, in the order passed.
+        """
+        self._fetch_pending = False
+        if not notifications:
+            return []
+        serials = [next(self._next_serial) for _ in notifications]
+        order = sorted(range(len(notifications)), key=lambda i: _sort_key(notifications[i]))
+        batch = [notifications[i] for i in order]
+        start = 0
+        while start < len(batch):
+            position = bisect_right(self._keys, _sort_key(batch[start]))
+            # Extend the run while the next record lands at the same position.
+            end = start + 1
+            while end < len(batch) and (
+                position == len(self._keys)
+                or _sort_key(batch[end]) < self._keys[position]
+            ):
+                end += 1
+            self.beginInsertRows(QModelIndex(), position, position + end - start - 1)
+            self._notifications[position:position] = batch[start:end]
+            self._keys[position:position] = [_sort_key(n) for n in batch[start:end]]
+            self._serials[position:position] = [serials[i] for i in order[start:end]]
+            self.endInsertRows()
+            start = end
+        return serials
+
+    def notification(self, row):
+        return self._notifications[row]
+
+    def serial(self, row):
+        return self._serials[row]
+
+    # -------------------------------------------------------
+    # QAbstractListModel Interface
+    # -------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._notifications)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        notif = self._notifications[index.row()]
+        if role == self.NotificationRole:
+            return notif
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(notif.get("summary") or "No Summary")
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return str(notif.get("body") or "") or None
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._more_available and not self._fetch_pending
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._fetch_pending = True
+        self.moreRequested.emit(PAGE_SIZE)
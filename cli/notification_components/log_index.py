@@ -0,0 +1,308 @@
+import os
+import json
+import mmap
+import struct
+
+from notification_components.log_reader import parse_line
+
+# Sidecar layout: a fixed header followed by one fixed-size record per log line.
+# The header is written last on every update, so a crash mid-update leaves the
+# previous, still consistent, record count in place.
+MAGIC = b"AZNOTIDX"
+VERSION = 1
+HEADER = struct.Struct("<8sHHIQqQ")  # magic, version, flags, app_count, size, mtime_ns, count
+RECORD = struct.Struct("<QIqI")  # line offset, line length, time (ms), app id
+FLAG_MONOTONIC = 0x1
+
+INDEX_SUFFIX = ".idx"
+APPS_SUFFIX = ".idx.apps"
+
+
+def notification_time(notif):
+    """A record's "time" in whole milliseconds, as stored in the index (0 if missing)."""
+    time_ms = notif.get("time", 0)
+    return int(time_ms) if isinstance(time_ms, (int, float)) else 0
+
+
+class LogIndex:
+    """Memory-mapped index of byte offsets, timestamps and app names for a notification log.
+
+    Sequence numbers follow file order (0 is the oldest line). refresh() only
+    parses lines appended since the last run and rebuilds from scratch when the
+    log was truncated or rewritten. When the sidecar cannot be written (e.g. a
+    read-only directory) the index is kept in memory for the current process.
+    """
+
+    def __init__(self, log_path, index_path=None):
+        self.log_path = log_path
+        self.index_path = index_path or log_path + INDEX_SUFFIX
+        self.apps_path = self.index_path[: -len(INDEX_SUFFIX)] + APPS_SUFFIX
+        self.persistent = True
+        # Bumped whenever the index is rebuilt, so followers can tell a rewrite from an append.
+        self.generation = 0
+        self.monotonic = True
+        self.indexed_size = 0
+        self.mtime_ns = 0
+        self._count = 0
+        self._apps = []
+        self._app_ids = {}
+        self._data = None
+        self._log_file = None
+        self._load()
+
+    # -------------------------------------------------------
+    # Loading & Updating
+    # -------------------------------------------------------
+    def _load(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                header = f.read(HEADER.size)
+            magic, version, flags, app_count, size, mtime_ns, count = HEADER.unpack(
+                header
+            )
+            if magic != MAGIC or version != VERSION:
+                return
+            if os.path.getsize(self.index_path) < HEADER.size + count * RECORD.size:
+                return
+            with open(self.apps_path, "r", encoding="utf-8") as f:
+                apps = [json.loads(line) for _, line in zip(range(app_count), f)]
+            if len(apps) != app_count:
+                return
+        except (OSError, struct.error, ValueError):
+            return
+
+        self.monotonic = bool(flags & FLAG_MONOTONIC)
+        self.indexed_size = size
+        self.mtime_ns = mtime_ns
+        self._count = count
+        self._apps = apps
+        self._app_ids = {name: i for i, name in enumerate(apps)}
+        self._map()
+
+    def _map(self):
+        self._unmap()
+        if not self.persistent:
+            return
+        with open(self.index_path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _unmap(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+            self._data = None
+
+    def _reset(self):
+        self.generation += 1
+        self.monotonic = True
+        self.indexed_size = 0
+        self._count = 0
+        self._apps = []
+        self._app_ids = {}
+        self._unmap()
+        if self._log_file is not None:
+            # The log may have been replaced; reopen it on the next read.
+            self._log_file.close()
+            self._log_file = None
+        if not self.persistent:
+            self._data = bytearray(HEADER.size)
+
+    def _is_append_only(self, size):
+        """Checks that the log still starts with the already indexed lines."""
+        if size < self.indexed_size:
+            return False
+        if self._count == 0:
+            return True
+        offset, length, time_ms, _ = self.record(self._count - 1)
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            tail = f.read(length)
+        notif = parse_line(tail)
+        return (
+            tail.endswith(b"\n")
+            and notif is not None
+            and notification_time(notif) == time_ms
+        )
+
+    def refresh(self):
+        """Indexes lines appended to the log since the last refresh; returns how many were added."""
+        try:
+            stat = os.stat(self.log_path)
+        except FileNotFoundError:
+            if self._count:
+                self._reset()
+                self._write([], [])
+            return 0
+        if stat.st_size == self.indexed_size and stat.st_mtime_ns == self.mtime_ns:
+            return 0
+        if stat.st_size == self.indexed_size or not self._is_append_only(stat.st_size):
+            self._reset()
+
+        first_new_app = len(self._apps)
+        last_time = self.time(self._count - 1) if self._count else None
+        records = []
+        with open(self.log_path, "rb") as f:
+            f.seek(self.indexed_size)
+            offset = self.indexed_size
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # A line that is still being written; pick it up next time.
+                    break
+                notif = parse_line(line)
+                if notif is not None:
+                    time_ms = notification_time(notif)
+                    if last_time is not None and time_ms < last_time:
+                        self.monotonic = False
+                    last_time = time_ms
+                    records.append(
+                        RECORD.pack(
+                            offset,
+                            len(line),
+                            time_ms,
+                            self._app_id(notif.get("appName") or ""),
+                        )
+                    )
+                offset += len(line)
+
+        self.indexed_size = offset
+        self.mtime_ns = stat.st_mtime_ns
+        self._write(records, self._apps[first_new_app:])
+        return len(records)
+
+    def _app_id(self, app_name):
+        if not isinstance(app_name, str):
+            app_name = str(app_name)
+        app_id = self._app_ids.get(app_name)
+        if app_id is None:
+            app_id = len(self._apps)
+            self._apps.append(app_name)
+            self._app_ids[app_name] = app_id
+        return app_id
+
+    def _header(self, count):
+        flags = FLAG_MONOTONIC if self.monotonic else 0
+        return HEADER.pack(
+            MAGIC,
+            VERSION,
+            flags,
+            len(self._apps),
+            self.indexed_size,
+            self.mtime_ns,
+            count,
+        )
+
+    def _write(self, records, new_apps):
+        count = self._count + len(records)
+        if self.persistent:
+            try:
+                self._write_sidecar(records, new_apps, count)
+                self._count = count
+                return
+            except OSError:
+                # Fall back to an in-memory index, seeded from what was indexed so far.
+                valid_size = HEADER.size + self._count * RECORD.size
+                existing = (
+                    bytearray(self._data[:valid_size])
+                    if self._data is not None
+                    else bytearray()
+                )
+                self._unmap()
+                self.persistent = False
+                self._data = existing or bytearray(HEADER.size)
+        data = self._data
+        del data[HEADER.size + self._count * RECORD.size :]
+        data.extend(b"".join(records))
+        data[: HEADER.size] = self._header(count)
+        self._count = count
+
+    def _write_sidecar(self, records, new_apps, count):
+        append = self._count > 0 and os.path.exists(self.index_path)
+        with open(self.index_path, "r+b" if append else "w+b") as f:
+            f.seek(HEADER.size + self._count * RECORD.size)
+            f.write(b"".join(records))
+            f.truncate()
+            if new_apps or not append:
+                self._write_apps()
+            f.seek(0)
+            f.write(self._header(count))
+        self._map()
+
+    def _write_apps(self):
+        temp_path = self.apps_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for name in self._apps:
+                f.write(json.dumps(name) + "\n")
+        os.replace(temp_path, self.apps_path)
+
+    def close(self):
+        self._unmap()
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+    # -------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------
+    def __len__(self):
+        return self._count
+
+    def record(self, seq):
+        """Returns (offset, length, time_ms, app_id) for a sequence number."""
+        return RECORD.unpack_from(self._data, HEADER.size + seq * RECORD.size)
+
+    def time(self, seq):
+        return self.record(seq)[2]
+
+    def app_name(self, seq):
+        return self._apps[self.record(seq)[3]]
+
+    def app_names(self):
+        return list(self._apps)
+
+    def read(self, seq):
+        """Reads and decodes a single notification by sequence number."""
+        offset, length, _, _ = self.record(seq)
+        if self._log_file is None:
+            self._log_file = open(self.log_path, "rb")
+        self._log_file.seek(offset)
+        return parse_line(self._log_file.read(length))
+
+    def iter_reversed(self, seqs=None):
+        """Yields notifications newest first, optionally restricted to the given sequence numbers."""
+        if seqs is None:
+            seqs = range(self._count - 1, -1, -1)
+        for seq in seqs:
+            notif = self.read(seq)
+            if notif is not None:
+                yield notif
+
+    def _bisect_time(self, time_ms, right):
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            middle_time = self.time(middle)
+            if middle_time < time_ms or (right and middle_time == time_ms):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def time_range(self, since_ms=None, until_ms=None):
+        """Returns the sequence numbers whose time falls in [since_ms, until_ms].
+
+        Uses a binary search when the log is in time order (the normal case) and
+        falls back to a scan of the index records otherwise.
+        """
+        if self.monotonic:
+            start = 0 if since_ms is None else self._bisect_time(since_ms, right=False)
+            stop = (
+                self._count
+                if until_ms is None
+                else self._bisect_time(until_ms, right=True)
+            )
+            return range(start, max(start, stop))
+        return [
+            seq
+            for seq in range(self._count)
+            if (since_ms is None or self.time(seq) >= since_ms)
+            and (until_ms is None or self.time(seq) <= until_ms)
+        ]
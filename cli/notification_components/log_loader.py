@@ -0,0 +1,219 @@
+import sys
+import itertools
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+
+from notification_components.log_reader import LogPager, iter_notifications_reversed
+from notification_components.log_index import LogIndex
+from notification_components.log_maintenance import iter_archived_notifications_reversed
+from notification_components.log_watcher import LogTailer
+from notification_components.search_index import SearchIndex, matches
+
+# Records per batch sent to the UI; the first batch is all the window needs to paint.
+BATCH_SIZE = 100
+# Rows kept parsed ahead of what the view has asked for.
+READ_AHEAD = 2 * BATCH_SIZE
+# Records added to the search index per event-loop pass while catching up.
+INDEX_BATCH_SIZE = 2000
+
+
+class LogLoader(QObject):
+    """Owns the log index, search index and tailer on a worker thread.
+
+    The window talks to it only through queued signals: it asks for more rows
+    or a new filter, and receives batches of parsed records, newest first. Every
+    reset of the result stream bumps a generation number so the UI can drop
+    batches that belong to a superseded query.
+
+    Clear All is kept here as a watermark: records at or below it are left out
+    of every later stream and re-query, and new records arriving in follow
+    mode are sent on their own instead of re-running the query.
+    """
+
+    reset = pyqtSignal(int)  # generation of the stream that follows
+    batchReady = pyqtSignal(int, list, bool)  # generation, records, stream exhausted
+    appended = pyqtSignal(list)  # newly logged records, newest first
+    appsChanged = pyqtSignal(list)
+    filtersAvailable = pyqtSignal(bool)
+
+    def __init__(self, log_path, follow=False):
+        super().__init__()
+        self.log_path = log_path
+        self.follow = follow
+        self.log_index = None
+        self.search_index = SearchIndex()
+        self.tailer = None
+        self.generation = 0
+        self._pager = None
+        self._requested = 0
+        self._sent = 0
+        self._filter = ("", None, None)
+        self._index_timer = None
+        # Filtered results queried before the search index caught up
+        self._results_partial = False
+        # Clear All: sequence numbers below _cleared_seq (and, after the log
+        # is rewritten, records not newer than _cleared_ms) are hidden
+        self._cleared = False
+        self._cleared_seq = 0
+        self._cleared_ms = None
+
+    # -------------------------------------------------------
+    # Worker Slots
+    # -------------------------------------------------------
+    @pyqtSlot()
+    def start(self):
+        self._index_timer = QTimer(self)
+        self._index_timer.setInterval(0)
+        self._index_timer.timeout.connect(self._index_next_batch)
+
+        # The sidecar index makes startup cost proportional to the lines appended
+        # since the last launch; without it, fall back to streaming the raw log.
+        try:
+            self.log_index = LogIndex(self.log_path)
+            self.log_index.refresh()
+        except OSError as e:
+            print(f"Warning: Could not index '{self.log_path}': {e}", file=sys.stderr)
+            self.log_index = None
+        self.filtersAvailable.emit(self.log_index is not None)
+
+        if self.follow:
+            self.tailer = LogTailer(self.log_path, self.log_index, self)
+            self.tailer.appended.connect(self._on_appended)
+            self.tailer.reset.connect(self._on_log_reset)
+
+        self._restart_stream()
+        if self.log_index is not None:
+            self._index_timer.start()
+
+    @pyqtSlot(int)
+    def request_more(self, count):
+        self._requested += count
+        self._send_batches()
+
+    @pyqtSlot(str, object, object)
+    def set_filter(self, text, app, since_ms):
+        self._filter = (text, app, since_ms)
+        self._restart_stream()
+
+    @pyqtSlot()
+    def clear(self):
+        """Hides everything loaded so far; only records logged later are shown."""
+        self._cleared = True
+        if self.log_index is not None:
+            self._cleared_seq = len(self.log_index)
+            if self._cleared_seq:
+                self._cleared_ms = self.log_index.time(self._cleared_seq - 1)
+        self._restart_stream()
+
+    @pyqtSlot()
+    def stop(self):
+        if self.tailer is not None:
+            self.tailer.stop()
+        if self._index_timer is not None:
+            self._index_timer.stop()
+        if self.log_index is not None:
+            self.log_index.close()
+
+    # -------------------------------------------------------
+    # Result Stream
+    # -------------------------------------------------------
+    def _filter_active(self):
+        text, app, since_ms = self._filter
+        return bool(text) or app is not None or since_ms is not None
+
+    def _iter_results(self):
+        if self._cleared:
+            return self._iter_since_clear()
+        archived = iter_archived_notifications_reversed(self.log_path)
+        if self.log_index is None:
+            # Without the index only the unfiltered history can be streamed.
+            notifications = iter_notifications_reversed(self.log_path)
+        elif not self._filter_active():
+            notifications = self.log_index.iter_reversed()
+        else:
+            text, app, since_ms = self._filter
+            within = None
+            if since_ms is not None:
+                within = self.log_index.time_range(since_ms=since_ms)
+            seqs = self.search_index.query(text, app, within)
+            notifications = self.log_index.iter_reversed(seqs)
+            # Archives are not indexed; their records are filtered as they stream.
+            archived = (
+                notif for notif in archived if matches(notif, text, app, since_ms)
+            )
+        return itertools.chain(notifications, archived)
+
+    def _iter_since_clear(self):
+        """Results newer than Clear All; archives only hold older records."""
+        if self.log_index is None:
+            return iter(())  # the raw stream cannot tell old lines from new ones
+        if not self._filter_active():
+            seqs = range(len(self.log_index) - 1, self._cleared_seq - 1, -1)
+        else:
+            text, app, since_ms = self._filter
+            within = self.log_index.time_range(since_ms=since_ms)
+            seqs = [
+                seq
+                for seq in self.search_index.query(text, app, within)
+                if seq >= self._cleared_seq
+            ]
+        return self.log_index.iter_reversed(seqs)
+
+    def _restart_stream(self):
+        self.generation += 1
+        self._results_partial = self._filter_active() and (
+            self.log_index is None
+            or self.search_index.indexed_count < len(self.log_index)
+        )
+        self._pager = LogPager(self._iter_results())
+        self._requested = READ_AHEAD
+        self._sent = 0
+        self.reset.emit(self.generation)
+        self._send_batches()
+
+    def _send_batches(self):
+        if self._pager is None:
+            return
+        while self._sent < self._requested + READ_AHEAD and not self._pager.exhausted:
+            batch = self._pager.next_page(BATCH_SIZE)
+            self._sent += len(batch)
+            self.batchReady.emit(self.generation, batch, self._pager.exhausted)
+
+    # -------------------------------------------------------
+    # Follow Mode & Search Indexing
+    # -------------------------------------------------------
+    def _on_appended(self, notifications):
+        # Only the new records are sent, filtered here, so nothing older (or
+        # cleared) comes back; the search index catches up in the background.
+        if self._filter_active():
+            notifications = [n for n in notifications if matches(n, *self._filter)]
+        if notifications:
+            self.appended.emit(notifications)
+        if self.log_index is not None:
+            self._index_timer.start()
+
+    def _on_log_reset(self):
+        if self._cleared:
+            # Sequence numbers changed with the rewrite; keep hiding by time
+            self._cleared_seq = 0
+            if self._cleared_ms is not None:
+                newer = self.log_index.time_range(since_ms=self._cleared_ms + 1)
+                self._cleared_seq = (
+                    newer.start if isinstance(newer, range) else len(self.log_index)
+                )
+        self.search_index = SearchIndex()
+        self._restart_stream()
+        if self.log_index is not None:
+            self._index_timer.start()
+
+    def _index_next_batch(self):
+        start = self.search_index.indexed_count
+        stop = min(start + INDEX_BATCH_SIZE, len(self.log_index))
+        for seq in range(start, stop):
+            self.search_index.add(seq, self.log_index.read(seq) or {})
+        if stop < len(self.log_index):
+            return
+        self._index_timer.stop()
+        self.appsChanged.emit(self.search_index.app_names())
+        if self._results_partial:
+            self._restart_stream()
@@ -0,0 +1,186 @@
+import os
+import re
+import glob
+import gzip
+import json
+import time
+import hashlib
+import tempfile
+
+from notification_components.log_reader import parse_line
+
+ARCHIVE_SUFFIX = ".gz"
+# <stamp> or, for a second compaction within the same second, <stamp>-<counter>
+_ARCHIVE_NAME = re.compile(r"(\d{8}-\d{6})(?:-(\d+))?")
+
+
+def _archive_order(log_path, path):
+    name = path[len(log_path) + 1 : -len(ARCHIVE_SUFFIX)]
+    match = _ARCHIVE_NAME.fullmatch(name)
+    if match is None:
+        return (name, 0)
+    return (match.group(1), int(match.group(2) or 0))
+
+
+def archive_paths(log_path):
+    """Returns the compressed archives rotated out of a log, newest first."""
+    pattern = glob.escape(log_path) + ".*" + ARCHIVE_SUFFIX
+    return sorted(
+        glob.glob(pattern), key=lambda path: _archive_order(log_path, path), reverse=True
+    )
+
+
+def iter_archived_notifications_reversed(log_path):
+    """Streams notifications from the rotated archives, newest first.
+
+    Each archive is decompressed forwards and reversed in memory, which is fine
+    because an archive only ever holds one compaction's worth of records.
+    """
+    for path in archive_paths(log_path):
+        try:
+            with gzip.open(path, "rb") as f:
+                notifications = [n for n in map(parse_line, f) if n is not None]
+        except (OSError, EOFError):
+            continue
+        yield from reversed(notifications)
+
+
+def _record_key(notif):
+    canonical = json.dumps(notif, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+def _temp_file(directory, suffix):
+    fd, path = tempfile.mkstemp(dir=directory, prefix=".compact-", suffix=suffix)
+    return os.fdopen(fd, "wb"), path
+
+
+def compact_log(
+    log_path, max_age_days=None, max_count=None, archive=False, dry_run=False
+):
+    """Rewrites a notification log without corrupt lines, duplicates or expired records.
+
+    Records older than max_age_days, and the oldest records beyond max_count,
+    are dropped or, with archive=True, moved into a gzip archive next to the log
+    (<log>.<timestamp>.gz). The new log is written to a temporary file and
+    swapped in with os.replace, so readers never see a half-written log. Lines
+    appended while compacting, up to and just after the swap, are carried over
+    unchanged.
+
+    Returns a dict of counts describing what was (or, with dry_run, would be)
+    done. A dry run only counts and writes nothing.
+    """
+    directory = os.path.dirname(os.path.abspath(log_path))
+    cutoff_ms = None
+    if max_age_days is not None:
+        cutoff_ms = int((time.time() - max_age_days * 24 * 60 * 60) * 1000)
+
+    stats = {"kept": 0, "corrupt": 0, "duplicates": 0, "expired": 0, "archive": None}
+    seen = set()
+    kept_file = kept_path = None
+    if not dry_run:
+        kept_file, kept_path = _temp_file(directory, ".jsonl")
+    archive_file = archive_path = None
+    if archive and not dry_run:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        archive_path = f"{log_path}.{stamp}{ARCHIVE_SUFFIX}"
+        suffix = 1
+        while os.path.exists(archive_path):
+            archive_path = f"{log_path}.{stamp}-{suffix}{ARCHIVE_SUFFIX}"
+            suffix += 1
+        raw_file, archive_temp_path = _temp_file(directory, ARCHIVE_SUFFIX)
+        archive_file = gzip.GzipFile(fileobj=raw_file, mode="wb")
+
+    try:
+        with open(log_path, "rb") as log_file:
+            # Only compact what exists now; later appends are copied over verbatim.
+            end = log_file.seek(0, os.SEEK_END)
+            log_file.seek(0)
+            position = 0
+            for line in log_file:
+                if position + len(line) > end or not line.endswith(b"\n"):
+                    break
+                position += len(line)
+                notif = parse_line(line)
+                if notif is None:
+                    if line.strip():
+                        stats["corrupt"] += 1
+                    continue
+                key = _record_key(notif)
+                if key in seen:
+                    stats["duplicates"] += 1
+                    continue
+                seen.add(key)
+                time_ms = notif.get("time", 0)
+                if (
+                    cutoff_ms is not None
+                    and isinstance(time_ms, (int, float))
+                    and time_ms < cutoff_ms
+                ):
+                    stats["expired"] += 1
+                    if archive_file is not None:
+                        archive_file.write(line)
+                    continue
+                if kept_file is not None:
+                    kept_file.write(line)
+                stats["kept"] += 1
+        if dry_run:
+            overflow = stats["kept"] - max_count if max_count is not None else 0
+            if overflow > 0:
+                stats["kept"] -= overflow
+                stats["expired"] += overflow
+            return stats
+        kept_file.close()
+
+        # Enforce the count limit by dropping the oldest of the kept records.
+        overflow = stats["kept"] - max_count if max_count is not None else 0
+        if overflow > 0:
+            trimmed_file, trimmed_path = _temp_file(directory, ".jsonl")
+            with open(kept_path, "rb") as f, trimmed_file:
+                for index, line in enumerate(f):
+                    if index >= overflow:
+                        trimmed_file.write(line)
+                    elif archive_file is not None:
+                        archive_file.write(line)
+            os.replace(trimmed_path, kept_path)
+            stats["kept"] -= overflow
+            stats["expired"] += overflow
+
+        changed = stats["corrupt"] or stats["duplicates"] or stats["expired"]
+        if not changed:
+            return stats
+
+        if archive_file is not None:
+            archive_file.close()
+            raw_file.close()
+            archive_file = None
+            if stats["expired"]:
+                os.replace(archive_temp_path, archive_path)
+                stats["archive"] = archive_path
+            else:
+                os.remove(archive_temp_path)
+
+        with open(log_path, "rb") as log_file, open(kept_path, "ab") as kept:
+            log_file.seek(position)
+            kept.write(log_file.read())
+            kept.flush()
+            os.fsync(kept.fileno())
+            os.chmod(kept_path, os.stat(log_path).st_mode & 0o7777)
+            os.replace(kept_path, log_path)
+            # Lines that reached the old file between the copy above and the
+            # swap only exist there; the still open handle reads them back.
+            tail = log_file.read()
+            if tail:
+                kept.write(tail)
+                kept.flush()
+                os.fsync(kept.fileno())
+        return stats
+    finally:
+        if kept_file is not None:
+            kept_file.close()
+        if archive_file is not None:
+            archive_file.close()
+            raw_file.close()
+            os.remove(archive_temp_path)
+        if kept_path is not None and os.path.exists(kept_path):
+            os.remove(kept_path)
@@ -0,0 +1,95 @@
+import sys
+import json
+import os
+import re
+
+# Size of each block read from the end of the log while streaming backwards.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+def plain_text(text):
+    """Strips the markup notification bodies may carry."""
+    return _TAG_PATTERN.sub("", text or "")
+
+
+def parse_line(line):
+    """Decodes one JSONL line into a notification dict, or None if it is blank or corrupt."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        notif = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return notif if isinstance(notif, dict) else None
+
+
+def parse_log_file(log_path):
+    """Reads the whole log into memory, oldest first. Prefer iter_notifications_reversed for large logs."""
+    notifications = []
+    try:
+        with open(log_path, "rb") as f:
+            for line in f:
+                notif = parse_line(line)
+                if notif is not None:
+                    notifications.append(notif)
+    except FileNotFoundError:
+        print(f"Error: Log file not found at '{log_path}'", file=sys.stderr)
+    return notifications
+
+
+def iter_lines_reversed(f, chunk_size=DEFAULT_CHUNK_SIZE, end=None):
+    """Yields the raw lines of a binary file object from last to first.
+
+    The file is read backwards in blocks of chunk_size bytes, so only one block
+    plus a partial line is held in memory at any time.
+    """
+    position = f.seek(0, os.SEEK_END) if end is None else end
+    remainder = b""
+    while position > 0:
+        read_size = min(chunk_size, position)
+        position -= read_size
+        f.seek(position)
+        block = f.read(read_size) + remainder
+        lines = block.split(b"\n")
+        # The first piece may be the tail of a line that starts in an earlier block.
+        remainder = lines.pop(0)
+        for line in reversed(lines):
+            if line:
+                yield line
+    if remainder:
+        yield remainder
+
+
+def iter_notifications_reversed(log_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Streams notifications newest first (the log is appended in time order)."""
+    try:
+        with open(log_path, "rb") as f:
+            for line in iter_lines_reversed(f, chunk_size):
+                notif = parse_line(line)
+                if notif is not None:
+                    yield notif
+    except FileNotFoundError:
+        print(f"Error: Log file not found at '{log_path}'", file=sys.stderr)
+
+
+class LogPager:
+    """Hands out pages of notifications from a (possibly lazy) iterator."""
+
+    def __init__(self, notifications):
+        self._iterator = iter(notifications)
+        self.exhausted = False
+
+    def next_page(self, page_size):
+        page = []
+        if self.exhausted:
+            return page
+        for notif in self._iterator:
+            page.append(notif)
+            if len(page) >= page_size:
+                break
+        else:
+            self.exhausted = True
+        return page
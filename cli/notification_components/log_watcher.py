@@ -0,0 +1,171 @@
+import os
+import ctypes
+import ctypes.util
+import struct
+
+from PyQt6.QtCore import QObject, QSocketNotifier, QFileSystemWatcher, pyqtSignal
+
+from notification_components.log_reader import parse_line
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+
+def _open_inotify(directory):
+    """Returns an inotify fd watching a directory, or None if inotify is unavailable."""
+    library = ctypes.util.find_library("c")
+    if library is None:
+        return None
+    try:
+        libc = ctypes.CDLL(library, use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class LogTailer(QObject):
+    """Watches a notification log and emits the records appended to it.
+
+    The log's directory is watched with inotify, so replacement by an atomic
+    rename (e.g. compaction) is noticed too; QFileSystemWatcher is used when
+    inotify is not available. Only the bytes after the last read position are
+    parsed, through the LogIndex when one is given.
+    """
+
+    appended = pyqtSignal(list)  # new notifications, newest first
+    reset = pyqtSignal()  # the log was truncated or replaced
+
+    def __init__(self, log_path, log_index=None, parent=None):
+        super().__init__(parent)
+        self.log_path = os.path.abspath(log_path)
+        self.log_index = log_index
+        self._file_name = os.fsencode(os.path.basename(self.log_path))
+        self._inotify_fd = None
+        self._notifier = None
+        self._watcher = None
+        self._generation = log_index.generation if log_index is not None else 0
+        self._offset = self._complete_size()
+        self._start_watching()
+
+    def _complete_size(self):
+        """Returns the offset just past the last complete line of the log."""
+        if self.log_index is not None:
+            return self.log_index.indexed_size
+        try:
+            with open(self.log_path, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                while size > 0:
+                    f.seek(size - 1)
+                    if f.read(1) == b"\n":
+                        break
+                    size -= 1
+                return size
+        except FileNotFoundError:
+            return 0
+
+    def _start_watching(self):
+        directory = os.path.dirname(self.log_path)
+        self._inotify_fd = _open_inotify(directory)
+        if self._inotify_fd is not None:
+            self._notifier = QSocketNotifier(
+                self._inotify_fd, QSocketNotifier.Type.Read, self
+            )
+            self._notifier.activated.connect(self._on_inotify_event)
+            return
+
+        self._watcher = QFileSystemWatcher([directory], self)
+        if os.path.exists(self.log_path):
+            self._watcher.addPath(self.log_path)
+        self._watcher.fileChanged.connect(self._on_watcher_event)
+        self._watcher.directoryChanged.connect(self._on_watcher_event)
+
+    def stop(self):
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+            self._notifier = None
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+        if self._watcher is not None:
+            self._watcher.removePaths(self._watcher.files() + self._watcher.directories())
+            self._watcher = None
+
+    # -------------------------------------------------------
+    # Event Handlers
+    # -------------------------------------------------------
+    def _on_inotify_event(self):
+        try:
+            buffer = os.read(self._inotify_fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        relevant = False
+        position = 0
+        while position + _EVENT.size <= len(buffer):
+            _, _, _, name_length = _EVENT.unpack_from(buffer, position)
+            start = position + _EVENT.size
+            name = buffer[start : start + name_length].rstrip(b"\0")
+            relevant = relevant or name == self._file_name
+            position = start + name_length
+        if relevant:
+            self.poll()
+
+    def _on_watcher_event(self, _path):
+        # A replaced file drops out of the watch list; watch the new one.
+        if os.path.exists(self.log_path) and self.log_path not in self._watcher.files():
+            self._watcher.addPath(self.log_path)
+        self.poll()
+
+    def poll(self):
+        """Reads whatever was appended since the last call and emits it."""
+        if self.log_index is not None:
+            added = self.log_index.refresh()
+            if self.log_index.generation != self._generation:
+                self._generation = self.log_index.generation
+                self.reset.emit()
+                return
+            if added:
+                count = len(self.log_index)
+                seqs = range(count - 1, count - added - 1, -1)
+                self.appended.emit(list(self.log_index.iter_reversed(seqs)))
+            return
+
+        try:
+            with open(self.log_path, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                if size < self._offset:
+                    self._offset = self._complete_size()
+                    self.reset.emit()
+                    return
+                f.seek(self._offset)
+                data = f.read(size - self._offset)
+        except FileNotFoundError:
+            if self._offset:
+                self._offset = 0
+                self.reset.emit()
+            return
+
+        # Keep a trailing partial line for the next event.
+        end = data.rfind(b"\n") + 1
+        self._offset += end
+        notifications = [
+            notif
+            for notif in map(parse_line, data[:end].split(b"\n"))
+            if notif is not None
+        ]
+        if notifications:
+            notifications.reverse()
+            self.appended.emit(notifications)
@@ -0,0 +1,174 @@
+import re
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+
+from notification_components.log_reader import plain_text
+from notification_components.log_index import notification_time
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    return _TOKEN_PATTERN.findall(plain_text(text).casefold())
+
+
+def _sorted_union(postings):
+    """Merges ascending posting lists into one ascending list without duplicates."""
+    if len(postings) == 1:
+        return postings[0]
+    merged = array("I")
+    last = -1
+    for seq in heapq.merge(*postings):
+        if seq != last:
+            merged.append(seq)
+            last = seq
+    return merged
+
+
+def _intersect(smaller, larger):
+    """Keeps the entries of the smaller ascending list that also appear in the larger one."""
+    result = array("I")
+    position = 0
+    for seq in smaller:
+        position = bisect_left(larger, seq, position)
+        if position == len(larger):
+            break
+        if larger[position] == seq:
+            result.append(seq)
+    return result
+
+
+def matches(notif, text="", app=None, since_ms=None):
+    """Whether one record passes the filter SearchIndex.query() applies.
+
+    Used for records outside the index, such as rotated archives, which are
+    filtered while they are streamed instead of being indexed.
+    """
+    app_name = str(notif.get("appName") or "")
+    if app is not None and app_name != app:
+        return False
+    if since_ms is not None and notification_time(notif) < since_ms:
+        return False
+    terms = tokenize(text)
+    if not terms:
+        return True
+    tokens = set(
+        tokenize(
+            " ".join(
+                (
+                    str(notif.get("summary") or ""),
+                    str(notif.get("body") or ""),
+                    app_name,
+                )
+            )
+        )
+    )
+    *whole, last = terms
+    return all(term in tokens for term in whole) and any(
+        token.startswith(last) for token in tokens
+    )
+
+
+class SearchIndex:
+    """Inverted index over notification summary, body and app name.
+
+    Records are added by sequence number in ascending order, so every posting
+    list stays sorted and queries can intersect and range-limit them with
+    binary searches instead of scanning the history.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._app_postings = {}
+        # Sorted token list for prefix lookups, rebuilt lazily after new tokens appear.
+        self._vocabulary = []
+        self._vocabulary_dirty = False
+        self.indexed_count = 0
+
+    def add(self, seq, notif):
+        app_name = str(notif.get("appName") or "")
+        self._append(self._app_postings, app_name, seq)
+        text = " ".join(
+            (str(notif.get("summary") or ""), str(notif.get("body") or ""), app_name)
+        )
+        for token in set(tokenize(text)):
+            if self._append(self._postings, token, seq):
+                self._vocabulary_dirty = True
+        self.indexed_count = seq + 1
+
+    @staticmethod
+    def _append(postings, key, seq):
+        """Adds seq to the posting list for key; returns True if the key is new."""
+        posting = postings.get(key)
+        if posting is None:
+            postings[key] = array("I", (seq,))
+            return True
+        posting.append(seq)
+        return False
+
+    def _prefix_postings(self, prefix):
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        matches = []
+        for position in range(
+            bisect_left(self._vocabulary, prefix), len(self._vocabulary)
+        ):
+            token = self._vocabulary[position]
+            if not token.startswith(prefix):
+                break
+            matches.append(self._postings[token])
+        return _sorted_union(matches) if matches else array("I")
+
+    def app_names(self):
+        return sorted(self._app_postings, key=str.casefold)
+
+    def query(self, text="", app=None, within=None):
+        """Returns matching sequence numbers, newest first.
+
+        Every word in text must match; the last word also matches as a prefix so
+        results update while typing. within limits the results to a range (or any
+        collection) of sequence numbers, e.g. from LogIndex.time_range().
+        """
+        lists = []
+        terms = tokenize(text)
+        for i, term in enumerate(terms):
+            if i == len(terms) - 1:
+                posting = self._prefix_postings(term)
+            else:
+                posting = self._postings.get(term, array("I"))
+            lists.append(posting)
+        if app is not None:
+            lists.append(self._app_postings.get(app, array("I")))
+
+        if not lists:
+            if within is None:
+                return range(self.indexed_count - 1, -1, -1)
+            if isinstance(within, range):
+                return within[::-1]
+            return sorted(within, reverse=True)
+
+        if isinstance(within, range):
+            # Narrow every list to the range before intersecting.
+            lists = [
+                posting[
+                    bisect_left(posting, within.start) : bisect_right(
+                        posting, within.stop - 1
+                    )
+                ]
+                for posting in lists
+            ]
+            within = None
+
+        lists.sort(key=len)
+        result = lists[0]
+        for posting in lists[1:]:
+            if not result:
+                break
+            result = _intersect(result, posting)
+
+        if within is not None:
+            allowed = set(within)
+            result = [seq for seq in result if seq in allowed]
+        return result[::-1]
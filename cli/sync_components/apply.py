@@ -0,0 +1,139 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from sync_components.plan import SyncAction
+from sync_components.merge import merge_block
+
+# Copies are I/O bound, so a few more threads than cores still help
+SYNC_JOBS = min(16, (os.cpu_count() or 1) + 4)
+
+
+def apply_action(action):
+    """Carries out one action. Raises OSError on failure."""
+    if action.kind == "mkdir":
+        os.makedirs(action.dest, exist_ok=True)
+        return
+    os.makedirs(os.path.dirname(action.dest), exist_ok=True)
+    if action.kind == "merge":
+        merge_block(action.source, action.dest, action.block)
+        return
+
+    # Written next to the destination and renamed over it, so a reader never
+    # sees a half-written file and a symlink at dest is replaced, not followed.
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(action.dest), prefix=".sync-")
+    os.close(fd)
+    try:
+        if action.kind == "link":
+            os.remove(temp_path)
+            os.symlink(os.readlink(action.source), temp_path)
+        else:
+            shutil.copyfile(action.source, temp_path)
+            shutil.copystat(action.source, temp_path)
+        os.replace(temp_path, action.dest)
+    except OSError:
+        if os.path.lexists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _try_apply(action):
+    try:
+        apply_action(action)
+    except OSError as e:
+        return e
+    return None
+
+
+def apply_actions(actions, report=print, jobs=SYNC_JOBS):
+    """Applies actions; returns the ones that failed.
+
+    Copies and links each write their own destination and run on a thread
+    pool. Merges run afterwards, in order, since they edit files the copies
+    may have just written. Results are reported in plan order.
+    """
+    files = [action for action in actions if action.kind != "merge"]
+    merges = [action for action in actions if action.kind == "merge"]
+    if jobs > 1 and len(files) > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            errors = list(pool.map(_try_apply, files))
+    else:
+        errors = [_try_apply(action) for action in files]
+    errors += [_try_apply(action) for action in merges]
+
+    failed = []
+    for action, error in zip(files + merges, errors):
+        if error is not None:
+            failed.append(action)
+            print(f"Error: Could not {action.kind} '{action.source}' to '{action.dest}': {error}", file=sys.stderr)
+            continue
+        verb = {"copy": "Updated", "link": "Linked", "merge": "Merged into", "mkdir": "Created"}[action.kind]
+        report(f"{verb} {action.dest}")
+    return failed
+
+
+# -------------------------------------------------------
+# Privileged Batch
+# -------------------------------------------------------
+def apply_privileged(actions, script_path):
+    """Applies actions that need root in a single `sudo` call.
+
+    The actions are written to a plan file that `<script_path> --apply-plan`
+    reads back as root; it writes the indexes of the actions that failed to
+    a results file. Returns the actions that failed. When no results come
+    back (sudo refused, or the privileged side crashed) all of them did.
+    """
+    if not actions:
+        return []
+    if os.geteuid() == 0:
+        return apply_actions(actions)
+    with tempfile.NamedTemporaryFile("w", suffix=".json", prefix="sync-plan-", delete=False) as f:
+        json.dump([action.to_dict() for action in actions], f)
+        plan_path = f.name
+    fd, results_path = tempfile.mkstemp(suffix=".json", prefix="sync-results-")
+    os.close(fd)
+    try:
+        result = subprocess.run(
+            ["sudo", sys.executable, script_path, "--apply-plan", plan_path, "--results", results_path]
+        )
+        failed = _read_results(results_path, actions)
+        if failed is None:
+            print(f"Error: The privileged sync did not finish (exit code {result.returncode}).", file=sys.stderr)
+    except OSError as e:
+        print(f"Error: Could not run sudo: {e}", file=sys.stderr)
+        failed = None
+    finally:
+        os.remove(plan_path)
+        os.remove(results_path)
+    if failed is None:
+        failed = actions
+        for action in actions:
+            print(f"Error: Could not {action.kind} '{action.source}' to '{action.dest}'", file=sys.stderr)
+    return failed
+
+
+def _read_results(results_path, actions):
+    """The failed actions listed in a results file, or None if it was not written."""
+    try:
+        with open(results_path, encoding="utf-8") as f:
+            indexes = json.load(f)["failed"]
+        return [actions[index] for index in indexes]
+    except (OSError, ValueError, KeyError, TypeError, IndexError):
+        return None
+
+
+def write_results(results_path, actions, failed):
+    """Records which of the plan's actions failed, for apply_privileged."""
+    failed_ids = {id(action) for action in failed}
+    indexes = [index for index, action in enumerate(actions) if id(action) in failed_ids]
+    with open(results_path, "w", encoding="utf-8") as f:
+        json.dump({"failed": indexes}, f)
+
+
+def load_plan(plan_path):
+    with open(plan_path, encoding="utf-8") as f:
+        return [SyncAction.from_dict(data) for data in json.load(f)]
@@ -0,0 +1,130 @@
+import os
+import json
+import hashlib
+import tempfile
+
+from sync_components.plan import is_up_to_date
+
+MANIFEST_VERSION = 1
+
+
+def default_manifest_path():
+    state_home = os.environ.get("XDG_STATE_HOME") or os.path.expanduser("~/.local/state")
+    return os.path.join(state_home, "az-arch-hyprland", "dots-manifest.json")
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stat_key(path):
+    """(size, mtime_ns) of a path, or None if it does not exist."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return [info.st_size, info.st_mtime_ns]
+
+
+class Manifest:
+    """Remembers what was deployed to each destination, and from where.
+
+    For every destination it stores the source path, the size and mtime of
+    the source and of the deployed file, and the deployed file's SHA-256.
+    With that, an unchanged file is recognised from two stat calls, and a
+    deployed file whose contents changed since it was written is drift: a
+    local edit that the next deployment would overwrite.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or default_manifest_path()
+        self.files = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == MANIFEST_VERSION:
+            self.files = data.get("files", {})
+
+    def classify(self, action):
+        """Returns "unchanged", "new", "changed", "drifted" or "merge" for an action."""
+        if action.kind == "merge":
+            return "unchanged" if is_up_to_date(action) else "merge"
+        if action.kind == "mkdir":
+            return "unchanged" if is_up_to_date(action) else "new"
+        if not os.path.lexists(action.dest):
+            return "new"
+        entry = self.files.get(action.dest)
+        if (
+            action.kind == "copy"
+            and entry is not None
+            and entry["source"] == action.source
+            and entry["source_stat"] == _stat_key(action.source)
+            and entry["stat"] == _stat_key(action.dest)
+        ):
+            return "unchanged"
+        if self.is_drifted(action.dest):
+            return "drifted"
+        return "unchanged" if is_up_to_date(action) else "changed"
+
+    def is_drifted(self, dest):
+        """Whether the deployed file was modified after it was deployed."""
+        entry = self.files.get(dest)
+        if entry is None or entry["stat"] == _stat_key(dest):
+            return False
+        try:
+            return file_hash(dest) != entry["sha256"]
+        except OSError:
+            return False
+
+    def record(self, action, landed=None):
+        """Stores the state of a destination right after it was deployed.
+
+        landed says whether a copy was written; by default it is checked,
+        which is not possible once a merge has changed the file as well.
+        """
+        if action.kind == "merge":
+            entry = self.files.get(action.dest)
+            if entry is not None:
+                # A block merged into a deployed file is not a local edit
+                entry["stat"] = _stat_key(action.dest)
+                entry["sha256"] = file_hash(action.dest)
+            return
+        if landed is None:
+            landed = is_up_to_date(action)
+        if action.kind in ("link", "mkdir") or not landed:
+            # Links and directories need no hashing; a copy that did not land is compared again
+            self.files.pop(action.dest, None)
+            return
+        self.files[action.dest] = {
+            "source": action.source,
+            "source_stat": _stat_key(action.source),
+            "stat": _stat_key(action.dest),
+            "sha256": file_hash(action.dest),
+        }
+
+    def prune(self, source_dirs, actions):
+        """Forgets destinations that source_dirs deployed but no longer contain."""
+        planned = {action.dest for action in actions}
+        prefixes = tuple(os.path.join(os.path.abspath(source_dir), "") for source_dir in source_dirs)
+        for dest, entry in list(self.files.items()):
+            if entry["source"].startswith(prefixes) and dest not in planned:
+                del self.files[dest]
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".dots-manifest-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "files": self.files}, f, indent=1)
+            os.replace(temp_path, self.path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
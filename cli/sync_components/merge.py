@@ -0,0 +1,81 @@
+import os
+
+# Marker comments around each managed block. "#" starts a comment in every
+# file that is merged into so far (kdeglobals, TOML).
+BLOCK_BEGIN = "# >>> az-arch-hyprland: {} >>>"
+BLOCK_END = "# <<< az-arch-hyprland: {} <<<"
+
+
+def read_text(path):
+    """Contents of path, or "" if it does not exist."""
+    try:
+        with open(path, encoding="utf-8", errors="surrogateescape") as f:
+            return f.read()
+    except FileNotFoundError:
+        return ""
+
+
+def merged_text(current, content, block_id):
+    """current with content placed in the block named block_id.
+
+    An existing block is replaced in place. Otherwise raw copies of content
+    at the very end of the file, where the old `tee -a` appends put them, are
+    removed and the block is added at the end. Merging the same content again
+    returns current as is.
+    """
+    begin = BLOCK_BEGIN.format(block_id)
+    end = BLOCK_END.format(block_id)
+    if content and not content.endswith("\n"):
+        block = f"{begin}\n{content}\n{end}\n"
+    else:
+        block = f"{begin}\n{content}{end}\n"
+
+    start = current.find(begin)
+    stop = current.find(end, start) if start != -1 else -1
+    if stop != -1:
+        stop += len(end)
+        if current.startswith("\n", stop):
+            stop += 1
+        return current[:start] + block + current[stop:]
+
+    current = _strip_trailing_copies(current, content)
+    if current and not current.endswith("\n"):
+        current += "\n"
+    return current + block
+
+
+def _strip_trailing_copies(current, content):
+    """Removes whole copies of content from the end of current only."""
+    snippet = content.strip("\n")
+    if not snippet.strip():
+        return current
+    while True:
+        body = current.rstrip("\n")
+        if not body.endswith(snippet):
+            return current
+        rest = body[: -len(snippet)]
+        if rest and not rest.endswith("\n"):
+            return current  # the snippet ends a longer line, so it is not a copy
+        current = rest
+
+
+def merge_block(source, dest, block_id):
+    """Writes source's content into its block in dest; returns False if already there."""
+    dest = os.path.realpath(dest)  # keep a symlinked config a symlink
+    current = read_text(dest)
+    new_text = merged_text(current, read_text(source), block_id)
+    if new_text == current:
+        return False
+    directory = os.path.dirname(dest)
+    temp_path = os.path.join(directory, f".{os.path.basename(dest)}.merge")
+    try:
+        with open(temp_path, "w", encoding="utf-8", errors="surrogateescape") as f:
+            f.write(new_text)
+        if os.path.exists(dest):
+            os.chmod(temp_path, os.stat(dest).st_mode & 0o7777)
+        os.replace(temp_path, dest)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return True
@@ -0,0 +1,152 @@
+import os
+from dataclasses import dataclass
+
+from sync_components.merge import merged_text, read_text
+
+# Marks a file whose content is merged into the file named without it.
+ADD_MARKER = "<add>"
+# home/<name> goes to ~/.<name> for these top-level directories
+DOTTED_HOME_DIRS = ("config", "local", "gemini")
+# home/gemini/instruction.md becomes ~/.gemini/GEMINI.md
+GEMINI_RENAMES = {"instruction.md": "GEMINI.md"}
+
+
+@dataclass
+class SyncAction:
+    kind: str  # "copy", "link", "merge" or "mkdir"
+    source: str
+    dest: str
+    privileged: bool = False
+    block: str = ""  # names the managed block of a merge, e.g. "pc/etc/foo<add>"
+
+    def to_dict(self):
+        return {"kind": self.kind, "source": self.source, "dest": self.dest, "block": self.block}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["kind"], data["source"], data["dest"], privileged=True, block=data.get("block", ""))
+
+
+def _home_dest(relative_path, home):
+    parts = relative_path.split(os.sep)
+    if parts[0] in DOTTED_HOME_DIRS:
+        parts[0] = "." + parts[0]
+        if parts[0] == ".gemini" and len(parts) == 2:
+            parts[1] = GEMINI_RENAMES.get(parts[1], parts[1])
+    return os.path.join(home, *parts)
+
+
+def plan_source(source_dir, home, etc_root="/etc", warn=None):
+    """Maps every file of one dots source (e.g. dots/base) to its destination.
+
+    source_dir/home/... goes below home (config/, local/ and gemini/ become
+    dot directories) and source_dir/etc/... below etc_root. The tree is walked
+    once and every file yields exactly one action, in a stable order. Files
+    named with <add> are merged into a block of their target (see merge.py).
+    Empty directories yield a mkdir action, so they are created as well.
+    """
+    warn = warn or (lambda message: None)
+    roots = {"home": home, "etc": etc_root}
+    actions = []
+    for base_name in sorted(os.listdir(source_dir)):
+        base_dir = os.path.join(source_dir, base_name)
+        if not os.path.isdir(base_dir):
+            continue
+        if base_name not in roots:
+            warn(f"Unknown base configuration type '{base_name}'. Skipping.")
+            continue
+        privileged = base_name == "etc"
+        for dir_path, dir_names, file_names in os.walk(base_dir):
+            dir_names.sort()
+            if not dir_names and not file_names and dir_path != base_dir:
+                relative_path = os.path.relpath(dir_path, base_dir)
+                if base_name == "home":
+                    dest = _home_dest(relative_path, home)
+                else:
+                    dest = os.path.join(etc_root, relative_path)
+                actions.append(SyncAction("mkdir", dir_path, dest, privileged))
+            for file_name in sorted(file_names):
+                source = os.path.join(dir_path, file_name)
+                relative_path = os.path.relpath(source, base_dir)
+                if base_name == "home":
+                    dest = _home_dest(relative_path, home)
+                else:
+                    dest = os.path.join(etc_root, relative_path)
+                block = ""
+                if ADD_MARKER in file_name:
+                    kind = "merge"
+                    block = "/".join((os.path.basename(source_dir), base_name, *relative_path.split(os.sep)))
+                    dest = os.path.join(os.path.dirname(dest), os.path.basename(dest).replace(ADD_MARKER, ""))
+                elif os.path.islink(source):
+                    kind = "link"
+                else:
+                    kind = "copy"
+                actions.append(SyncAction(kind, source, dest, privileged, block))
+    return actions
+
+
+def plan_layers(source_dirs, home, etc_root="/etc", warn=None):
+    """Resolves several dots sources into one plan; later sources win.
+
+    Each destination is written once, by the last source that has it, so
+    files an earlier layer would deploy only to be overwritten are skipped.
+    Merges follow the copies and keep their layer order; a merge is dropped
+    when a later layer replaces the whole file, as a re-copy would wipe it.
+    """
+    winners = {}
+    merges = []
+    for source_dir in source_dirs:
+        for action in plan_source(source_dir, home, etc_root, warn):
+            if action.kind == "merge":
+                merges.append(action)
+                continue
+            winners.pop(action.dest, None)
+            winners[action.dest] = action
+            merges = [merge for merge in merges if merge.dest != action.dest]
+    return list(winners.values()) + merges
+
+
+def is_up_to_date(action):
+    """Whether running the action would leave its destination unchanged.
+
+    Copies compare size, mode and mtime first (copies keep the source's
+    mtime), then contents. A merge is up to date when its block already holds
+    the source's content.
+    """
+    if action.kind == "merge":
+        try:
+            current = read_text(action.dest)
+            return merged_text(current, read_text(action.source), action.block) == current
+        except OSError:
+            return False
+    if action.kind == "mkdir":
+        return os.path.isdir(action.dest)
+    if action.kind == "link":
+        return os.path.islink(action.dest) and os.readlink(action.dest) == os.readlink(action.source)
+    try:
+        source_stat = os.stat(action.source)
+        dest_stat = os.stat(action.dest)
+    except OSError:
+        return False
+    if (
+        os.path.islink(action.dest)
+        or source_stat.st_size != dest_stat.st_size
+        or (source_stat.st_mode & 0o7777) != (dest_stat.st_mode & 0o7777)
+    ):
+        return False
+    if source_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+        return True
+    return _same_contents(action.source, action.dest)
+
+
+def _same_contents(path_a, path_b, chunk_size=1 << 16):
+    try:
+        with open(path_a, "rb") as a, open(path_b, "rb") as b:
+            while True:
+                chunk_a = a.read(chunk_size)
+                if chunk_a != b.read(chunk_size):
+                    return False
+                if not chunk_a:
+                    return True
+    except OSError:
+        return False
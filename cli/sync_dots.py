@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+#----------------------------------------------------------------------
+# Dotfile Sync
+#
+# Copies dots sources (e.g. dots/base, then dots/pc) to the system: home/
+# into $HOME, etc/ into /etc. All sources are planned together as layers,
+# later ones winning, so every destination is written at most once and
+# unchanged files are skipped. User files are copied in parallel and all
+# /etc writes happen in a single sudo call. Used by load_configs.sh.
+#
+# A manifest of deployed files (see sync_components/manifest.py) lets
+# unchanged files be skipped from their stat alone, and reveals deployed
+# files that were edited locally (drift). --dry-run only reports.
+#----------------------------------------------------------------------
+import sys
+import os
+import argparse
+
+# Add the script's directory to the Python path to find submodules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sync_components.plan import plan_layers
+from sync_components.apply import SYNC_JOBS, apply_actions, apply_privileged, load_plan, write_results
+from sync_components.manifest import Manifest
+
+DRY_RUN_LABELS = {
+    "new": "create",
+    "changed": "update",
+    "drifted": "overwrite local edits in",
+    "merge": "merge a block into",
+}
+
+
+def warn(message):
+    print(f"[WARN] {message}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync a dots source directory to the system.")
+    parser.add_argument(
+        "source_dirs", nargs="*", metavar="source_dir", help="dots sources in overlay order, e.g. dots/base dots/pc"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="list what would change, including locally edited files, without writing",
+    )
+    parser.add_argument("--jobs", type=int, default=SYNC_JOBS, help="parallel copies (default: %(default)s)")
+    parser.add_argument("--manifest", help=argparse.SUPPRESS)
+    parser.add_argument("--home", default=os.path.expanduser("~"), help=argparse.SUPPRESS)
+    parser.add_argument("--etc-root", default="/etc", help=argparse.SUPPRESS)
+    # Used internally: applies a plan written by the unprivileged side, as root
+    parser.add_argument("--apply-plan", help=argparse.SUPPRESS)
+    parser.add_argument("--results", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.apply_plan:
+        actions = load_plan(args.apply_plan)
+        failed = apply_actions(actions)
+        if args.results:
+            write_results(args.results, actions, failed)
+        sys.exit(1 if failed else 0)
+    if not args.source_dirs:
+        parser.error("at least one source_dir is required")
+    source_dirs = [os.path.abspath(source_dir) for source_dir in args.source_dirs]
+    for source_dir, given in zip(source_dirs, args.source_dirs):
+        if not os.path.isdir(source_dir):
+            print(f"Error: Source directory not found at '{given}'", file=sys.stderr)
+            sys.exit(1)
+
+    manifest = Manifest(args.manifest)
+    actions = plan_layers(source_dirs, args.home, args.etc_root, warn=warn)
+    states = [manifest.classify(action) for action in actions]
+    rewritten = {
+        action.dest for action, state in zip(actions, states) if action.kind != "merge" and state != "unchanged"
+    }
+    for index, action in enumerate(actions):
+        # A block already in place is lost when its file is copied again
+        if action.kind == "merge" and action.dest in rewritten:
+            states[index] = "merge"
+    pending = [(action, state) for action, state in zip(actions, states) if state != "unchanged"]
+    unchanged = len(actions) - len(pending)
+
+    if args.dry_run:
+        for action, state in pending:
+            print(f"Would {DRY_RUN_LABELS[state]} {action.dest}")
+        print(f"Dry run: {len(pending)} to change, {unchanged} unchanged.")
+        return
+
+    for action, state in pending:
+        if state == "drifted":
+            warn(f"{action.dest} was edited since it was deployed; overwriting it.")
+    pending = [action for action, state in pending]
+
+    # Without root, the etc batch needs sudo unless its root is writable (e.g. in tests)
+    needs_sudo = os.geteuid() != 0 and not os.access(args.etc_root, os.W_OK)
+    privileged = [action for action in pending if action.privileged and needs_sudo]
+    unprivileged = [action for action in pending if not (action.privileged and needs_sudo)]
+
+    failed = len(apply_actions(unprivileged, jobs=args.jobs))
+    failed += len(apply_privileged(privileged, os.path.abspath(__file__)))
+
+    merged = {action.dest for action in pending if action.kind == "merge"}
+    for action in pending:
+        landed = None
+        if action.kind == "copy" and action.dest in merged:
+            # Its merge changed the file too, so the copy cannot be checked
+            landed = not failed
+        try:
+            manifest.record(action, landed)
+        except OSError:
+            pass  # not deployed (or unreadable); it is compared again next time
+    manifest.prune(source_dirs, actions)
+    try:
+        manifest.save()
+    except OSError as e:
+        warn(f"Could not save the dots manifest to {manifest.path}: {e}")
+
+    print(
+        f"Synced: {len(pending) - failed} updated, "
+        f"{unchanged} unchanged, {failed} failed."
+    )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import os
+import sys
+import json
+import time
+import tempfile
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QCoreApplication
+
+from notification_components.log_loader import LogLoader
+
+APP = QCoreApplication.instance() or QCoreApplication([])
+
+
+def _line(time_ms, summary):
+    return json.dumps({"time": time_ms, "appName": "app", "summary": summary}) + "\n"
+
+
+class ClearAllTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.directory.name, "notifications.jsonl")
+        self.now = int(time.time() * 1000)
+        with open(self.log_path, "w") as f:
+            for i in range(60):
+                f.write(_line(self.now - 60_000 + i, f"old {i}"))
+
+        self.loader = LogLoader(self.log_path)
+        self.batches = []
+        self.appended = []
+        self.loader.batchReady.connect(lambda generation, batch, _: self.batches.append(batch))
+        self.loader.appended.connect(self.appended.append)
+        self.loader.start()
+        self._finish_indexing()
+
+    def tearDown(self):
+        self.loader.stop()
+        self.directory.cleanup()
+
+    def _finish_indexing(self):
+        while self.loader._index_timer.isActive():
+            self.loader._index_next_batch()
+
+    def _append(self, summary):
+        with open(self.log_path, "a") as f:
+            f.write(_line(self.now + 1, summary))
+        self.loader.log_index.refresh()
+        count = len(self.loader.log_index)
+        self.loader._on_appended([self.loader.log_index.read(count - 1)])
+        self._finish_indexing()
+
+    def _rows(self):
+        return [notif["summary"] for batch in self.batches for notif in batch]
+
+    def test_append_under_filter_does_not_bring_cleared_rows_back(self):
+        self.batches.clear()
+        self.loader.set_filter("", None, self.now - 3_600_000)
+        self.assertEqual(len(self._rows()), 60)
+
+        self.loader.clear()
+        self.batches.clear()
+        self._append("new")
+
+        self.assertEqual(self._rows(), [])
+        self.assertEqual([[n["summary"] for n in batch] for batch in self.appended], [["new"]])
+
+        # A later re-query (e.g. a new filter) still hides the cleared history
+        self.batches.clear()
+        self.loader.set_filter("", None, None)
+        self.assertEqual(self._rows(), ["new"])
+
+    def test_append_after_clear_without_filter_only_sends_new_records(self):
+        self.loader.clear()
+        self.batches.clear()
+        self._append("new")
+
+        self.assertEqual(self._rows(), [])
+        self.assertEqual([[n["summary"] for n in batch] for batch in self.appended], [["new"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import sys
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notification_components.log_maintenance import compact_log
+
+
+def _line(time_ms, summary):
+    return json.dumps({"time": time_ms, "appName": "app", "summary": summary}) + "\n"
+
+
+class CompactLogTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.directory.name, "notifications.jsonl")
+        with open(self.log_path, "w") as f:
+            for i in range(10):
+                f.write(_line(1000 + i, f"n {i}"))
+            f.write(_line(1000, "n 0"))  # duplicate
+            f.write("not json\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _summaries(self):
+        with open(self.log_path) as f:
+            return [json.loads(line)["summary"] for line in f]
+
+    def test_dry_run_only_counts(self):
+        with open(self.log_path, "rb") as f:
+            before = f.read()
+        stats = compact_log(self.log_path, max_count=4, archive=True, dry_run=True)
+
+        self.assertEqual((stats["kept"], stats["duplicates"], stats["corrupt"]), (4, 1, 1))
+        self.assertEqual(stats["expired"], 6)
+        self.assertEqual(os.listdir(self.directory.name), ["notifications.jsonl"])
+        with open(self.log_path, "rb") as f:
+            self.assertEqual(f.read(), before)
+
+    def test_line_appended_right_before_the_swap_is_kept(self):
+        real_replace = os.replace
+
+        def replace(source, dest):
+            if dest == self.log_path:
+                with open(self.log_path, "a") as f:
+                    f.write(_line(2000, "late"))
+            real_replace(source, dest)
+
+        with mock.patch("os.replace", replace):
+            compact_log(self.log_path)
+
+        self.assertEqual(self._summaries(), [f"n {i}" for i in range(10)] + ["late"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,7 @@ install_dependencies() {
         sudo pacman -S --noconfirm python
     fi
 
-    if ! pacman -Qs python-pyqt6 &> /dev/null; then
+    if ! pacman -Q python-pyqt6 &> /dev/null; then
         echo "python-pyqt6 not found. Installing..."
         sudo pacman -S --noconfirm python-pyqt6
     fi
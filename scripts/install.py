@@ -1,8 +1,11 @@
+import time
+
+_START = time.perf_counter()
+
 import sys
 import subprocess
 import os
-import tempfile
-import stat
+import argparse
 from collections import defaultdict
 from PyQt6.QtWidgets import (
     QApplication,
@@ -17,30 +20,56 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QGridLayout,
     QLabel,
+    QCheckBox,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 
 # Add the script's directory to the Python path to find submodules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from installer_components.install_data import get_install_items
 from installer_components.stylesheet import get_stylesheet
 from installer_components.installer_core import InstallerCore
+from installer_components.install_data import CatalogError
+
+
+# -------------------------------------------------------
+# Install State Probe
+# -------------------------------------------------------
+class InstallStateProbe(QThread):
+    """Finds the already satisfied items off the UI thread."""
+
+    loaded = pyqtSignal(object)
+
+    def __init__(self, installer_core, parent=None):
+        super().__init__(parent)
+        self.installer_core = installer_core
+
+    def run(self):
+        self.loaded.emit(self.installer_core.refresh_install_state())
 
 
 # -------------------------------------------------------
 # Main Application Window
 # -------------------------------------------------------
 class InstallerApp(QWidget):
-    def __init__(self):
+    def __init__(self, probe_state=True):
         super().__init__()
         self.repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.installer_core = InstallerCore(self.repo_dir)
         self.all_list_widgets = []
+        self.list_items_by_id = {}  # item _id -> QListWidgetItem, for tabs built so far
+        self.unbuilt_tabs = {}  # tab index -> {group name: items}, built on first activation
         self.grid_columns = 2
 
+        # Styles go on before any child exists, so nothing is polished twice
+        self._apply_stylesheet()
         self.init_ui()
-        self._apply_stylesheet()  # Apply custom styles
+        # Probing installed packages is slow, so it runs off the UI thread
+        self.state_probe = None
+        if probe_state:
+            self.state_probe = InstallStateProbe(self.installer_core, self)
+            self.state_probe.loaded.connect(self._show_install_state)
+            self.state_probe.start()
 
     def init_ui(self):
         self.setWindowTitle("Az Arch Hyprland Installer - Launcher")
@@ -92,6 +121,12 @@ class InstallerApp(QWidget):
         self.main_layout.addWidget(selection_group_box)
 
     def _create_launch_button(self):
+        self.force_checkbox = QCheckBox("Re-run already satisfied items")
+        self.force_checkbox.setToolTip(
+            "Runs every selected item, even those an earlier run already completed."
+        )
+        self.main_layout.addWidget(self.force_checkbox)
+
         self.launch_install_btn = QPushButton("Run Installation")
         # Removed objectName and height properties to revert to default button style
         self.launch_install_btn.clicked.connect(self.run_installation)
@@ -110,95 +145,130 @@ class InstallerApp(QWidget):
     # Data & UI Population
     # -------------------------------------------------------
     def populate_tabs_and_groups(self):
+        """Adds one empty page per tab; a tab's widgets are built when it is first shown."""
         tabs_data = defaultdict(lambda: defaultdict(list))
         current_tab_name = "Unknown"
         for item_data in self.installer_core.get_display_items():
-            if item_data["type"] == "header":
-                current_tab_name = item_data["text"].replace("---", "").strip()
+            if item_data.type == "header":
+                current_tab_name = item_data.text
             else:
-                group_name = item_data.get("group", "General")
-                tabs_data[current_tab_name][group_name].append(item_data)
-
-        from PyQt6.QtWidgets import QScrollArea  # Import QScrollArea
+                tabs_data[current_tab_name][item_data.group].append(item_data)
 
         for tab_name, groups in tabs_data.items():
             tab_content_widget = QWidget()
-            tab_main_layout = QVBoxLayout(
-                tab_content_widget
-            )  # Main layout for the tab content
-
-            scroll_area = QScrollArea()
-            scroll_area.setWidgetResizable(True)
-            scroll_area.setHorizontalScrollBarPolicy(
-                Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-            )  # Disable horizontal scrollbar
-
-            scroll_content_widget = QWidget()
-            tab_layout = QGridLayout(scroll_content_widget)
-            tab_layout.setContentsMargins(15, 15, 15, 15)
-            tab_layout.setSpacing(15)
-
-            scroll_area.setWidget(scroll_content_widget)
-            tab_main_layout.addWidget(
-                scroll_area
-            )  # Add scroll area to the tab's main layout
-
-            current_row, current_col = 0, 0
-
-            for group_name, items_in_group in sorted(groups.items()):
-                group_box = QGroupBox(group_name)
-                group_box_layout = QVBoxLayout(group_box)
-                group_box_layout.setContentsMargins(10, 15, 10, 10)
-                group_box_layout.setSpacing(0)
-
-                list_widget = QListWidget()
-                list_widget.setMinimumHeight(200)
-                list_widget.itemChanged.connect(self._on_item_checked)
-                self.all_list_widgets.append(list_widget)
-
-                for item_data in items_in_group:
-                    list_item = QListWidgetItem()
-                    list_item.setData(Qt.ItemDataRole.UserRole, item_data)
-
-                    item_text = item_data["text"]
-                    if item_data["type"] == "essential_laptop":
-                        item_text += " (Laptop)"
-                    list_item.setText(item_text)
-
-                    if "description" in item_data:
-                        list_item.setToolTip(item_data["description"])
-
-                    list_item.setFlags(
-                        list_item.flags() | Qt.ItemFlag.ItemIsUserCheckable
-                    )
-                    # Set initial check state from InstallerCore
-                    list_item.setCheckState(
-                        Qt.CheckState.Checked if item_data["is_selected"] else Qt.CheckState.Unchecked
-                    )
-                    list_widget.addItem(list_item)
-
-                group_box_layout.addWidget(list_widget)
-
-                tab_layout.addWidget(group_box, current_row, current_col)
-
-                current_col += 1
-                if current_col >= self.grid_columns:
-                    current_col = 0
-                    current_row += 1
-
-            tab_layout.setRowStretch(current_row + 1, 1)
-            self.tab_widget.addTab(tab_content_widget, tab_name)
+            QVBoxLayout(tab_content_widget)  # Main layout for the tab content
+            index = self.tab_widget.addTab(tab_content_widget, tab_name)
+            self.unbuilt_tabs[index] = groups
+
+        self.tab_widget.currentChanged.connect(self._build_tab)
+        self._build_tab(self.tab_widget.currentIndex())
+
+    def _build_tab(self, index):
+        groups = self.unbuilt_tabs.pop(index, None)
+        if groups is None:
+            return
+        tab_main_layout = self.tab_widget.widget(index).layout()
+
+        from PyQt6.QtWidgets import QScrollArea
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setHorizontalScrollBarPolicy(
+            Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+        )  # Disable horizontal scrollbar
+
+        scroll_content_widget = QWidget()
+        tab_layout = QGridLayout(scroll_content_widget)
+        tab_layout.setContentsMargins(15, 15, 15, 15)
+        tab_layout.setSpacing(15)
+
+        current_row, current_col = 0, 0
+
+        for group_name, items_in_group in sorted(groups.items()):
+            group_box = QGroupBox(group_name)
+            group_box_layout = QVBoxLayout(group_box)
+            group_box_layout.setContentsMargins(10, 15, 10, 10)
+            group_box_layout.setSpacing(0)
+
+            list_widget = QListWidget()
+            list_widget.setMinimumHeight(200)
+            self.all_list_widgets.append(list_widget)
+
+            for item_data in items_in_group:
+                list_item = QListWidgetItem()
+                list_item.setData(Qt.ItemDataRole.UserRole, item_data.id)
+                self.list_items_by_id[item_data.id] = list_item
+                self._set_item_label(list_item, item_data)
+                list_item.setFlags(
+                    list_item.flags() | Qt.ItemFlag.ItemIsUserCheckable
+                )
+                # Set initial check state from InstallerCore
+                list_item.setCheckState(
+                    Qt.CheckState.Checked
+                    if self.installer_core.is_selected(item_data.id)
+                    else Qt.CheckState.Unchecked
+                )
+                list_widget.addItem(list_item)
+
+            # Connected after filling, so building the rows does not go through it
+            list_widget.itemChanged.connect(self._on_item_checked)
+            group_box_layout.addWidget(list_widget)
+
+            tab_layout.addWidget(group_box, current_row, current_col)
+
+            current_col += 1
+            if current_col >= self.grid_columns:
+                current_col = 0
+                current_row += 1
+
+        tab_layout.setRowStretch(current_row + 1, 1)
+        # Filled before it is attached, so the layout runs once
+        scroll_area.setWidget(scroll_content_widget)
+        tab_main_layout.addWidget(
+            scroll_area
+        )  # Add scroll area to the tab's main layout
+
+    def _set_item_label(self, list_item, item_data):
+        item_text = item_data.text
+        if item_data.type == "essential_laptop":
+            item_text += " (Laptop)"
+        tooltip = item_data.description
+        if item_data.id in self.installer_core.satisfied_ids:
+            item_text += " (already satisfied)"
+            tooltip += ("\n\n" if tooltip else "") + (
+                "Already satisfied: it will be skipped unless something it uses has changed"
+                " or 'Re-run already satisfied items' is checked."
+            )
+        list_item.setText(item_text)
+
+        if tooltip:
+            list_item.setToolTip(tooltip)
+
+    def _show_install_state(self, satisfied_ids):
+        for list_widget in self.all_list_widgets:
+            list_widget.blockSignals(True)
+        for item_id in satisfied_ids:
+            list_item = self.list_items_by_id.get(item_id)
+            if list_item is not None:
+                self._set_item_label(list_item, self.installer_core.get_item(item_id))
+        for list_widget in self.all_list_widgets:
+            list_widget.blockSignals(False)
 
     def _on_item_checked(self, item):
-        item_data = item.data(Qt.ItemDataRole.UserRole)
-        if item_data and "_id" in item_data:
+        item_id = item.data(Qt.ItemDataRole.UserRole)
+        if item_id:
             is_selected = item.checkState() == Qt.CheckState.Checked
-            self.installer_core.update_item_selection(item_data["_id"], is_selected)
+            self.installer_core.update_item_selection(item_id, is_selected)
 
 
     # -------------------------------------------------------
     # Core Logic & Event Handlers
     # -------------------------------------------------------
+    def closeEvent(self, event):
+        if self.state_probe is not None:
+            self.state_probe.wait()
+        super().closeEvent(event)
+
     def run_installation(self):
         commands_to_run = self._get_selected_commands()
         if not commands_to_run:
@@ -206,16 +276,14 @@ class InstallerApp(QWidget):
                 self, "No Selection", "No items were selected for installation."
             )
             return
-        script_content = self._generate_install_script(commands_to_run)
+        runner = os.path.join(self.repo_dir, "scripts", "install_runner.py")
+        runner_args = ["--force"] if self.force_checkbox.isChecked() else []
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w+", delete=False, suffix=".sh", prefix="az-installer-"
-            ) as temp_script:
-                temp_script.write(script_content)
-                script_path = temp_script.name
-            os.chmod(script_path, stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR)
             subprocess.Popen(
-                ["kitty", "--title", "Installation Process", "bash", script_path]
+                ["kitty", "--title", "Installation Process", sys.executable, runner]
+                + runner_args
+                + ["--"]
+                + self.installer_core.get_selected_ids()
             )
         except FileNotFoundError:
             QMessageBox.critical(
@@ -231,125 +299,39 @@ class InstallerApp(QWidget):
     def _get_selected_commands(self):
         return self.installer_core.get_selected_commands()
 
-    def _generate_install_script(self, commands):
-        modules_dir = os.path.join(self.repo_dir, "scripts", "install_modules")
-
-        # The new run_command function for the bash script
-        run_command_func = """
-run_command() {
-    local command_to_run="$1"
-    
-    echo -e "\\n\\e[1;34m--- Running: ${command_to_run} ---\\e[0m"
-    
-    while true; do
-        # Execute the command and capture output
-        eval "${command_to_run}"
-        local exit_code=$?
-
-        if [ $exit_code -eq 0 ]; then
-            # Success
-            echo -e "\\n\\e[1;32m--- Finished: ${command_to_run} ---\\e[0m"
-            return 0
-        else
-            # Failure
-            echo -e "\\n\\e[1;31m--- ERROR: Command \\"${command_to_run}\\" failed with exit code $exit_code. ---\\e[0m"
-            read -p "      [R]etry, [I]gnore, or [A]bort? " choice
-            case "$choice" in
-                [rR])
-                    echo -e "\n\e[1;33m--- Retrying... ---\e[0m"
-                    continue
-                    ;; 
-                [iI])
-                    echo -e "\n\e[1;33m--- Ignoring and continuing... ---\e[0m"
-                    return 0 # Pretend it succeeded to continue the script
-                    ;; 
-                [aA])
-                    echo -e "\n\e[1;31m--- Aborting installation. ---\e[0m"
-                    exit 1
-                    ;; 
-                *)
-                    echo -e "\n\e[1;33m--- Invalid option. Retrying by default. ---\e[0m"
-                    continue
-                    ;; 
-            esac
-        fi
-    done
-}
-"""
-        # Initial script setup. Note the removal of "set -e".
-        script_lines = ["#!/bin/bash", f'export repo_dir="{self.repo_dir}"\n']
-        script_lines.append(
-            "trap 'echo; read -p \"--- Script finished. Press Enter to close terminal. ---\"' EXIT\n"
-        )
-        script_lines.append(run_command_func)
-
-        # No sorting needed, commands are already ordered by _get_selected_commands
-
-        for filename in sorted(os.listdir(modules_dir)):
-            if filename.endswith(".sh"):
-                script_lines.append(f"source {os.path.join(modules_dir, filename)}")
-
-        for command in commands:
-            # Wrap each command in the run_command function
-            # Quote the command to handle spaces correctly.
-            script_lines.append(f"run_command '{command}'")
-
-        return "\n".join(script_lines)
-
     # -------------------------------------------------------
     # Selection Methods
     # -------------------------------------------------------
     def select_essential(self):
-        self.installer_core.select_essential()
-        self._refresh_ui_selections()
+        self._refresh_ui_selections(self.installer_core.select_essential())
 
     def select_essential_laptop(self):
-        self.installer_core.select_essential_laptop()
-        self._refresh_ui_selections()
+        self._refresh_ui_selections(self.installer_core.select_essential_laptop())
 
     def _set_all_items_checked(self, is_checked):
         if is_checked:
-            self.installer_core.select_all()
+            changed_ids = self.installer_core.select_all()
         else:
-            self.installer_core.deselect_all()
-        self._refresh_ui_selections()
+            changed_ids = self.installer_core.deselect_all()
+        self._refresh_ui_selections(changed_ids)
 
-    def _refresh_ui_selections(self):
-        # Temporarily block signals to prevent _on_item_checked from being called
-        # repeatedly during UI refresh.
-        for list_widget in self.all_list_widgets:
-            list_widget.blockSignals(True)
-
-        for item_data in self.installer_core.get_display_items():
-            if item_data["type"] != "header":
-                for list_widget in self.all_list_widgets:
-                    for i in range(list_widget.count()):
-                        list_item = list_widget.item(i)
-                        # Ensure we are comparing the correct item_data
-                        if list_item.data(Qt.ItemDataRole.UserRole).get("_id") == item_data.get("_id"):
-                            check_state = Qt.CheckState.Checked if item_data["is_selected"] else Qt.CheckState.Unchecked
-                            list_item.setCheckState(check_state)
-                            break # Found the item, move to next item_data
-
-        for list_widget in self.all_list_widgets:
-            list_widget.blockSignals(False)
-
-
-    def _refresh_ui_selections(self):
+    def _refresh_ui_selections(self, changed_ids):
+        """Updates the check state of the rows whose selection changed in the core."""
+        if not changed_ids:
+            return
         # Temporarily block signals to prevent _on_item_checked from being called
         # repeatedly during UI refresh.
         for list_widget in self.all_list_widgets:
             list_widget.blockSignals(True)
 
-        for item_data in self.installer_core.get_display_items():
-            if item_data["type"] != "header":
-                for list_widget in self.all_list_widgets:
-                    for i in range(list_widget.count()):
-                        list_item = list_widget.item(i)
-                        if list_item.data(Qt.ItemDataRole.UserRole).get("_id") == item_data.get("_id"):
-                            check_state = Qt.CheckState.Checked if item_data["is_selected"] else Qt.CheckState.Unchecked
-                            list_item.setCheckState(check_state)
-                            break # Found the item, move to next item_data
+        for item_id in changed_ids:
+            list_item = self.list_items_by_id.get(item_id)
+            if list_item is None:
+                continue  # its tab is not built yet; it reads the core when it is
+            is_selected = self.installer_core.is_selected(item_id)
+            list_item.setCheckState(
+                Qt.CheckState.Checked if is_selected else Qt.CheckState.Unchecked
+            )
 
         for list_widget in self.all_list_widgets:
             list_widget.blockSignals(False)
@@ -359,15 +341,31 @@ run_command() {
 # Application Entry Point
 # -------------------------------------------------------
 def main():
+    parser = argparse.ArgumentParser(description="Az Arch Hyprland installer launcher.")
+    parser.add_argument(
+        "--startup-time",
+        action="store_true",
+        help="print the time until the window is shown, then exit",
+    )
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
     try:
-        from PyQt6.QtWidgets import QApplication
-    except ImportError:
-        print("Error: PyQt6 is not installed.")
-        print("Please install it using: pacman -S python-pyqt6")
+        # The probe is not part of startup, and closing must not wait for it
+        ex = InstallerApp(probe_state=not args.startup_time)
+    except CatalogError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        QMessageBox.critical(None, "Invalid Install Catalog", str(e))
         sys.exit(1)
-    app = QApplication(sys.argv)
-    ex = InstallerApp()
     ex.show()
+    if args.startup_time:
+        def report():
+            elapsed = (time.perf_counter() - _START) * 1000
+            print(f"Window shown after {elapsed:.0f} ms")
+            ex.close()
+
+        # Fires on the event loop's first pass, after the window's show events
+        QTimer.singleShot(0, report)
     sys.exit(app.exec())
 
 
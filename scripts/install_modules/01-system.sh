@@ -50,7 +50,10 @@ install_fuse() {
 install_fish() {
     _log INFO "Installing Fish shell..."
     install_pacman_package "fish" "Fish Shell"
-    
+    set_fish_as_default_shell
+}
+
+set_fish_as_default_shell() {
     if command -v fish &>/dev/null; then
         local user_shell=$(getent passwd $USER | cut -d: -f7)
         if [ "$user_shell" != "$(which fish)" ]; then
@@ -80,6 +83,10 @@ install_git() {
 
 install_pnpm() {
      install_paru_package "pnpm" "pnpm"
+     setup_pnpm
+}
+
+setup_pnpm() {
      echo "Checking pnpm setup..."
      local fish_config="$HOME/.config/fish/config.fish"
 
@@ -116,6 +123,10 @@ install_nvidia_drivers() {
         install_paru_package "$package" "$package"
     done
 
+    configure_nvidia_drm
+}
+
+configure_nvidia_drm() {
     # Enable DRM kernel mode setting
     local nvidia_conf="/etc/modprobe.d/nvidia.conf"
     if [ ! -f "$nvidia_conf" ]; then
@@ -146,6 +157,10 @@ install_systemd_oomd() {
 install_ananicy_cpp() {
     echo "Installing ananicy-cpp..."
     paru -S ananicy-cpp --noconfirm # --noconfirm is added for unattended installation
+    enable_ananicy_cpp
+}
+
+enable_ananicy_cpp() {
     echo "Enabling ananicy-cpp.service..."
     sudo systemctl enable --now ananicy-cpp.service
     _log SUCCESS "ananicy-cpp installed and enabled."
@@ -218,6 +233,10 @@ adjust_grub_menu() {
 
 enable_os_prober() {
      install_pacman_package "os-prober" "os-prober"
+     configure_os_prober
+}
+
+configure_os_prober() {
      echo "Enabling os-prober in GRUB configuration..."
      _check_grub_file_exists || return 1
      local grub_file="/etc/default/grub"
@@ -72,7 +72,10 @@ install_nwg_displays() {
     _log INFO "Installing nwg-displays for screen management..."
     install_paru_package "nwg-displays" "nwg-displays"
     _log SUCCESS "nwg-displays has been installed."
-    
+    run_nwg_displays
+}
+
+run_nwg_displays() {
     if command -v nwg-displays &> /dev/null; then
         _log INFO "Launching nwg-displays..."
         # Redirect stdout and stderr to /dev/null to keep the terminal clean
@@ -98,7 +101,10 @@ install_xorg_xhost_and_xhost_rule() {
         echo "xorg-xhost not found. Installing with paru..."
         paru -S --needed --noconfirm xorg-xhost
     fi
+    set_xhost_root_rule
+}
 
+set_xhost_root_rule() {
     echo "Setting xhost rule for localuser:root..."
     xhost si:localuser:root
 }
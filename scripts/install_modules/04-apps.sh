@@ -44,7 +44,10 @@ fix_vscode_permissions() {
 
 install_easyeffects() {
     install_flatpak_package "com.github.wwmm.easyeffects" "EasyEffects"
+    enable_easyeffects_service
+}
 
+enable_easyeffects_service() {
     echo "Installing and enabling EasyEffects systemd service..."
     local service_source="$repo_dir/services/easyeffects.service"
     local service_dest="$HOME/.config/systemd/user/easyeffects.service"
@@ -109,6 +112,10 @@ install_droidcam() {
 
 install_coolercontrol() {
     install_paru_package "coolercontrol-bin" "CoolerControl"
+    enable_coolercontrold
+}
+
+enable_coolercontrold() {
     echo "Enabling coolercontrold.service..."
     sudo systemctl enable --now coolercontrold.service
     _log SUCCESS "coolercontrold.service enabled."
@@ -63,7 +63,10 @@ setup_git_credential_management() {
     _log INFO "Setting up Git Credential Management..."
     echo "Installing git-credential-manager..."
     paru -S --needed --noconfirm git-credential-manager || { _log ERROR "Failed to install git-credential-manager."; return 1; }
-    
+    configure_git_credential_manager
+}
+
+configure_git_credential_manager() {
     echo "Configuring Git credential helper..."
     git config --global credential.helper manager || { _log ERROR "Failed to configure credential.helper."; return 1; }
     
@@ -32,6 +32,10 @@ install_waydroid_extra_script() {
 install_virt_packages() {
     echo "Installing virtualization packages..."
     paru -S --needed --noconfirm libvirt virt-manager qemu-full dnsmasq dmidecode edk2-ovmf
+    configure_virtualization
+}
+
+configure_virtualization() {
     echo "Enabling libvirtd.service..."
     sudo systemctl enable --now libvirtd.service
     echo "Adding current user to libvirt group..."
@@ -79,6 +83,10 @@ install_n8n() {
 #-------------------------------------------------------
 install_v4l2loopback() {
     install_paru_package "v4l2loopback-dkms" "v4l2loopback"
+    load_v4l2loopback_on_boot
+}
+
+load_v4l2loopback_on_boot() {
     echo "Adding v4l2loopback to /etc/modules-load.d/v4l2loopback.conf to load on boot..."
     echo "v4l2loopback" | sudo tee /etc/modules-load.d/v4l2loopback.conf > /dev/null
     _log SUCCESS "v4l2loopback module configuration completed."
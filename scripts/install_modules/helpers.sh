@@ -28,7 +28,8 @@ ask_yes_no() {
      local prompt="[y/n]"
 
      while true; do
-          read -p "$question $prompt: " response
+          # No terminal to answer from (e.g. a background install step): say no.
+          read -p "$question $prompt: " response || return 1
           case "$response" in
           [yY][eE][sS] | [yY]) return 0 ;;
           [nN][oO] | [nN]) return 1 ;;
@@ -71,6 +72,85 @@ install_flatpak_package() {
      echo "$friendly_name installation completed."
 }
 
+#-------------------------------------------------------
+# Batched Package Transactions
+#-------------------------------------------------------
+
+# Installs every package in one transaction. If that fails, falls back to one
+# transaction per package so a single bad package does not block the rest.
+# Usage: _install_package_batch <name> <command words...> -- <packages...>
+_install_package_batch() {
+     local friendly_name="$1"
+     shift
+     local install_cmd=()
+     while [ $# -gt 0 ] && [ "$1" != "--" ]; do
+          install_cmd+=("$1")
+          shift
+     done
+     shift
+     local packages=("$@")
+
+     _log INFO "Installing ${#packages[@]} packages with $friendly_name: ${packages[*]}"
+     if "${install_cmd[@]}" "${packages[@]}"; then
+          _log SUCCESS "$friendly_name batch installed."
+          return 0
+     fi
+
+     _log WARN "$friendly_name batch failed; installing packages one by one..."
+     local failed=()
+     local package
+     for package in "${packages[@]}"; do
+          "${install_cmd[@]}" "$package" || failed+=("$package")
+     done
+     if [ ${#failed[@]} -gt 0 ]; then
+          _log ERROR "Could not install: ${failed[*]}"
+          return 1
+     fi
+     _log SUCCESS "$friendly_name packages installed."
+}
+
+# Extra pacman options that let a transaction use the packages the installer
+# downloaded ahead of time (AZ_PREFETCH_CACHE, see installer_components/prefetch.py).
+# pacman only looks at the cache dirs it is given, so the configured ones are
+# listed first; new downloads still go there. Fills the array named by $1, so
+# paths with spaces stay single words.
+_prefetch_cache_args() {
+     local -n _cache_args="$1"
+     _cache_args=()
+     [ -n "$AZ_PREFETCH_CACHE" ] && [ -d "$AZ_PREFETCH_CACHE" ] || return 0
+     local cache_dirs=() cache_dir
+     mapfile -t cache_dirs < <(pacman-conf CacheDir 2>/dev/null)
+     [ ${#cache_dirs[@]} -gt 0 ] || cache_dirs=("/var/cache/pacman/pkg/")
+     for cache_dir in "${cache_dirs[@]}"; do
+          _cache_args+=(--cachedir "$cache_dir")
+     done
+     _cache_args+=(--cachedir "$AZ_PREFETCH_CACHE")
+}
+
+install_pacman_packages() {
+     local cache_args
+     _prefetch_cache_args cache_args
+     _install_package_batch "pacman" sudo pacman -S --needed --noconfirm "${cache_args[@]}" -- "$@"
+}
+
+install_paru_packages() {
+     if ! command -v paru &>/dev/null; then
+          _log ERROR "paru is not installed. Please install paru first."
+          return 1
+     fi
+     local cache_args
+     _prefetch_cache_args cache_args
+     _install_package_batch "paru" paru -S --needed --noconfirm "${cache_args[@]}" -- "$@"
+}
+
+install_flatpak_packages() {
+     if ! command -v flatpak &>/dev/null; then
+          _log ERROR "Flatpak is not installed. Please install Flatpak first."
+          return 1
+     fi
+     _install_package_batch "Flatpak" flatpak install -y flathub -- "$@"
+}
+
 install_jq() {
     if ! command -v jq &>/dev/null; then
         echo "jq not found. Installing..."
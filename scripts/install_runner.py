@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+#----------------------------------------------------------------------
+# Installation Runner
+#
+# Runs the items picked in the installer GUI. Independent items run in
+# parallel (see installer_components/scheduler.py); items that need the
+# terminal get it to themselves and failures are resolved one at a time.
+#
+# Items whose recorded inputs are unchanged since their last successful run
+# are skipped (see installer_components/install_state.py) unless --force.
+#----------------------------------------------------------------------
+import sys
+import os
+import argparse
+
+# Add the script's directory to the Python path to find submodules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from installer_components.installer_core import InstallerCore
+from installer_components.install_state import InstallState
+from installer_components.scheduler import DEFAULT_JOBS, Scheduler, make_bash_runner
+from installer_components.run_report import (
+    RunLog,
+    format_bytes,
+    history_lines,
+    load_runs,
+    save_run,
+    summary_lines,
+)
+from installer_components.runner import (
+    default_log_dir,
+    finish_prefetch,
+    plan_steps,
+    record_results,
+    start_prefetch,
+    start_sudo_keepalive,
+    waiting_for_prefetch,
+)
+
+BLUE = "\033[1;34m"
+GREEN = "\033[1;32m"
+YELLOW = "\033[1;33m"
+RED = "\033[1;31m"
+RESET = "\033[0m"
+
+LOG_TAIL_LINES = 20
+
+
+# -------------------------------------------------------
+# Progress Output
+# -------------------------------------------------------
+class ProgressPrinter:
+    """Prints step events, holding them back while a step owns the terminal."""
+
+    def __init__(self, total):
+        self.total = total
+        self.started = 0
+        self._terminal_owner = None
+        self._held = []
+
+    def __call__(self, kind, step, result):
+        if kind == "started":
+            self.started += 1
+            line = f"{BLUE}--- [{self.started}/{self.total}] Running: {step.text} ---{RESET}"
+            if step.interactive:
+                self._print(line)
+                self._terminal_owner = step.id
+                return
+        elif result.exit_code == 0:
+            line = f"{GREEN}--- Finished: {step.text} ({result.duration:.1f}s) ---{RESET}"
+        else:
+            line = f"{RED}--- ERROR: {step.text} failed with exit code {result.exit_code}. ---{RESET}"
+        if self._terminal_owner == step.id:
+            self._terminal_owner = None
+            self._print(line)
+            for held_line in self._held:
+                self._print(held_line)
+            self._held.clear()
+        elif self._terminal_owner is not None:
+            self._held.append(line)
+        else:
+            self._print(line)
+
+    @staticmethod
+    def _print(line):
+        print(line, flush=True)
+
+
+def print_log_tail(log_path):
+    if not log_path:
+        return
+    try:
+        with open(log_path, errors="replace") as f:
+            lines = f.readlines()[-LOG_TAIL_LINES:]
+    except OSError:
+        return
+    print(f"      Last lines of {log_path}:")
+    for line in lines:
+        print(f"      | {line.rstrip()}")
+
+
+def ask_failure_action(step, result):
+    """The old Retry/Ignore/Abort prompt, asked for one failed step at a time."""
+    print(f"\n{RED}--- ERROR: Command \"{step.command}\" failed with exit code {result.exit_code}. ---{RESET}")
+    print_log_tail(result.log_path)
+    while True:
+        try:
+            choice = input("      [R]etry, [I]gnore, or [A]bort? ").strip().lower()
+        except EOFError:
+            choice = "a"
+        if choice == "r":
+            print(f"\n{YELLOW}--- Retrying... ---{RESET}")
+            return "retry"
+        if choice == "i":
+            print(f"\n{YELLOW}--- Ignoring and continuing... ---{RESET}")
+            return "ignore"
+        if choice == "a":
+            print(f"\n{RED}--- Aborting installation (waiting for running steps). ---{RESET}")
+            return "abort"
+        print(f"\n{YELLOW}--- Invalid option. ---{RESET}")
+
+
+def print_summary(run):
+    print(f"\n{BLUE}--- Summary ---{RESET}")
+    colors = {"ok": GREEN, "ignored": YELLOW, "failed": RED, "skipped": YELLOW}
+    lines = summary_lines(run)
+    print(f"  {lines[0]}")
+    for entry, line in zip(run["steps"], lines[1:]):
+        print(f"  {colors.get(entry['status'], '')}{line}{RESET}")
+    for line in lines[len(run["steps"]) + 1:]:
+        print(f"  {line}")
+
+
+# -------------------------------------------------------
+# Entry Point
+# -------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Run the selected installation items.")
+    parser.add_argument("items", nargs="*", help="item IDs, as listed by the installer")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"maximum number of steps running at once (default: {DEFAULT_JOBS}; 1 runs them in order)",
+    )
+    parser.add_argument(
+        "--no-batch",
+        action="store_true",
+        help="run each item's own install function instead of merged package transactions",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="run every item, even those already satisfied by an earlier run",
+    )
+    parser.add_argument(
+        "--no-prefetch",
+        action="store_true",
+        help="do not download packages ahead of the steps that install them",
+    )
+    parser.add_argument("--log-dir", help="where the output of background steps is written")
+    parser.add_argument(
+        "--history",
+        type=int,
+        nargs="?",
+        const=5,
+        metavar="N",
+        help="compare the step timings of the last N runs (default: 5) and exit",
+    )
+    args = parser.parse_args()
+
+    if args.history is not None:
+        for line in history_lines(load_runs(args.history)):
+            print(line)
+        return
+    if not args.items:
+        parser.error("no items given")
+
+    repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        core = InstallerCore(repo_dir)
+        items = [core.get_item(item_id) for item_id in args.items]
+    except ValueError as e:  # includes CatalogError
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    state = InstallState(repo_dir)
+    try:
+        steps, satisfied = plan_steps(
+            items, state, force=args.force, batch_packages=not args.no_batch
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if satisfied:
+        print(f"{GREEN}Skipping {len(satisfied)} already satisfied items (use --force to run them).{RESET}")
+    if not steps:
+        print(f"{GREEN}Nothing to do.{RESET}")
+        return
+
+    log_dir = args.log_dir or default_log_dir()
+    print(f"Output of background steps goes to {log_dir}")
+    prefetcher = None if args.no_prefetch else start_prefetch(steps)
+    if prefetcher is not None:
+        print(f"Downloading packages ahead of their steps into {prefetcher.directory}")
+    keepalive = start_sudo_keepalive()
+    printer = ProgressPrinter(len(steps))
+    run_log = RunLog(args.jobs, log_dir)
+
+    def on_event(kind, step, result):
+        printer(kind, step, result)
+        run_log.on_event(kind, step, result)
+
+    scheduler = Scheduler(
+        steps,
+        waiting_for_prefetch(make_bash_runner(repo_dir, log_dir), prefetcher),
+        ask_failure_action,
+        jobs=args.jobs,
+        on_event=on_event,
+    )
+    try:
+        results = scheduler.run()
+    finally:
+        if keepalive is not None:
+            keepalive.set()
+
+    record_results(state, items, results)
+    run = run_log.finish(steps, results)
+    print_summary(run)
+    succeeded = not any(result.status in ("failed", "skipped") for result in results)
+    if prefetcher is not None:
+        print(
+            f"Prefetched {prefetcher.downloaded} packages ({format_bytes(prefetcher.downloaded_bytes)}), "
+            f"{len(prefetcher.errors)} could not be fetched ahead"
+        )
+        finish_prefetch(prefetcher, succeeded)
+    try:
+        print(f"Run log: {save_run(run)} (compare runs with --history)")
+    except OSError as e:
+        print(f"Error: Could not save the run log: {e}", file=sys.stderr)
+    if not succeeded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        try:
+            input("\n--- Script finished. Press Enter to close terminal. ---")
+        except (EOFError, KeyboardInterrupt):
+            pass
@@ -0,0 +1,257 @@
+#----------------------------------------------------------------------
+# Headless Installer
+#
+# Runs installer items without the GUI or a terminal to talk to, for
+# provisioning machines over SSH or in containers. Run from scripts/:
+#
+#   python -m installer --essentials --on-failure ignore
+#   python -m installer --laptop --items install_fish --retries 2
+#   python -m installer --list
+#
+# Progress is printed to stdout as one JSON object per line. Step output goes
+# to log files. Does not import PyQt6.
+#----------------------------------------------------------------------
+import sys
+import os
+import json
+import time
+import argparse
+
+# Add the scripts directory to the Python path to find submodules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from installer_components.installer_core import InstallerCore
+from installer_components.install_data import CatalogError
+from installer_components.install_state import InstallState
+from installer_components.scheduler import DEFAULT_JOBS, Scheduler, make_bash_runner
+from installer_components.run_report import RunLog, save_run
+from installer_components.runner import (
+    default_log_dir,
+    finish_prefetch,
+    plan_steps,
+    record_results,
+    start_prefetch,
+    start_sudo_keepalive,
+    waiting_for_prefetch,
+)
+
+FAILURE_POLICIES = ("abort", "ignore", "retry")
+
+
+def emit(event, **fields):
+    print(json.dumps({"event": event, "time": round(time.time(), 3), **fields}), flush=True)
+
+
+# -------------------------------------------------------
+# Selection
+# -------------------------------------------------------
+def select_items(core, args):
+    """Applies the preset flags, then --items, to the core's selection."""
+    if args.all:
+        core.select_all()
+    elif args.laptop:
+        core.select_essential_laptop()
+    elif args.essentials:
+        core.select_essential()
+    for item_id in args.items:
+        core.update_item_selection(item_id, True)
+    return [core.get_item(item_id) for item_id in core.get_selected_ids()]
+
+
+def list_items(core):
+    satisfied_ids = core.refresh_install_state()
+    for item in core.get_display_items():
+        if item.type == "header":
+            continue
+        emit(
+            "item",
+            id=item.id,
+            text=item.text,
+            type=item.type,
+            group=item.group,
+            satisfied=item.id in satisfied_ids,
+        )
+
+
+# -------------------------------------------------------
+# Run Events
+# -------------------------------------------------------
+def failure_policy(policy, retries):
+    """Returns an on_failure callback that answers without asking anyone.
+
+    A failed step is retried up to `retries` times, then the policy decides;
+    "retry" gives up like "abort" once the retries are used up.
+    """
+    def on_failure(step, result):
+        if result.attempt <= retries:
+            decision = "retry"
+        else:
+            decision = "abort" if policy == "retry" else policy
+        emit("decision", step=step.id, attempt=result.attempt, decision=decision)
+        return decision
+
+    return on_failure
+
+
+def report_event(kind, step, result):
+    if kind == "started":
+        emit("started", step=step.id, text=step.text)
+    else:
+        emit(
+            "finished",
+            step=step.id,
+            exit_code=result.exit_code,
+            duration=round(result.duration, 3),
+            cpu_time=round(result.cpu_time, 3),
+            received_bytes=result.received_bytes,
+            attempt=result.attempt,
+            log=result.log_path,
+        )
+
+
+# -------------------------------------------------------
+# Entry Point
+# -------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m installer",
+        description="Run installer items without the GUI, reporting progress as JSON lines.",
+    )
+    preset = parser.add_mutually_exclusive_group()
+    preset.add_argument("--essentials", action="store_true", help="select the essential items (PC)")
+    preset.add_argument("--laptop", action="store_true", help="select the essential items (Laptop)")
+    preset.add_argument("--all", action="store_true", help="select every item")
+    parser.add_argument("--items", nargs="+", default=[], metavar="ID", help="additional item IDs to select")
+    parser.add_argument("--list", action="store_true", help="list the item IDs and exit")
+    parser.add_argument(
+        "--on-failure",
+        choices=FAILURE_POLICIES,
+        default="abort",
+        help="what to do with a step that still fails after its retries (default: abort; 'retry' behaves like abort once --retries is used up)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=None,
+        help="times a failed step is retried (default: 1 with --on-failure retry, otherwise 0)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"maximum number of steps running at once (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--no-batch",
+        action="store_true",
+        help="run each item's own install function instead of merged package transactions",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="run every item, even those already satisfied by an earlier run",
+    )
+    parser.add_argument(
+        "--no-prefetch",
+        action="store_true",
+        help="do not download packages ahead of the steps that install them",
+    )
+    parser.add_argument("--log-dir", help="where the output of each step is written")
+    args = parser.parse_args()
+
+    repo_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    try:
+        core = InstallerCore(repo_dir)
+    except CatalogError as e:
+        emit("error", message=str(e))
+        return 2
+    if args.list:
+        list_items(core)
+        return 0
+
+    try:
+        items = select_items(core, args)
+    except ValueError as e:
+        emit("error", message=str(e))
+        return 2
+    if not items:
+        parser.error("nothing selected; use --essentials, --laptop, --all or --items")
+
+    state = InstallState(repo_dir)
+    try:
+        steps, satisfied = plan_steps(
+            items, state, force=args.force, batch_packages=not args.no_batch
+        )
+    except ValueError as e:
+        emit("error", message=str(e))
+        return 2
+
+    log_dir = args.log_dir or default_log_dir()
+    emit(
+        "plan",
+        steps=[{"id": step.id, "text": step.text, "depends_on": list(step.depends_on)} for step in steps],
+        satisfied=[item.id for item in satisfied],
+        log_dir=log_dir,
+    )
+    if not steps:
+        emit("summary", status="ok", duration=0.0, run_log=None, steps=[])
+        return 0
+
+    prefetcher = None if args.no_prefetch else start_prefetch(steps)
+    if prefetcher is not None:
+        emit("prefetch", directory=prefetcher.directory)
+
+    keepalive = None
+    if os.geteuid() != 0:
+        keepalive = start_sudo_keepalive(interactive=False)
+        if keepalive is None:
+            emit("warning", message="sudo needs a password; steps that use sudo will fail. Run `sudo -v` first or configure NOPASSWD.")
+
+    retries = args.retries if args.retries is not None else (1 if args.on_failure == "retry" else 0)
+    run_log = RunLog(args.jobs, log_dir)
+
+    def on_event(kind, step, result):
+        report_event(kind, step, result)
+        run_log.on_event(kind, step, result)
+
+    scheduler = Scheduler(
+        steps,
+        waiting_for_prefetch(make_bash_runner(repo_dir, log_dir, use_terminal=False), prefetcher),
+        failure_policy(args.on_failure, retries),
+        jobs=args.jobs,
+        on_event=on_event,
+    )
+    try:
+        results = scheduler.run()
+    finally:
+        if keepalive is not None:
+            keepalive.set()
+
+    record_results(state, items, results)
+    run = run_log.finish(steps, results)
+    try:
+        run_log_path = save_run(run)
+    except OSError as e:
+        emit("warning", message=f"Could not save the run log: {e}")
+        run_log_path = None
+    failed = any(entry["status"] in ("failed", "skipped") for entry in run["steps"])
+    if prefetcher is not None:
+        emit(
+            "prefetched",
+            packages=prefetcher.downloaded,
+            bytes=prefetcher.downloaded_bytes,
+            errors=prefetcher.errors,
+        )
+        finish_prefetch(prefetcher, not failed)
+    emit(
+        "summary",
+        status="failed" if failed else "ok",
+        duration=round(run["duration"], 3),
+        run_log=run_log_path,
+        steps=run["steps"],
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,480 +1,207 @@
+import os
+import pickle
+import hashlib
+import tempfile
+from dataclasses import dataclass, field
+from typing import ClassVar, Optional
+
+from installer_components.scheduler import PACKAGE_BATCHES
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "install_data.toml")
+# Bump when InstallItem or the validation changes, so old caches are ignored.
+CATALOG_FORMAT = 3
+ITEM_TYPES = ("essential", "essential_laptop", "optional")
+
+
+class CatalogError(ValueError):
+    """Raised when the install catalog cannot be read or has an invalid entry."""
+
+
+@dataclass(slots=True)
+class CatalogHeader:
+    """Starts a new tab in the installer."""
+
+    text: str
+    type: ClassVar[str] = "header"
+
+
+@dataclass(slots=True)
+class InstallItem:
+    """One checkable entry of the install catalog (see install_data.toml)."""
+
+    id: str
+    type: str
+    text: str
+    func: str
+    group: str = "General"
+    description: str = ""
+    depends_on: tuple[str, ...] = ()
+    conflicts: tuple[str, ...] = ()
+    resource: Optional[tuple[str, ...]] = None  # None runs the item alone
+    packages: dict[str, list[str]] = field(default_factory=dict)
+    post: Optional[str] = None
+    before_packages: bool = False
+    always_run: bool = False
+
+
+# -------------------------------------------------------
+# Validation
+# -------------------------------------------------------
+_REQUIRED = ("id", "type", "text", "func")
+_STRINGS = ("id", "type", "text", "func", "group", "description", "post")
+_STRING_LISTS = ("depends_on", "conflicts", "resource")
+_BOOLS = ("before_packages", "always_run")
+_KEYS = set(_STRINGS + _STRING_LISTS + _BOOLS + ("packages",))
+
+
+def _is_string_list(value):
+    return isinstance(value, list) and all(isinstance(v, str) for v in value)
+
+
+def _parse_item(entry, where):
+    unknown = set(entry) - _KEYS
+    if unknown:
+        raise CatalogError(f"{where}: unknown keys {', '.join(sorted(unknown))}")
+    for key in _REQUIRED:
+        if key not in entry:
+            raise CatalogError(f"{where}: missing '{key}'")
+    for key in _STRINGS:
+        if key in entry and not isinstance(entry[key], str):
+            raise CatalogError(f"{where}: '{key}' must be a string")
+    for key in _STRING_LISTS:
+        if key in entry and not _is_string_list(entry[key]):
+            raise CatalogError(f"{where}: '{key}' must be a list of strings")
+    if entry["type"] not in ITEM_TYPES:
+        raise CatalogError(f"{where}: type must be one of {', '.join(ITEM_TYPES)}")
+    for key in _BOOLS:
+        if not isinstance(entry.get(key, False), bool):
+            raise CatalogError(f"{where}: '{key}' must be true or false")
+    packages = entry.get("packages", {})
+    if not isinstance(packages, dict):
+        raise CatalogError(f"{where}: 'packages' must be a table")
+    for kind, names in packages.items():
+        if kind not in PACKAGE_BATCHES:
+            raise CatalogError(f"{where}: unknown package kind '{kind}'")
+        if not _is_string_list(names):
+            raise CatalogError(f"{where}: packages.{kind} must be a list of strings")
+    if "post" in entry and not packages:
+        raise CatalogError(f"{where}: 'post' needs 'packages'")
+
+    return InstallItem(
+        id=entry["id"],
+        type=entry["type"],
+        text=entry["text"],
+        func=entry["func"],
+        group=entry.get("group", "General"),
+        description=entry.get("description", ""),
+        depends_on=tuple(entry.get("depends_on", ())),
+        conflicts=tuple(entry.get("conflicts", ())),
+        resource=tuple(entry["resource"]) if "resource" in entry else None,
+        packages={kind: list(names) for kind, names in packages.items()},
+        post=entry.get("post"),
+        before_packages=entry.get("before_packages", False),
+        always_run=entry.get("always_run", False),
+    )
+
+
+def parse_catalog(data, source=CATALOG_PATH):
+    """Turns the parsed TOML into headers and InstallItems, validating every entry."""
+    tabs = data.get("tab")
+    if not isinstance(tabs, list):
+        raise CatalogError(f"{source}: no [[tab]] tables")
+    entries = []
+    seen_ids = set()
+    for tab_number, tab in enumerate(tabs, 1):
+        if not isinstance(tab, dict):
+            raise CatalogError(f"{source}: tab {tab_number} must be a [[tab]] table")
+        if not isinstance(tab.get("name"), str):
+            raise CatalogError(f"{source}: tab {tab_number} has no name")
+        entries.append(CatalogHeader(tab["name"]))
+        items = tab.get("item", [])
+        if not isinstance(items, list):
+            raise CatalogError(f"{source}: tab '{tab['name']}': 'item' must be [[tab.item]] tables")
+        for item_number, entry in enumerate(items, 1):
+            if not isinstance(entry, dict):
+                raise CatalogError(f"{source}: tab '{tab['name']}', item {item_number} must be a table")
+            where = f"{source}: tab '{tab['name']}', item {entry.get('id', item_number)!r}"
+            item = _parse_item(entry, where)
+            if item.id in seen_ids:
+                raise CatalogError(f"{where}: duplicate id")
+            seen_ids.add(item.id)
+            entries.append(item)
+
+    for item in entries:
+        if isinstance(item, InstallItem):
+            for dep in item.depends_on + item.conflicts:
+                if dep not in seen_ids:
+                    raise CatalogError(f"{source}: item '{item.id}' refers to unknown item '{dep}'")
+    return entries
+
+
+# -------------------------------------------------------
+# Loading & Cache
+# -------------------------------------------------------
+def _cache_path(path, repo_dir):
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    key = hashlib.sha256(f"{os.path.abspath(path)}\0{repo_dir}".encode()).hexdigest()[:16]
+    return os.path.join(cache_home, "az-arch-hyprland", f"install-catalog-{key}.pickle")
+
+
+def _load_cached(cache_path, stamp):
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, entries = pickle.load(f)
+    except Exception:
+        return None  # missing, stale format or unreadable: parse again
+    return entries if cached_stamp == stamp else None
+
+
+def _store_cached(cache_path, stamp, entries):
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), prefix=".install-catalog-")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((stamp, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass  # the cache is only an optimisation
+
+
+def load_catalog(repo_dir, path=CATALOG_PATH, use_cache=True):
+    """Returns the catalog's headers and InstallItems, with {repo_dir} filled in.
+
+    The validated result is cached in ~/.cache keyed by the file's mtime and
+    size, so unchanged catalogs are not parsed or validated again.
+    """
+    try:
+        info = os.stat(path)
+    except OSError as e:
+        raise CatalogError(f"Cannot read install catalog {path}: {e}") from None
+    stamp = (CATALOG_FORMAT, info.st_mtime_ns, info.st_size)
+    cache_path = _cache_path(path, repo_dir)
+    if use_cache:
+        entries = _load_cached(cache_path, stamp)
+        if entries is not None:
+            return entries
+
+    import tomllib  # only needed when the cache is stale
+
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
+        raise CatalogError(f"{path}: {e}") from None
+    entries = parse_catalog(data, path)
+    for item in entries:
+        if isinstance(item, InstallItem):
+            item.func = item.func.replace("{repo_dir}", repo_dir)
+            if item.post:
+                item.post = item.post.replace("{repo_dir}", repo_dir)
+    if use_cache:
+        _store_cached(cache_path, stamp, entries)
+    return entries
+
+
 def get_install_items(repo_dir):
-    """Returns a list of dictionaries representing the installation items."""
-    return [
-        {"type": "header", "text": "--- Core ---"},
-        {
-            "type": "essential",
-            "text": "Install paru (AUR Helper)",
-            "func": "install_paru",
-            "group": "Package Managers",
-            "description": "Installs paru, an AUR helper that simplifies installing and managing packages from the Arch User Repository.",
-        },
-        {
-            "type": "essential",
-            "text": "Install rate-mirrors and Rank Mirrors",
-            "func": "install_rate_mirrors_and_rank",
-            "group": "System Optimization",
-            "description": "Installs rate-mirrors and then runs the script to rank Arch Linux mirrors for optimal performance.",
-        },
-
-        {
-            "type": "essential",
-            "text": "Install Chaotic AUR",
-            "func": f"bash {repo_dir}/cli/install_chaotic_aur.sh",
-            "group": "Package Managers",
-            "description": "Installs the Chaotic-AUR repository, providing a large collection of pre-built AUR packages.",
-        },
-        {
-            "type": "essential",
-            "text": "Set up Git Credential Management",
-            "func": "setup_git_credential_management",
-            "group": "Git Credentials",
-            "description": "Sets up Git Credential Manager to securely store and manage Git credentials.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Fish Shell",
-            "func": "install_fish",
-            "group": "Shell (Fish)",
-            "description": "Installs the Fish shell, a smart and user-friendly command line shell.",
-        },
-        {
-            "type": "essential",
-            "text": "Install end-4's Hyprland Dots",
-            "func": "install_end4_hyprland_dots",
-            "group": "Hyprland Core",
-            "description": "Installs the core Hyprland configuration files and dependencies from end-4.",
-        },
-        {
-            "type": "essential",
-            "text": "Load all configurations (GPU, cursor, etc)",
-            "func": f"bash {repo_dir}/cli/load_configs.sh",
-            "group": "Hyprland Configuration",
-            "description": "Loads and applies various system configurations, including GPU settings, cursor themes, and other dotfiles.",
-        },
-        {
-            "type": "essential",
-            "text": "Install and Run nwg-displays",
-            "func": "install_nwg_displays",
-            "group": "Hyprland Utilities",
-            "description": "Installs and runs nwg-displays, a small utility for managing displays in Wayland compositors like Hyprland.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Ulauncher",
-            "func": "install_ulauncher",
-            "group": "Application Launcher",
-            "description": "Installs Ulauncher, a fast application launcher for Linux.",
-        },
-        {
-            "type": "essential",
-            "text": "Adjust GRUB menu resolution",
-            "func": "adjust_grub_menu",
-            "group": "Bootloader (GRUB)",
-            "description": "Adjusts the resolution of the GRUB boot menu for better display compatibility.",
-        },
-        {
-            "type": "essential",
-            "text": "Enable os-prober for GRUB",
-            "func": "enable_os_prober",
-            "group": "Bootloader (GRUB)",
-            "description": "Enables os-prober in GRUB to detect and list other operating systems installed on the machine.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Linux Headers",
-            "func": "install_linux_headers",
-            "group": "System Kernel",
-            "description": "Installs essential Linux kernel headers for building modules and other system components.",
-        },
-        {
-            "type": "optional",
-            "text": "Install NVIDIA Drivers (Proprietary)",
-            "func": "install_nvidia_drivers",
-            "group": "Graphics",
-            "description": "Installs NVIDIA drivers and utilities for better graphics performance.",
-        },
-        {
-            "type": "essential",
-            "text": "Install systemd-oomd.service",
-            "func": "install_systemd_oomd",
-            "group": "System Services",
-            "description": "Installs and enables systemd-oomd, a userspace OOM killer that can prevent system freezes under heavy memory pressure.",
-        },
-        {
-            "type": "essential",
-            "text": "Install ananicy-cpp",
-            "func": "install_ananicy_cpp",
-            "group": "System Optimization",
-            "description": "Installs ananicy-cpp, a C++ port of ananicy, which automatically adjusts process nice values and I/O priorities for better system responsiveness.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Mission Center",
-            "func": "install_mission_center",
-            "group": "System Monitoring",
-            "description": "Installs Mission Center, a modern and fast system monitor for Linux.",
-        },
-        {
-            "type": "essential",
-            "text": "Install jq",
-            "func": "install_jq",
-            "group": "CLI Utilities",
-            "description": "Installs jq, a lightweight and flexible command-line JSON processor.",
-        },
-        {
-            "type": "essential",
-            "text": "Install xorg-xhost and set root access",
-            "func": "install_xorg_xhost_and_xhost_rule",
-            "group": "Hyprland Core",
-            "description": "Installs xorg-xhost for X server access control and sets a rule to allow root to connect to the X server.",
-        },
-        {"type": "header", "text": "--- Package Management ---"},
-        {
-            "type": "essential",
-            "text": "Install Flatpak",
-            "func": "install_flatpak",
-            "group": "Package Managers",
-            "description": "Installs Flatpak, a universal packaging system for Linux applications, providing sandboxed environments.",
-        },
-        {
-            "type": "essential",
-            "text": "Install `downgrade` utility",
-            "func": "install_downgrade",
-            "group": "Package Managers",
-            "description": "Installs `downgrade`, a utility to downgrade one or more packages to a version in your cache or from the Arch Linux Archive.",
-        },
-        {
-            "type": "optional",
-            "text": "Install npm",
-            "func": "install_npm",
-            "group": "Development Runtimes",
-            "description": "Installs npm (Node Package Manager), a package manager for JavaScript.",
-        },
-        {
-            "type": "optional",
-            "text": "Install pnpm",
-            "func": "install_pnpm",
-            "group": "Development Runtimes",
-            "description": "Installs pnpm, a fast, disk-space efficient package manager for Node.js.",
-        },
-        {"type": "header", "text": "--- System ---"},
-        {
-            "type": "essential",
-            "text": "Install inotify-tools",
-            "func": "install_inotify_tools",
-            "group": "System Monitoring",
-            "description": "Installs inotify-tools, a set of command-line programs for monitoring filesystem events.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Power Options (TLP)",
-            "func": "install_power_options",
-            "group": "Power Management",
-            "description": "Installs TLP, an advanced power management tool for Linux, optimized for laptops to save battery power.",
-        },
-        {
-            "type": "essential",
-            "text": "Install FUSE",
-            "func": "install_fuse",
-            "group": "System Libraries",
-            "description": "Installs FUSE (Filesystem in Userspace), allowing non-privileged users to create their own file systems.",
-        },
-        {
-            "type": "essential",
-            "text": "Install NTFS-3G (NTFS Filesystem Driver)",
-            "func": "install_ntfs_3g",
-            "group": "System Libraries",
-            "description": "Installs NTFS-3G, a free and open-source implementation of the NTFS filesystem that allows Linux to read and write to NTFS partitions.",
-        },
-        {"type": "header", "text": "--- Desktop & Theming ---"},
-        {
-            "type": "essential",
-            "text": "Install nwg-look",
-            "func": "install_nwg_look",
-            "group": "Hyprland Utilities",
-            "description": "Installs nwg-look, a GTK settings editor for Wayland.",
-        },
-        {
-            "type": "essential",
-            "text": "Install qt5ct",
-            "func": "install_qt5ct",
-            "group": "Qt Theming",
-            "description": "Installs qt5ct, a tool to configure Qt5 application appearance.",
-        },
-        {
-            "type": "essential",
-            "text": "Install qt6ct",
-            "func": "install_qt6ct",
-            "group": "Qt Theming",
-            "description": "Installs qt6ct, a tool to configure Qt6 application appearance.",
-        },
-        {
-            "type": "essential",
-            "text": "Install SDDM Astronaut Theme",
-            "func": "install_sddm_theme",
-            "group": "Login Manager (SDDM)",
-            "description": "Installs the Astronaut theme for SDDM, the Simple Desktop Display Manager.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Catppuccin Theme for GRUB",
-            "func": "select_and_install_catppuccin_grub_theme",
-            "group": "Bootloader (GRUB)",
-            "description": "Installs the Catppuccin theme for GRUB, enhancing the bootloader's appearance.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Catppuccin Fish Theme",
-            "func": "install_catppuccin_fish_theme",
-            "group": "Shell (Fish)",
-            "description": "Installs the Catppuccin theme for the Fish shell, providing a visually pleasing command-line experience.",
-        },
-        {"type": "header", "text": "--- Applications ---"},
-        {
-            "type": "essential",
-            "text": "Install Rofi",
-            "func": "install_rofi",
-            "group": "Application Launcher",
-            "description": "Installs Rofi, a window switcher, application launcher, and dmenu replacement.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Ulauncher Catppuccin Theme",
-            "func": "install_ulauncher_catppuccin_theme",
-            "group": "Application Launcher",
-            "description": "Installs the Catppuccin theme for Ulauncher.",
-        },
-        {
-            "type": "optional",
-            "text": "Install VS Code Insiders",
-            "func": "install_vscode_insiders",
-            "group": "Development Tools",
-            "description": "Installs VS Code Insiders, the daily updated version of Visual Studio Code with the latest features.",
-        },
-        {
-            "type": "essential",
-            "text": "Fix VSCode Insiders permissions",
-            "func": "fix_vscode_permissions",
-            "group": "Development Tools",
-            "description": "Fixes permissions for VS Code Insiders to ensure proper functionality.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Discord",
-            "func": "install_discord",
-            "group": "Communication",
-            "description": "Installs the official Discord client.",
-        },
-        {
-            "type": "optional",
-            "text": "Install Vencord (Discord Mod)",
-            "func": "install_vencord",
-            "group": "Communication",
-            "description": "Installs the Vencord mod for Discord.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Steam",
-            "func": "install_steam",
-            "group": "Gaming",
-            "description": "Installs Steam, the popular digital distribution platform for video games.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Pinta",
-            "func": "install_pinta",
-            "group": "Graphics & Media",
-            "description": "Installs Pinta, a free, open-source drawing/editing program.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Nomacs",
-            "func": "install_nomacs",
-            "group": "Graphics & Media",
-            "description": "Installs Nomacs, a fast and easy-to-use image viewer.",
-        },
-        {
-            "type": "essential",
-            "text": "Install YouTube Music",
-            "func": "install_youtube_music",
-            "group": "Graphics & Media",
-            "description": "Installs YouTube Music as a standalone application.",
-        },
-        {
-            "type": "optional",
-            "text": "Install HandBrake",
-            "func": "install_handbrake",
-            "group": "Graphics & Media",
-            "description": "Installs HandBrake, a free and open-source video transcoder.",
-        },
-        {
-            "type": "optional",
-            "text": "Install EasyEffects",
-            "func": "install_easyeffects",
-            "group": "Audio",
-            "description": "Installs EasyEffects, a PulseAudio/PipeWire application for applying audio effects.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Pavucontrol-Qt",
-            "func": "install_pavucontrol",
-            "group": "Audio",
-            "description": "Installs Pavucontrol, a simple GTK based volume control tool for PulseAudio.",
-        },
-        {
-            "type": "optional",
-            "text": "Install Microsoft Edge (Dev)",
-            "func": "install_ms_edge",
-            "group": "Web Browsers",
-            "description": "Installs the Microsoft Edge (Dev) browser.",
-        },
-        {
-            "type": "optional",
-            "text": "Install Zen Browser",
-            "func": "install_zen_browser",
-            "group": "Web Browsers",
-            "description": "Installs Zen Browser, a privacy-focused web browser.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Switcheroo",
-            "func": "install_switcheroo",
-            "group": "General Utilities",
-            "description": "Installs Switcheroo, a simple application switcher for Wayland.",
-        },
-        {
-            "type": "essential",
-            "text": "Install BleachBit",
-            "func": "install_bleachbit",
-            "group": "System Cleanup",
-            "description": "Installs BleachBit, a system cleaner to free up disk space and maintain privacy.",
-        },
-        {
-            "type": "essential",
-            "text": "Install QDirStat",
-            "func": "install_qdirstat",
-            "group": "Disk Usage",
-            "description": "Installs QDirStat, a graphical disk usage display.",
-        },
-        {
-            "type": "essential",
-            "text": "Install GParted (Partition Editor)",
-            "func": "install_gparted",
-            "group": "System Utilities",
-            "description": "Installs GParted, a graphical partition editor for creating, reorganizing, and deleting disk partitions.",
-        },
-        {
-            "type": "essential",
-            "text": "Install Flatseal",
-            "func": "install_flatseal",
-            "group": "Flatpak Management",
-            "description": "Installs Flatseal, a graphical utility to review and modify permissions for your Flatpak applications.",
-        },
-        {
-            "type": "optional",
-            "text": "Install rclone",
-            "func": "install_rclone",
-            "group": "Cloud Storage",
-            "description": "Installs rclone, a command-line program to manage files on cloud storage.",
-        },
-        {
-            "type": "optional",
-            "text": "Setup Google Drive with rclone",
-            "func": "setup_rclone_gdrive",
-            "group": "Cloud Storage",
-            "description": "Sets up Google Drive integration with rclone for cloud storage synchronization.",
-        },
-        {
-            "type": "optional",
-            "text": "Install Waydroid",
-            "func": "install_waydroid",
-            "group": "Android Emulation",
-            "description": "Installs Waydroid, a container-based approach to boot a full Android system on a Linux device.",
-        },
-        {
-            "type": "optional",
-            "text": "Install Waydroid Helper",
-            "func": "install_waydroid_helper",
-            "group": "Android Emulation",
-            "description": "Installs Waydroid Helper, a utility to simplify Waydroid management.",
-        },
-        {
-            "type": "optional",
-            "text": "Install Waydroid Extra Script",
-            "func": "install_waydroid_extra_script",
-            "group": "Android Emulation",
-            "description": "Installs the Waydroid Extra Script for enhanced Waydroid management.",
-        },
-        {
-            "type": "optional",
-            "text": "Install Virtualization (libvirt, virt-manager, QEMU)",
-            "func": "install_virt_packages",
-            "group": "Virtualization",
-            "description": "Installs essential virtualization tools including libvirt, virt-manager, QEMU, dnsmasq, and dmidecode, and enables the libvirtd service.",
-        },
-        {
-            "type": "optional",
-            "text": "Install Fisher",
-            "func": "install_fisher",
-            "group": "CLI Utilities",
-            "description": "Installs Fisher, a plugin manager for the Fish shell.",
-        },
-        {
-            "type": "optional",
-            "text": "Install Gemini CLI",
-            "func": "install_gemini_cli",
-            "group": "CLI Utilities",
-            "description": "Installs the Google Gemini CLI for interacting with Gemini models.",
-        },
-        {
-            "type": "optional",
-            "text": "Install gcalcli",
-            "func": "install_gcalcli",
-            "group": "CLI Utilities",
-            "description": "Installs gcalcli, a command-line tool for Google Calendar.",
-        },
-        {"type": "header", "text": "--- Hardware & Peripherals ---"},
-        {
-            "type": "optional",
-            "text": "Install v4l2loopback (for Droidcam/OBS)",
-            "func": "install_v4l2loopback",
-            "group": "Drivers & Modules",
-            "description": "Installs v4l2loopback, a kernel module that creates virtual video devices, useful for Droidcam or OBS.",
-        },
-        {
-            "type": "optional",
-            "text": "Install Droidcam",
-            "func": "install_droidcam",
-            "group": "Webcam",
-            "description": "Installs Droidcam, allowing you to use your Android phone as a webcam.",
-        },
-        {
-            "type": "optional",
-            "text": "Install MX002 Tablet Driver",
-            "func": "install_mx002_driver",
-            "group": "Drivers & Modules",
-            "description": "Installs the necessary drivers for MX002 series drawing tablets.",
-        },
-        {
-            "type": "essential",
-            "text": "Install CoolerControl",
-            "func": "install_coolercontrol",
-            "group": "Hardware Control",
-            "description": "Installs CoolerControl, a GUI application for controlling fan speeds and RGB lighting on various liquid coolers.",
-        },
-        {
-            "type": "optional",
-            "text": "Install Linux Wallpaper Engine",
-            "func": "install_wallpaper_engine",
-            "group": "Wallpaper Engine",
-            "description": "Installs Linux Wallpaper Engine, a port of the popular Wallpaper Engine for Linux.",
-        },
-        {
-            "type": "optional",
-            "text": "Install Linux Wallpaper Engine GUI",
-            "func": "install_wallpaper_engine_gui_manual",
-            "group": "Wallpaper Engine",
-            "description": "Provides instructions for manually installing the GUI for Linux Wallpaper Engine.",
-        },
-    ]
+    """Returns the catalog as a list of CatalogHeader and InstallItem entries."""
+    return load_catalog(repo_dir)
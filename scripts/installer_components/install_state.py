@@ -0,0 +1,184 @@
+import os
+import json
+import time
+import shlex
+import hashlib
+import tempfile
+import subprocess
+
+from installer_components.scheduler import module_prelude
+
+STATE_VERSION = 1
+
+
+def state_dir():
+    state_home = os.environ.get("XDG_STATE_HOME") or os.path.expanduser("~/.local/state")
+    return os.path.join(state_home, "az-arch-hyprland")
+
+
+def default_state_path():
+    return os.path.join(state_dir(), "install-state.json")
+
+
+# -------------------------------------------------------
+# Probing the System
+# -------------------------------------------------------
+def _run_lines(command):
+    try:
+        result = subprocess.run(command, capture_output=True, text=True)
+    except OSError:
+        return []
+    return result.stdout.splitlines() if result.returncode == 0 else []
+
+
+def installed_versions():
+    """Returns {name: version} for installed pacman packages and Flatpak apps."""
+    versions = {}
+    for line in _run_lines(["pacman", "-Q"]):
+        name, _, version = line.partition(" ")
+        versions[name] = version
+    for line in _run_lines(["flatpak", "list", "--columns=application,version"]):
+        name, _, version = line.partition("\t")
+        versions[name] = version or "installed"
+    return versions
+
+
+def command_sources(repo_dir, commands):
+    """Returns {command: source text} for what each install command runs.
+
+    For a shell function that is its `declare -f` body; for `bash <script>`
+    the script's contents. All functions are read from a single bash.
+    """
+    sources = {}
+    functions = {}  # command -> function name
+    for command in commands:
+        words = shlex.split(command)
+        if not words:
+            continue
+        if words[0] == "bash" and len(words) > 1:
+            try:
+                with open(words[1], encoding="utf-8", errors="replace") as f:
+                    sources[command] = f.read()
+            except OSError:
+                sources[command] = None
+        else:
+            functions[command] = words[0]
+
+    if functions:
+        script = module_prelude(repo_dir) + (
+            'for name in "$@"; do printf "%s\\0" "$name"; declare -f "$name"; printf "\\0"; done'
+        )
+        try:
+            output = subprocess.run(
+                ["bash", "-c", script, "bash", *sorted(set(functions.values()))],
+                capture_output=True,
+                text=True,
+            ).stdout
+        except OSError:
+            output = ""
+        fields = output.split("\0")
+        bodies = dict(zip(fields[0::2], fields[1::2]))
+        for command, name in functions.items():
+            sources[command] = bodies.get(name) or None
+    return sources
+
+
+def step_command(item):
+    """The command a run executes for an item: its post step, func, or nothing."""
+    if item.packages:
+        return item.post
+    return item.func
+
+
+def item_packages(item):
+    return [name for names in item.packages.values() for name in names]
+
+
+def item_inputs(item, sources, versions):
+    """Hashes everything an item's result depends on."""
+    command = step_command(item)
+    inputs = {
+        "command": command,
+        "source": sources.get(command) if command else None,
+        "packages": {name: versions.get(name) for name in item_packages(item)},
+    }
+    canonical = json.dumps(inputs, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# -------------------------------------------------------
+# State Store
+# -------------------------------------------------------
+class InstallState:
+    """Remembers which items were installed, and with which inputs, across runs.
+
+    An item counts as satisfied when all of its declared packages are installed
+    and, if it runs a command, that command last succeeded with the same inputs
+    (function body, script contents and package versions) as now. Items
+    marked always_run, and items that prompt the user, are never satisfied.
+    """
+
+    def __init__(self, repo_dir, path=None):
+        self.repo_dir = repo_dir
+        self.path = path or default_state_path()
+        self.items = {}
+        self.versions = {}
+        self.sources = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == STATE_VERSION:
+            self.items = data.get("items", {})
+
+    def probe(self, items):
+        """Reads installed package versions and command sources for the given items."""
+        self.versions = installed_versions()
+        commands = [command for command in map(step_command, items) if command]
+        self.sources = command_sources(self.repo_dir, commands)
+
+    def inputs(self, item):
+        return item_inputs(item, self.sources, self.versions)
+
+    def missing_packages(self, item):
+        return [name for name in item_packages(item) if name not in self.versions]
+
+    def is_satisfied(self, item):
+        if item.always_run or "terminal" in (item.resource or ()):
+            return False  # their result depends on more than the inputs hash covers
+        if self.missing_packages(item):
+            return False
+        if not step_command(item):
+            return True
+        if self.sources.get(step_command(item)) is None:
+            return False  # cannot tell what would run, so never skip it
+        record = self.items.get(item.id)
+        return (
+            record is not None
+            and record.get("status") == "ok"
+            and record.get("inputs") == self.inputs(item)
+        )
+
+    def record(self, item, status):
+        self.items[item.id] = {
+            "inputs": self.inputs(item),
+            "status": status,
+            "time": int(time.time()),
+        }
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".install-state-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": STATE_VERSION, "items": self.items}, f, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
@@ -6,76 +6,120 @@ class InstallerCore:
         self.repo_dir = repo_dir
         self.installation_items = []
         self.selected_item_funcs = set()
+        # Checkable items in catalog order, plus id -> item and id -> position lookups
+        self._checkable_items = []
+        self._items_by_id = {}
+        self._positions = {}
+        # One byte per checkable item, in catalog order
+        self._selection = bytearray()
+        self._selected_commands = None
+        self.satisfied_ids = set()
         self._load_installation_items()
 
     def _load_installation_items(self):
-        # Load items from install_data.py
-        raw_items = get_install_items(self.repo_dir)
-        
-        # Process raw items to include a unique identifier and initial selection state
-        # We'll use the index as a temporary unique ID for now, or func if it's unique
-        for i, item in enumerate(raw_items):
-            if item["type"] != "header":
-                item["_id"] = item.get("func", f"item_{i}") # Use func as ID if available, else index
-                item["is_selected"] = False # Initial state
+        # Load items from install_data.toml (validated, and cached by its mtime)
+        for item in get_install_items(self.repo_dir):
+            if item.type != "header":
+                self._positions[item.id] = len(self._checkable_items)
+                self._items_by_id[item.id] = item
+                self._checkable_items.append(item)
             self.installation_items.append(item)
+        self._selection = bytearray(len(self._checkable_items))
+
+    def _set_selected(self, position, is_selected):
+        """Updates one item's bit and func entry. Returns True if it changed."""
+        if self._selection[position] == is_selected:
+            return False
+        item = self._checkable_items[position]
+        self._selection[position] = is_selected
+        if is_selected:
+            self.selected_item_funcs.add(item.func)
+        else:
+            self.selected_item_funcs.discard(item.func)
+        self._selected_commands = None
+        return True
+
+    def _apply_selection(self, should_select):
+        """Sets every checkable item to should_select(item) in a single pass.
+
+        Returns the IDs of the items whose state changed, in catalog order.
+        """
+        changed_ids = []
+        for position, item in enumerate(self._checkable_items):
+            if self._set_selected(position, bool(should_select(item))):
+                changed_ids.append(item.id)
+        return changed_ids
+
+    def refresh_install_state(self):
+        """Finds the items that an install run would skip as already satisfied."""
+        # Imported here: only the runners and the GUI's deferred refresh need it
+        from installer_components.install_state import InstallState
+
+        state = InstallState(self.repo_dir)
+        state.probe(self._checkable_items)
+        self.satisfied_ids = {
+            item.id for item in self._checkable_items if state.is_satisfied(item)
+        }
+        return self.satisfied_ids
 
     def get_display_items(self):
-        """Returns items suitable for display in the GUI, including their selection state."""
+        """Returns the catalog's headers and items, in order, for display in the GUI."""
         return self.installation_items
 
+    def is_selected(self, item_id):
+        """Returns whether the item with the given ID is selected."""
+        position = self._positions.get(item_id)
+        if position is None:
+            raise ValueError(f"Item with ID {item_id} not found.")
+        return bool(self._selection[position])
+
+    def get_item(self, item_id):
+        """Returns the item with the given ID."""
+        try:
+            return self._items_by_id[item_id]
+        except KeyError:
+            raise ValueError(f"Item with ID {item_id} not found.") from None
+
     def update_item_selection(self, item_id, is_selected):
-        """Updates the selection state of a specific item by its ID."""
-        for item in self.installation_items:
-            if item.get("_id") == item_id:
-                item["is_selected"] = is_selected
-                if is_selected:
-                    if "func" in item:
-                        self.selected_item_funcs.add(item["func"])
-                else:
-                    if "func" in item and item["func"] in self.selected_item_funcs:
-                        self.selected_item_funcs.remove(item["func"])
-                return
-        raise ValueError(f"Item with ID {item_id} not found.")
+        """Updates the selection state of a specific item by its ID. Returns the changed IDs."""
+        position = self._positions.get(item_id)
+        if position is None:
+            raise ValueError(f"Item with ID {item_id} not found.")
+        return [item_id] if self._set_selected(position, bool(is_selected)) else []
 
     def select_all(self):
-        """Selects all checkable installation items."""
-        for item in self.installation_items:
-            if item["type"] != "header":
-                item["is_selected"] = True
-                if "func" in item:
-                    self.selected_item_funcs.add(item["func"])
+        """Selects all checkable installation items. Returns the changed IDs."""
+        return self._apply_selection(lambda item: True)
 
     def deselect_all(self):
-        """Deselects all checkable installation items."""
-        for item in self.installation_items:
-            if item["type"] != "header":
-                item["is_selected"] = False
-        self.selected_item_funcs.clear()
+        """Deselects all checkable installation items. Returns the changed IDs."""
+        return self._apply_selection(lambda item: False)
 
     def select_essential(self):
-        """Selects essential installation items (type 'essential')."""
-        self.deselect_all() # Start fresh
-        for item in self.installation_items:
-            if item.get("type") == "essential":
-                item["is_selected"] = True
-                if "func" in item:
-                    self.selected_item_funcs.add(item["func"])
+        """Selects essential installation items (type 'essential'). Returns the changed IDs."""
+        return self._apply_selection(lambda item: item.type == "essential")
 
     def select_essential_laptop(self):
-        """Selects essential and essential_laptop installation items."""
-        self.deselect_all() # Start fresh
-        for item in self.installation_items:
-            if item.get("type") in ["essential", "essential_laptop"]:
-                item["is_selected"] = True
-                if "func" in item:
-                    self.selected_item_funcs.add(item["func"])
+        """Selects essential and essential_laptop installation items. Returns the changed IDs."""
+        return self._apply_selection(
+            lambda item: item.type in ("essential", "essential_laptop")
+        )
 
     def get_selected_commands(self):
         """Returns an ordered list of 'func' strings for all currently selected items."""
-        ordered_commands = []
-        # Maintain order as defined in install_data.py
-        for item_data in self.installation_items:
-            if item_data.get("is_selected") and "func" in item_data:
-                ordered_commands.append(item_data["func"])
-        return ordered_commands
+        # Maintain order as defined in install_data.toml; cached until the selection changes
+        if self._selected_commands is None:
+            self._selected_commands = [
+                item.func
+                for item, selected in zip(self._checkable_items, self._selection)
+                if selected
+            ]
+        return list(self._selected_commands)
+
+    def get_selected_ids(self):
+        """Returns the IDs of all currently selected items, in catalog order."""
+        return [
+            item.id
+            for item, selected in zip(self._checkable_items, self._selection)
+            if selected
+        ]
@@ -0,0 +1,172 @@
+import os
+import shutil
+import threading
+import subprocess
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+PREFETCH_JOBS = 3
+# Read by install_pacman_packages/install_paru_packages in helpers.sh
+CACHE_ENV = "AZ_PREFETCH_CACHE"
+DOWNLOAD_TIMEOUT = 60
+
+
+def prefetch_dir():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "az-arch-hyprland", "prefetch-pkg")
+
+
+def _paru_config_paths():
+    config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    return (os.path.join(config_home, "paru", "paru.conf"), "/etc/paru.conf")
+
+
+def paru_clone_dir():
+    """paru's CloneDir: from paru.conf (user config first), else its default."""
+    for config_path in _paru_config_paths():
+        try:
+            with open(config_path, encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    key, _, value = line.partition("=")
+                    if key.strip() == "CloneDir" and value.strip():
+                        return os.path.expanduser(os.path.expandvars(value.strip()))
+        except OSError:
+            continue
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "paru", "clone")
+
+
+def _lines(command, cwd=None):
+    try:
+        result = subprocess.run(
+            command, capture_output=True, text=True, stdin=subprocess.DEVNULL, cwd=cwd
+        )
+    except OSError:
+        return None
+    return result.stdout.split() if result.returncode == 0 else None
+
+
+# -------------------------------------------------------
+# Prefetcher
+# -------------------------------------------------------
+class Prefetcher:
+    """Downloads the packages of the planned package batches in the background.
+
+    Repo packages (and their missing dependencies) are resolved with one
+    `pacman -Sp`, which needs neither root nor the database lock, and
+    downloaded into prefetch_dir(); the install helpers add that directory as
+    an extra pacman cache. AUR packages are cloned into paru's clone directory
+    and their sources fetched with `makepkg --verifysource`, so paru only has
+    to build. Nothing here is required: whatever is not ready when a step
+    runs is simply downloaded by that step as before. The AUR batch must not
+    start while its clones are still being fetched, since both work in the
+    same directories; wait_aur() blocks until they are done.
+    """
+
+    def __init__(self, steps, directory=None, jobs=PREFETCH_JOBS):
+        self.directory = directory or prefetch_dir()
+        self.jobs = max(1, jobs)
+        self.packages = {}  # kind -> names
+        for step in steps:
+            for kind, name in step.packages:
+                self.packages.setdefault(kind, []).append(name)
+        self.downloaded = 0
+        self.downloaded_bytes = 0
+        self.errors = []
+        self._lock = threading.Lock()
+        self._thread = None
+        self._aur_done = threading.Event()
+        self._aur_done.set()
+
+    def start(self):
+        """Starts prefetching; returns False if there is nothing to fetch."""
+        if not (self.packages.get("pacman") or self.packages.get("aur")):
+            return False
+        os.makedirs(self.directory, exist_ok=True)
+        if self.packages.get("aur"):
+            self._aur_done.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return True
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def wait_aur(self):
+        """Blocks until the AUR clones and source downloads are finished."""
+        self._aur_done.wait()
+
+    def cleanup(self):
+        """Removes the downloaded packages once the run no longer needs them."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _run(self):
+        try:
+            self._fetch_all()
+        finally:
+            self._aur_done.set()
+
+    def _fetch_all(self):
+        sync_names = set(_lines(["pacman", "-Slq"]) or ())
+        repo = [n for n in self.packages.get("pacman", []) if n in sync_names]
+        # Packages installed through paru may still come from the repos
+        repo += [n for n in self.packages.get("aur", []) if n in sync_names]
+        aur = [n for n in self.packages.get("aur", []) if n not in sync_names]
+
+        urls = []
+        if repo:
+            urls = _lines(["pacman", "-Sp", "--needed", "--print-format", "%l", *repo])
+            if urls is None:
+                self._error("pacman -Sp could not resolve the repo packages")
+                urls = []
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            for url in urls:
+                pool.submit(self._download, url)
+            if aur and shutil.which("paru"):
+                aur_fetches = [pool.submit(self._fetch_aur, name) for name in aur]
+                for future in aur_fetches:
+                    future.exception()  # waits; _fetch_aur records its own errors
+                # The AUR batch may start now, even if repo downloads continue
+                self._aur_done.set()
+
+    def _error(self, message):
+        with self._lock:
+            self.errors.append(message)
+
+    def _download(self, url):
+        if not url.startswith(("http://", "https://")):
+            return
+        filename = os.path.basename(url)
+        target = os.path.join(self.directory, filename)
+        if os.path.exists(target) or os.path.exists(os.path.join("/var/cache/pacman/pkg", filename)):
+            return
+        partial = target + ".part"
+        try:
+            with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response, open(partial, "wb") as f:
+                shutil.copyfileobj(response, f, 1 << 20)
+            size = os.path.getsize(partial)
+            os.replace(partial, target)
+        except OSError as e:
+            if os.path.exists(partial):
+                os.remove(partial)
+            self._error(f"{filename}: {e}")
+            return
+        with self._lock:
+            self.downloaded += 1
+            self.downloaded_bytes += size
+
+    def _fetch_aur(self, name):
+        clone_dir = paru_clone_dir()
+        os.makedirs(clone_dir, exist_ok=True)
+        package_dir = os.path.join(clone_dir, name)
+        if not os.path.isdir(package_dir) and _lines(["paru", "-G", name], cwd=clone_dir) is None:
+            self._error(f"{name}: could not clone from the AUR")
+            return
+        if not os.path.isfile(os.path.join(package_dir, "PKGBUILD")):
+            return  # split package cloned under its pkgbase; paru fetches it itself
+        if _lines(["makepkg", "--verifysource", "--noconfirm"], cwd=package_dir) is None:
+            self._error(f"{name}: could not download its sources")
+            return
+        with self._lock:
+            self.downloaded += 1
@@ -0,0 +1,178 @@
+import os
+import json
+import time
+import tempfile
+
+from installer_components.install_state import state_dir
+
+# Run logs kept in the history; older ones are deleted.
+MAX_RUN_LOGS = 50
+
+
+def runs_dir():
+    return os.path.join(state_dir(), "install-runs")
+
+
+def format_bytes(count):
+    if count is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB"):
+        if count < 1024:
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GiB"
+
+
+def format_seconds(seconds):
+    if seconds is None:
+        return "-"
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return f"{minutes}m{seconds:02d}s"
+
+
+# -------------------------------------------------------
+# Run Log
+# -------------------------------------------------------
+class RunLog:
+    """Collects per-step measurements of one run.
+
+    Feed it the scheduler's events through on_event; wall time, CPU time and
+    received bytes are summed over all attempts of a step.
+    """
+
+    def __init__(self, jobs, log_dir=None):
+        self.started = time.time()
+        self.jobs = jobs
+        self.log_dir = log_dir
+        self.steps = {}
+
+    def on_event(self, kind, step, result):
+        if kind != "finished":
+            return
+        entry = self._entry(step)
+        entry["wall"] += result.duration
+        entry["cpu"] += result.cpu_time
+        if result.received_bytes is not None:
+            entry["received_bytes"] = (entry["received_bytes"] or 0) + result.received_bytes
+        entry["attempts"] = result.attempt
+        entry["exit_code"] = result.exit_code
+
+    def _entry(self, step):
+        return self.steps.setdefault(
+            step.id,
+            {
+                "id": step.id,
+                "text": step.text,
+                "status": None,
+                "exit_code": None,
+                "attempts": 0,
+                "wall": 0.0,
+                "cpu": 0.0,
+                "received_bytes": None,
+            },
+        )
+
+    def finish(self, steps, results):
+        """Returns the run as a dict, with steps in catalog order."""
+        by_id = {step.id: step for step in steps}
+        for result in results:
+            self._entry(by_id[result.step_id])["status"] = result.status
+        return {
+            "started": self.started,
+            "duration": time.time() - self.started,
+            "jobs": self.jobs,
+            "log_dir": self.log_dir,
+            "steps": [self.steps[step.id] for step in steps if step.id in self.steps],
+        }
+
+
+def save_run(run, directory=None):
+    """Writes a run to <runs dir>/<start time>.json and prunes old runs. Returns the path."""
+    directory = directory or runs_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, time.strftime("%Y%m%d-%H%M%S", time.localtime(run["started"])) + ".json")
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".run-")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(run, f, indent=2)
+    os.replace(temp_path, path)
+    for old in sorted(name for name in os.listdir(directory) if name.endswith(".json"))[:-MAX_RUN_LOGS]:
+        os.remove(os.path.join(directory, old))
+    return path
+
+
+def load_runs(limit, directory=None):
+    """Returns up to `limit` most recent runs, oldest first."""
+    directory = directory or runs_dir()
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+    except OSError:
+        return []
+    runs = []
+    for name in names[-limit:]:
+        try:
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                runs.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return runs
+
+
+# -------------------------------------------------------
+# Tables
+# -------------------------------------------------------
+def _table(header, rows, left_columns=()):
+    """Aligns rows under the header; numbers right, left_columns and the last column left."""
+    rows = [[str(cell) for cell in row] for row in [header] + rows]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = []
+    for row in rows:
+        cells = [
+            cell.ljust(width) if i in left_columns or i == len(row) - 1 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ]
+        lines.append("  ".join(cells).rstrip())
+    return lines
+
+
+def summary_lines(run, slowest=5):
+    """The end-of-run table: one row per step, then the slowest steps."""
+    rows = [
+        [
+            entry["status"] or "-",
+            format_seconds(entry["wall"] if entry["attempts"] else None),
+            format_seconds(entry["cpu"] if entry["attempts"] else None),
+            format_bytes(entry["received_bytes"]),
+            entry["attempts"],
+            entry["text"],
+        ]
+        for entry in run["steps"]
+    ]
+    lines = _table(["status", "wall", "cpu", "received", "tries", "step"], rows, left_columns=(0,))
+    lines.append(f"Total: {format_seconds(run['duration'])} with up to {run['jobs']} steps at once")
+    ranked = sorted((e for e in run["steps"] if e["attempts"]), key=lambda e: e["wall"], reverse=True)
+    if ranked:
+        lines.append("Slowest: " + ", ".join(
+            f"{e['text']} ({format_seconds(e['wall'])})" for e in ranked[:slowest]
+        ))
+    return lines
+
+
+def history_lines(runs):
+    """Compares step wall times across runs, one column per run."""
+    if not runs:
+        return ["No recorded runs."]
+    texts = {}
+    walls = []  # per run: step id -> wall time
+    for run in runs:
+        walls.append({e["id"]: e["wall"] for e in run["steps"] if e["attempts"]})
+        for entry in run["steps"]:
+            texts.setdefault(entry["id"], entry["text"])
+    header = [time.strftime("%m-%d %H:%M", time.localtime(run["started"])) for run in runs]
+    rows = [
+        [format_seconds(run_walls.get(step_id)) for run_walls in walls] + [text]
+        for step_id, text in texts.items()
+    ]
+    rows.append([format_seconds(run["duration"]) for run in runs] + ["(whole run)"])
+    return _table(header + ["step"], rows)
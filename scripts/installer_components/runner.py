@@ -0,0 +1,134 @@
+import os
+import sys
+import time
+import threading
+import subprocess
+from dataclasses import replace
+
+from installer_components.scheduler import build_steps
+from installer_components.prefetch import CACHE_ENV, Prefetcher
+
+# sudo's default credential timeout is 5 minutes; refresh well before that.
+SUDO_KEEPALIVE_INTERVAL = 60
+
+
+def default_log_dir():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return os.path.join(cache_home, "az-arch-hyprland", "install-logs", stamp)
+
+
+# -------------------------------------------------------
+# sudo Keepalive
+# -------------------------------------------------------
+def start_sudo_keepalive(interactive=True):
+    """Gets sudo credentials once and keeps the ticket fresh in the background.
+
+    Steps running without the terminal cannot answer a password prompt, so the
+    cached credentials must not expire while they run. Without interactive,
+    only already cached or passwordless sudo is used. Returns an Event that
+    stops the refresh, or None if sudo could not be validated.
+    """
+    command = ["sudo", "-v"] if interactive else ["sudo", "-n", "-v"]
+    try:
+        if subprocess.run(command, stderr=None if interactive else subprocess.DEVNULL).returncode != 0:
+            return None
+    except OSError:
+        return None
+    stop = threading.Event()
+
+    def refresh():
+        while not stop.wait(SUDO_KEEPALIVE_INTERVAL):
+            subprocess.run(["sudo", "-n", "-v"], stderr=subprocess.DEVNULL)
+
+    threading.Thread(target=refresh, daemon=True).start()
+    return stop
+
+
+# -------------------------------------------------------
+# Planning & Recording a Run
+# -------------------------------------------------------
+def without_installed_packages(item, state):
+    """A copy of the item that only declares the packages still missing."""
+    if not item.packages:
+        return item
+    return replace(
+        item,
+        packages={
+            kind: [name for name in names if name not in state.versions]
+            for kind, names in item.packages.items()
+        },
+    )
+
+
+def plan_steps(items, state, force=False, batch_packages=True):
+    """Returns (steps, satisfied items) for a run of the given items.
+
+    Unless force, items the state reports as satisfied are left out and
+    packages that are already installed are dropped from the rest. Raises
+    ValueError for bad item metadata.
+    """
+    state.probe(items)
+    if force:
+        return build_steps(items, batch_packages=batch_packages), []
+    satisfied = [item for item in items if state.is_satisfied(item)]
+    satisfied_ids = {item.id for item in satisfied}
+    to_run = [
+        without_installed_packages(item, state)
+        for item in items
+        if item.id not in satisfied_ids
+    ]
+    return build_steps(to_run, batch_packages=batch_packages), satisfied
+
+
+def record_results(state, items, results):
+    """Stores the outcome of every item step, with the inputs it ran against."""
+    by_id = {item.id: item for item in items}
+    state.probe(items)  # package versions changed during the run
+    for result in results:
+        item = by_id.get(result.step_id)
+        if item is not None and result.status in ("ok", "failed"):
+            state.record(item, result.status)
+    try:
+        state.save()
+    except OSError as e:
+        print(f"Error: Could not save install state to {state.path}: {e}", file=sys.stderr)
+
+
+# -------------------------------------------------------
+# Prefetch
+# -------------------------------------------------------
+def start_prefetch(steps):
+    """Starts downloading the packages of the planned steps; returns the Prefetcher or None."""
+    prefetcher = Prefetcher(steps)
+    if not prefetcher.start():
+        return None
+    # Inherited by every step's bash; see _prefetch_cache_args in helpers.sh
+    os.environ[CACHE_ENV] = prefetcher.directory
+    return prefetcher
+
+
+def waiting_for_prefetch(run_step, prefetcher):
+    """Wraps run_step so a step that builds AUR packages waits for their prefetch.
+
+    The prefetch clones into paru's CloneDir and downloads sources there, the
+    same directories paru builds in, so the two must not overlap.
+    """
+    if prefetcher is None:
+        return run_step
+
+    def run(step, attempt):
+        if any(kind == "aur" for kind, _ in step.packages):
+            prefetcher.wait_aur()
+        return run_step(step, attempt)
+
+    return run
+
+
+def finish_prefetch(prefetcher, succeeded):
+    """Drops the prefetched packages after a successful run; keeps them for a retry otherwise."""
+    if prefetcher is None:
+        return
+    os.environ.pop(CACHE_ENV, None)
+    if succeeded:
+        prefetcher.cleanup()
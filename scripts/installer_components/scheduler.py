@@ -0,0 +1,370 @@
+import os
+import shlex
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+
+# Resource held by steps that talk to the user; they get the real terminal.
+TERMINAL = "terminal"
+DEFAULT_JOBS = 4
+# Package kind -> (batch helper in helpers.sh, label, resource it holds)
+PACKAGE_BATCHES = {
+    "pacman": ("install_pacman_packages", "repo packages", "pacman"),
+    "aur": ("install_paru_packages", "AUR packages", "pacman"),
+    "flatpak": ("install_flatpak_packages", "Flatpak apps", "flatpak"),
+}
+
+
+@dataclass
+class Step:
+    id: str
+    text: str
+    command: str
+    depends_on: tuple = ()
+    conflicts: tuple = ()
+    resources: frozenset = frozenset()
+    exclusive: bool = False
+    packages: tuple = ()  # (kind, name) pairs a package batch installs
+
+    @property
+    def interactive(self):
+        return self.exclusive or TERMINAL in self.resources
+
+
+@dataclass
+class StepResult:
+    step_id: str
+    exit_code: int
+    duration: float
+    attempt: int
+    log_path: str = None
+    status: str = "ok"  # ok, failed, ignored or skipped
+    cpu_time: float = 0.0  # user + system time of the step's processes
+    received_bytes: int = None  # system-wide, so it includes concurrent steps
+
+
+def _item_resources(item):
+    return frozenset(item.resource or ()), item.resource is None
+
+
+def build_steps(items, batch_packages=True):
+    """Turns the selected install items into Steps, keeping catalog order.
+
+    Dependencies on items that are not selected are dropped: depends_on only
+    orders steps, it never pulls extra items into the run. With batch_packages,
+    the packages that items declare as data are merged into one step per
+    package manager (placed where its first item was), and such items only
+    contribute their post step, if any.
+    """
+    selected_ids = {item.id for item in items}
+    declared = {item.id: item.packages if batch_packages else {} for item in items}
+
+    batches = {}  # kind -> ordered, de-duplicated package names
+    batch_members = {}
+    for item in items:
+        for kind, packages in declared[item.id].items():
+            if kind not in PACKAGE_BATCHES:
+                raise ValueError(f"Unknown package kind '{kind}' in item {item.id}")
+            if packages:
+                names = batches.setdefault(kind, [])
+                names.extend(p for p in packages if p not in names)
+                batch_members.setdefault(kind, []).append(item)
+
+    def batch_ids(item_id):
+        return [f"packages:{kind}" for kind in declared[item_id] if kind in batches]
+
+    with_post = {item.id for item in items if item.post}
+
+    def resolve(deps, for_batch=None):
+        """Maps item IDs to the steps that complete them.
+
+        A batch only waits for other items' packages, never for a post step:
+        that post step may itself be waiting for this batch.
+        """
+        resolved = []
+        for dep in deps:
+            if dep not in selected_ids:
+                continue
+            if declared[dep] and (for_batch or dep not in with_post):
+                targets = batch_ids(dep)
+            else:
+                targets = [dep]
+            for target in targets:
+                if target != for_batch and target not in resolved:
+                    resolved.append(target)
+        return tuple(resolved)
+
+    before_packages = [item.id for item in items if item.before_packages]
+    steps = []
+    for item in items:
+        for kind in declared[item.id]:
+            step_id = f"packages:{kind}"
+            if kind not in batches or any(step.id == step_id for step in steps):
+                continue
+            function, label, resource = PACKAGE_BATCHES[kind]
+            member_deps = [
+                dep for member in batch_members[kind] for dep in member.depends_on
+            ]
+            steps.append(
+                Step(
+                    id=step_id,
+                    text=f"Install {len(batches[kind])} {label}",
+                    command=" ".join([function] + [shlex.quote(p) for p in batches[kind]]),
+                    depends_on=resolve(before_packages + member_deps, for_batch=step_id),
+                    resources=frozenset([resource]),
+                    packages=tuple((kind, name) for name in batches[kind]),
+                )
+            )
+
+        if declared[item.id]:
+            if not item.post:
+                continue
+            command = item.post
+            depends_on = tuple(batch_ids(item.id)) + resolve(item.depends_on)
+        else:
+            command = item.func
+            depends_on = resolve(item.depends_on)
+        resources, exclusive = _item_resources(item)
+        steps.append(
+            Step(
+                id=item.id,
+                text=item.text,
+                command=command,
+                depends_on=depends_on,
+                conflicts=item.conflicts,
+                resources=resources,
+                exclusive=exclusive,
+            )
+        )
+    _check_for_cycles(steps)
+    return steps
+
+
+def _check_for_cycles(steps):
+    dependencies = {step.id: step.depends_on for step in steps}
+    state = {}  # id -> "visiting" or "done"
+
+    def visit(step_id, path):
+        if state.get(step_id) == "done":
+            return
+        if state.get(step_id) == "visiting":
+            cycle = path[path.index(step_id):] + [step_id]
+            raise ValueError(f"Dependency cycle between items: {' -> '.join(cycle)}")
+        state[step_id] = "visiting"
+        for dep in dependencies[step_id]:
+            visit(dep, path + [step_id])
+        state[step_id] = "done"
+
+    for step_id in dependencies:
+        visit(step_id, [])
+
+
+# -------------------------------------------------------
+# Scheduler
+# -------------------------------------------------------
+class Scheduler:
+    """Runs install steps concurrently while honouring their metadata.
+
+    A step starts once all of its selected dependencies have finished (or were
+    ignored), none of its resources is held by a running step and no conflicting
+    step is running. Steps without resource metadata are exclusive: they wait
+    for the running steps to drain, run alone, and hold back every step listed
+    after them, which keeps the old one-at-a-time order for unannotated items.
+
+    run_step(step, attempt) does the work on a worker thread and returns a
+    StepResult. Failures go to on_failure(step, result) on the calling thread,
+    one at a time and only while no step owns the terminal; it answers "retry",
+    "ignore" or "abort". on_event(kind, step, result) reports "started" and
+    "finished" steps.
+    """
+
+    def __init__(self, steps, run_step, on_failure, jobs=DEFAULT_JOBS, on_event=None):
+        self.steps = list(steps)
+        self.run_step = run_step
+        self.on_failure = on_failure
+        self.jobs = max(1, jobs)
+        self.on_event = on_event or (lambda kind, step, result: None)
+        self._order = {step.id: index for index, step in enumerate(self.steps)}
+
+    def run(self):
+        """Runs every step; returns their last results in catalog order."""
+        pending = list(self.steps)
+        running = {}  # future -> step
+        finished = set()  # ids that dependents may run after
+        failed = []
+        attempts = {}
+        results = {}
+        aborted = False
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while running or (not aborted and (pending or failed)):
+                if failed and not any(s.interactive for s in running.values()):
+                    step = failed.pop(0)
+                    decision = self.on_failure(step, results[step.id])
+                    if decision == "retry":
+                        pending.append(step)
+                        pending.sort(key=lambda s: self._order[s.id])
+                    elif decision == "ignore":
+                        results[step.id].status = "ignored"
+                        finished.add(step.id)
+                    else:
+                        aborted = True
+                        failed.clear()
+                    continue
+
+                if not aborted:
+                    for step in self._ready_steps(pending, running, finished):
+                        pending.remove(step)
+                        attempts[step.id] = attempts.get(step.id, 0) + 1
+                        future = pool.submit(self.run_step, step, attempts[step.id])
+                        running[future] = step
+                        self.on_event("started", step, None)
+
+                if not running:
+                    if failed:
+                        continue
+                    # Nothing can start: only possible with a dependency on an
+                    # item that never finishes, which _check_for_cycles rules out.
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: self._order[running[f].id]):
+                    step = running.pop(future)
+                    result = future.result()
+                    results[step.id] = result
+                    if result.exit_code == 0:
+                        result.status = "ok"
+                        finished.add(step.id)
+                    else:
+                        result.status = "failed"
+                        failed.append(step)
+                    self.on_event("finished", step, result)
+
+        for step in pending:
+            results[step.id] = StepResult(step.id, None, 0.0, 0, status="skipped")
+        return [results[step.id] for step in self.steps if step.id in results]
+
+    def _ready_steps(self, pending, running, finished):
+        active = list(running.values())
+        if any(step.exclusive for step in active):
+            return []
+        held = set().union(*(step.resources for step in active))
+        ready = []
+        for step in pending:
+            if len(active) >= self.jobs:
+                break
+            blocked = (
+                any(dep not in finished for dep in step.depends_on)
+                or step.resources & held
+                or any(
+                    other.id in step.conflicts or step.id in other.conflicts
+                    for other in active
+                )
+            )
+            if step.exclusive:
+                if not active and not blocked:
+                    ready.append(step)
+                # Nothing listed after an exclusive step may start before it.
+                break
+            if blocked:
+                continue
+            ready.append(step)
+            active.append(step)
+            held |= step.resources
+        return ready
+
+
+# -------------------------------------------------------
+# Bash Steps
+# -------------------------------------------------------
+def module_paths(repo_dir):
+    modules_dir = os.path.join(repo_dir, "scripts", "install_modules")
+    return [
+        os.path.join(modules_dir, filename)
+        for filename in sorted(os.listdir(modules_dir))
+        if filename.endswith(".sh")
+    ]
+
+
+def module_prelude(repo_dir):
+    """Bash that sets repo_dir and sources every install module."""
+    return f"export repo_dir={shlex.quote(repo_dir)}\n" + "".join(
+        f"source {shlex.quote(path)}\n" for path in module_paths(repo_dir)
+    )
+
+
+def received_bytes():
+    """Total bytes received on all non-loopback interfaces, or None if unknown."""
+    try:
+        with open("/proc/net/dev") as f:
+            lines = f.readlines()[2:]
+    except OSError:
+        return None
+    total = 0
+    for line in lines:
+        name, _, counters = line.partition(":")
+        if name.strip() != "lo":
+            total += int(counters.split()[0])
+    return total
+
+
+def _run_measured(args, **kwargs):
+    """Runs a command; returns its exit code and the CPU time it and its children used."""
+    process = subprocess.Popen(args, **kwargs)
+    try:
+        _, status, usage = os.wait4(process.pid, 0)
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return process.returncode, usage.ru_utime + usage.ru_stime
+
+
+def make_bash_runner(repo_dir, log_dir, use_terminal=True):
+    """Returns a run_step callable that runs each step's command in its own bash.
+
+    Every bash sources the install modules first, exactly like the old single
+    install script did. Interactive steps use the terminal; the others read
+    from /dev/null and write their output to <log_dir>/<step>.log. Without
+    use_terminal, every step runs the second way.
+    """
+    prelude = module_prelude(repo_dir)
+    os.makedirs(log_dir, exist_ok=True)
+
+    def run_step(step, attempt):
+        script = prelude + step.command + "\n"
+        start = time.monotonic()
+        received_before = received_bytes()
+        if step.interactive and use_terminal:
+            exit_code, cpu_time = _run_measured(["bash", "-c", script])
+            log_path = None
+        else:
+            name = "".join(c if c.isalnum() or c in "-_" else "_" for c in step.id)
+            log_path = os.path.join(log_dir, f"{name}.log")
+            with open(log_path, "a") as log_file:
+                log_file.write(f"--- Attempt {attempt}: {step.command} ---\n")
+                log_file.flush()
+                exit_code, cpu_time = _run_measured(
+                    ["bash", "-c", script],
+                    stdin=subprocess.DEVNULL,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                )
+        received_after = received_bytes()
+        return StepResult(
+            step.id,
+            exit_code,
+            time.monotonic() - start,
+            attempt,
+            log_path,
+            cpu_time=cpu_time,
+            received_bytes=(
+                received_after - received_before
+                if None not in (received_before, received_after)
+                else None
+            ),
+        )
+
+    return run_step
@@ -0,0 +1,57 @@
+import os
+import sys
+import tomllib
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from installer_components.install_data import (
+    CATALOG_PATH,
+    CatalogError,
+    CatalogHeader,
+    InstallItem,
+    parse_catalog,
+)
+
+ITEM = {"id": "a", "type": "optional", "text": "A", "func": "install_a"}
+
+
+def _parse(text):
+    return parse_catalog(tomllib.loads(text), "test.toml")
+
+
+class ParseCatalogTest(unittest.TestCase):
+    def test_shipped_catalog_is_valid(self):
+        with open(CATALOG_PATH, "rb") as f:
+            entries = parse_catalog(tomllib.load(f))
+        self.assertIsInstance(entries[0], CatalogHeader)
+        self.assertTrue(any(isinstance(entry, InstallItem) for entry in entries))
+
+    def test_tab_that_is_not_a_table_is_rejected(self):
+        with self.assertRaises(CatalogError):
+            _parse('tab = ["x"]')
+
+    def test_tab_without_tables_is_rejected(self):
+        with self.assertRaises(CatalogError):
+            _parse('tab = "x"')
+
+    def test_item_that_is_not_a_table_is_rejected(self):
+        with self.assertRaises(CatalogError):
+            _parse('[[tab]]\nname = "T"\nitem = ["x"]')
+        with self.assertRaises(CatalogError):
+            _parse('[[tab]]\nname = "T"\nitem = "x"')
+
+    def test_item_defaults(self):
+        entries = parse_catalog({"tab": [{"name": "T", "item": [dict(ITEM)]}]})
+        item = entries[1]
+        self.assertEqual(item.depends_on, ())
+        self.assertIsNone(item.resource)
+        self.assertIsNone(item.post)
+
+    def test_unknown_key_is_rejected(self):
+        with self.assertRaises(CatalogError):
+            parse_catalog({"tab": [{"name": "T", "item": [dict(ITEM, colour="red")]}]})
+
+
+if __name__ == "__main__":
+    unittest.main()